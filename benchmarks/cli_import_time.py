@@ -0,0 +1,45 @@
+"""
+Times importing the cli entrypoint with python -X importtime and lists the slowest imports. Exits non-zero when the
+import takes longer than the budget, e.g. because a command group is imported eagerly again.
+
+    python benchmarks/cli_import_time.py --budget 1.0
+"""
+import argparse
+import subprocess
+import sys
+
+CLI_MODULE = "ibm_watsonx_orchestrate.cli.main"
+
+
+def import_times(module: str) -> dict[str, float]:
+    """Returns the cumulative import time in seconds of each module imported while importing module."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, imported = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[imported.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=1.0, help="maximum cumulative import time of the cli in seconds")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to list")
+    args = parser.parse_args()
+
+    times = import_times(CLI_MODULE)
+    total = times[CLI_MODULE]
+
+    print(f"Imported {CLI_MODULE} in {total:.3f}s, slowest imports:")
+    for module, seconds in sorted(times.items(), key=lambda item: item[1], reverse=True)[1:args.top + 1]:
+        print(f"  {seconds:.3f}s  {module}")
+
+    if total > args.budget:
+        sys.exit(f"Importing the cli took {total:.3f}s, over the budget of {args.budget:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
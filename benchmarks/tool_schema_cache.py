@@ -0,0 +1,86 @@
+"""
+Times importing a synthetic python tool file without the tool schema cache, with a cold cache and with a warm cache.
+
+    python benchmarks/tool_schema_cache.py --count 500
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from ibm_watsonx_orchestrate.cli.commands.tools import tools_controller
+from ibm_watsonx_orchestrate.cli.commands.tools.schema_cache import ToolSchemaCache
+
+MODULE_NAME = "schema_cache_benchmark_tools"
+
+TOOL_TEMPLATE = '''
+@tool
+def {name}(query: str, limit: Optional[int] = None, item: Optional[Item] = None) -> List[Item]:
+    """
+    Looks up items {index}.
+
+    Args:
+        query: the query to search for
+        limit: the maximum number of items to return
+        item: an item to compare against
+
+    Returns:
+        The matching items
+    """
+    return []
+'''
+
+
+def write_tools(folder: Path, count: int) -> str:
+    lines = [
+        "from typing import List, Optional",
+        "from pydantic import BaseModel",
+        "from ibm_watsonx_orchestrate.agent_builder.tools import tool",
+        "",
+        "class Item(BaseModel):",
+        "    name: str",
+        "    tags: List[str] = []",
+    ]
+    lines += [TOOL_TEMPLATE.format(name=f"{MODULE_NAME}_{i}", index=i) for i in range(count)]
+    file = folder / f"{MODULE_NAME}.py"
+    file.write_text("\n".join(lines))
+    return str(file)
+
+
+def import_tools(file: str, use_schema_cache: bool) -> list[str]:
+    sys.modules.pop(MODULE_NAME, None)
+    try:
+        return [tool.dumps_spec() for tool in tools_controller.import_python_tool(file, use_schema_cache=use_schema_cache)]
+    finally:
+        sys.modules.pop(MODULE_NAME, None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=500, help="number of tools in the synthetic file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        file = write_tools(Path(folder), args.count)
+        cache_folder = str(Path(folder) / "tool_schemas")
+        timings = {}
+        specs = {}
+        with mock.patch.object(tools_controller, "ToolSchemaCache", side_effect=lambda: ToolSchemaCache(cache_folder=cache_folder)):
+            for run, use_schema_cache in [("uncached", False), ("cold", True), ("warm", True)]:
+                start = time.perf_counter()
+                specs[run] = import_tools(file, use_schema_cache)
+                timings[run] = time.perf_counter() - start
+
+    if not specs["warm"] == specs["cold"] == specs["uncached"]:
+        sys.exit("Cached tool specs differ from the generated ones")
+
+    print(f"Imported {args.count} python tools:")
+    for run, seconds in timings.items():
+        print(f"  {run:<8} {seconds:.3f}s")
+    print(f"  speedup  {timings['uncached'] / timings['warm']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
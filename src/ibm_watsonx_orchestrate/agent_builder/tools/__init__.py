@@ -1,5 +1,5 @@
 from .base_tool import BaseTool
 from .python_tool import tool, PythonTool, get_all_python_tools
-from .openapi_tool import create_openapi_json_tool, create_openapi_json_tool_from_uri, create_openapi_json_tools_from_uri, OpenAPITool, HTTPException
+from .openapi_tool import create_openapi_json_tool, create_openapi_json_tool_from_uri, create_openapi_json_tools_from_uri, iter_openapi_json_tools, iter_openapi_json_tools_from_uri, OpenAPITool, HTTPException, ResolvedOpenAPISpec, OpenAPIOperationFilter
 from .langflow_tool import LangflowTool
 from .types import ToolPermission, JsonSchemaObject, ToolRequestBody, ToolResponseBody, OpenApiSecurityScheme, OpenApiToolBinding, PythonToolBinding, WxFlowsToolBinding, SkillToolBinding, ClientSideToolBinding, ToolBinding, ToolSpec, ToolListEntry
@@ -1,8 +1,12 @@
 import copy
+import fnmatch
 import json
 import os.path
 import logging
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from pydantic import BaseModel, Field
 from ibm_watsonx_orchestrate.utils.exceptions import BadRequest
 
 import yaml
@@ -21,6 +25,9 @@ import json
 
 logger = logging.getLogger(__name__)
 
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+DEFAULT_OPENAPI_TOOL_BUILD_CHUNK_SIZE = 16
+
 # disables the automatic conversion of date-time objects to datetime objects and leaves them as strings
 yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:timestamp'] = \
     yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:str']
@@ -73,8 +80,91 @@ class OpenAPITool(BaseTool):
         return self.__tool_spec__.description
 
 
+class OpenAPIOperationFilter(BaseModel):
+    """
+    Selects the operations of an openapi spec to create tools for. An operation is selected if it matches every
+    criterion that is set, and matches a criterion if it matches any of its values.
+    """
+    tags: Optional[List[str]] = Field(default=None, description="Tags of the operations to select")
+    paths: Optional[List[str]] = Field(default=None, description="Globs matched against the path of the operations to select, for example '/pets/*'")
+    operation_ids: Optional[List[str]] = Field(default=None, description="operationIds of the operations to select")
+
+    def matches(self, http_path: str, operation: dict) -> bool:
+        if self.tags and not set(self.tags).intersection(operation.get('tags') or []):
+            return False
+        if self.paths and not any(fnmatch.fnmatchcase(http_path, path) for path in self.paths):
+            return False
+        if self.operation_ids and operation.get('operationId') not in self.operation_ids:
+            return False
+        return True
+
+
+class ResolvedOpenAPISpec:
+    """
+    An openapi spec with its $refs resolved once and its operations indexed by path and method, so creating tools for
+    many operations of a spec does not resolve the whole document again for every tool.
+
+    The resolved document shares the objects $refs point to between operations, so it must not be mutated.
+    """
+
+    def __init__(self, openapi_spec: dict):
+        self.raw_spec = openapi_spec
+        # limitation does not support circular $refs
+        self.contents = jsonref.replace_refs(openapi_spec, jsonschema=True)
+        self.paths = self.contents.get('paths', {})
+        self.operations: Dict[Tuple[str, str], dict] = {
+            (path, method.lower()): operation
+            for path, methods in self.paths.items()
+            for method, operation in methods.items()
+            if method.lower() in HTTP_METHODS
+        }
+
+    @staticmethod
+    def from_spec(openapi_spec: 'dict | ResolvedOpenAPISpec') -> 'ResolvedOpenAPISpec':
+        if isinstance(openapi_spec, ResolvedOpenAPISpec):
+            return openapi_spec
+        return ResolvedOpenAPISpec(openapi_spec)
+
+    @cached_property
+    def servers(self) -> List[str]:
+        return list(map(lambda x: x if isinstance(x, str) else x['url'],
+                        self.contents.get('servers', self.contents.get('x-servers', []))))
+
+    @cached_property
+    def security_schemes(self) -> Dict[str, OpenApiSecurityScheme]:
+        raw_open_api_security_schemes = self.contents.get('components', {}).get('securitySchemes', {})
+        security_schemes_map = {}
+        for key, security_scheme in raw_open_api_security_schemes.items():
+            security_schemes_map[key] = OpenApiSecurityScheme(
+                type=security_scheme['type'],
+                scheme=security_scheme.get('scheme'),
+                flows=security_scheme.get('flows'),
+                name=security_scheme.get('name'),
+                open_id_connect_url=security_scheme.get('openId', {}).get('openIdConnectUrl'),
+                in_field=security_scheme.get('in', security_scheme.get('in_field'))
+            )
+        return security_schemes_map
+
+    def get_operation(self, http_path: str, http_method: str) -> dict:
+        route = self.paths.get(http_path)
+        if route is None:
+            raise BadRequest(f"Path {http_path} not found in paths. Available endpoints are: {list(self.paths.keys())}")
+
+        operation = self.operations.get((http_path, http_method.lower()))
+        if operation is None:
+            raise BadRequest(
+                f"Path {http_path} did not have an http_method {http_method}. Available methods are {list(route.keys())}")
+        return operation
+
+    def iter_operations(self, operation_filter: OpenAPIOperationFilter = None) -> Iterator[Tuple[str, str, dict]]:
+        """Yields (path, method, operation) for every operation selected by operation_filter, in document order."""
+        for (path, method), operation in self.operations.items():
+            if operation_filter is None or operation_filter.matches(path, operation):
+                yield path, method, operation
+
+
 def create_openapi_json_tool(
-        openapi_spec: dict,
+        openapi_spec: 'dict | ResolvedOpenAPISpec',
         http_path: str,
         http_method: HTTP_METHOD,
         http_success_response_code: int = 200,
@@ -90,7 +180,7 @@ def create_openapi_json_tool(
     """
     Creates a tool from an openapi spec
 
-    :param openapi_spec: The parsed dictionary representation of an openapi spec
+    :param openapi_spec: The parsed dictionary representation of an openapi spec, or a ResolvedOpenAPISpec when creating many tools from the same spec
     :param http_path: Which path to create a tool for
     :param http_method: Which method on that path to create the tool for
     :param http_success_response_code: Which http status code should be considered a successful call (defaults to 200)
@@ -104,18 +194,8 @@ def create_openapi_json_tool(
     :return: An OpenAPITool that can be used by an agent
     """
 
-    # limitation does not support circular $refs
-    openapi_contents = jsonref.replace_refs(openapi_spec, jsonschema=True)
-
-    paths = openapi_contents.get('paths', {})
-    route = paths.get(http_path)
-    if route is None:
-        raise BadRequest(f"Path {http_path} not found in paths. Available endpoints are: {list(paths.keys())}")
-
-    route_spec = route.get(http_method.lower(), route.get(http_method.upper()))
-    if route_spec is None:
-        raise BadRequest(
-            f"Path {http_path} did not have an http_method {http_method}. Available methods are {list(route.keys())}")
+    resolved_spec = ResolvedOpenAPISpec.from_spec(openapi_spec)
+    route_spec = resolved_spec.get_operation(http_path, http_method)
 
     operation_id = re.sub( r'(\W|_)+', '_', route_spec.get('operationId') ) \
                      if route_spec.get('operationId', None) else None
@@ -152,9 +232,8 @@ def create_openapi_json_tool(
         name = f"{parameter['in']}_{parameter['name']}"
         if parameter.get('required'):
             spec.input_schema.required.append(name)
-        parameter['schema']['title'] = parameter['name']
-        parameter['schema']['description'] = parameter.get('description', None)
-        spec.input_schema.properties[name] = JsonSchemaObject.model_validate(parameter['schema'])
+        parameter_schema = {**parameter['schema'], 'title': parameter['name'], 'description': parameter.get('description', None)}
+        spec.input_schema.properties[name] = JsonSchemaObject.model_validate(parameter_schema)
         spec.input_schema.properties[name].in_field = parameter['in']
         spec.input_schema.properties[name].aliasName = parameter['name']
 
@@ -177,30 +256,18 @@ def create_openapi_json_tool(
     response_description = response.get('description')
     response_schema = response.get('content', {}).get(http_response_content_type, {}).get('schema', {})
 
-    response_schema['required'] = []
+    response_schema = {**response_schema, 'required': []}
     spec.output_schema = ToolResponseBody.model_validate(response_schema)
     spec.output_schema.description = response_description
 
-    servers = list(map(lambda x: x if isinstance(x, str) else x['url'],
-                       openapi_contents.get('servers', openapi_contents.get('x-servers', []))))
-
-    raw_open_api_security_schemes = openapi_contents.get('components', {}).get('securitySchemes', {})
-    security_schemes_map = {}
-    for key, security_scheme in raw_open_api_security_schemes.items():
-        security_schemes_map[key] = OpenApiSecurityScheme(
-            type=security_scheme['type'],
-            scheme=security_scheme.get('scheme'),
-            flows=security_scheme.get('flows'),
-            name=security_scheme.get('name'),
-            open_id_connect_url=security_scheme.get('openId', {}).get('openIdConnectUrl'),
-            in_field=security_scheme.get('in', security_scheme.get('in_field'))
-        )
+    servers = resolved_spec.servers
+    security_schemes_map = resolved_spec.security_schemes
 
     # - Note it's possible for security to be configured per route or globally
     # - Note we have no concept of scope because to a user their auth cred either has access or it doesn't
     #   unless we ask them for a scope they don't know to validate it provides no value
     security = []
-    for needed_security in route_spec.get('security', []) + openapi_spec.get('security', []):
+    for needed_security in route_spec.get('security', []) + resolved_spec.raw_spec.get('security', []):
         name = next(iter(needed_security.keys()), None)
         if name is None or name not in security_schemes_map:
             raise BadRequest(f"Invalid openapi spec, {HTTP_METHOD} {http_path} asks for a security scheme of {name}, "
@@ -230,9 +297,8 @@ def create_openapi_json_tool(
             name = f"{parameter['in']}_{parameter['name']}"
             if parameter.get('required'):
                 callback_input_schema.required.append(name)
-            parameter['schema']['title'] = parameter['name']
-            parameter['schema']['description'] = parameter.get('description', None)
-            callback_input_schema.properties[name] = JsonSchemaObject.model_validate(parameter['schema'])
+            parameter_schema = {**parameter['schema'], 'title': parameter['name'], 'description': parameter.get('description', None)}
+            callback_input_schema.properties[name] = JsonSchemaObject.model_validate(parameter_schema)
             callback_input_schema.properties[name].in_field = parameter['in']
             callback_input_schema.properties[name].aliasName = parameter['name']
         
@@ -255,7 +321,7 @@ def create_openapi_json_tool(
         callback_response_description = callback_response.get('description')
         callback_response_schema = callback_response.get('content', {}).get(http_response_content_type, {}).get('schema', {})
         
-        callback_response_schema['required'] = []
+        callback_response_schema = {**callback_response_schema, 'required': []}
         callback_output_schema = ToolResponseBody.model_validate(callback_response_schema)
         callback_output_schema.description = callback_response_description
 
@@ -394,35 +460,112 @@ async def create_openapi_json_tool_from_uri(
 
 async def create_openapi_json_tools_from_uri(
         openapi_uri: str,
-        connection_id: str = None
+        connection_id: str = None,
+        operation_filter: OpenAPIOperationFilter = None
 ) -> List[OpenAPITool]:
     openapi_contents = await _get_openapi_spec_from_uri(openapi_uri)
-    tools: List[OpenAPITool] = await create_openapi_json_tools_from_content(openapi_contents, connection_id)
+    tools: List[OpenAPITool] = await create_openapi_json_tools_from_content(openapi_contents, connection_id, operation_filter=operation_filter)
 
     return tools
 
+async def iter_openapi_json_tools_from_uri(
+        openapi_uri: str,
+        connection_id: str = None,
+        operation_filter: OpenAPIOperationFilter = None,
+        max_workers: int = 1
+) -> Iterator[OpenAPITool]:
+    """
+    Fetches an openapi spec and returns an iterator that builds its tools lazily, see iter_openapi_json_tools.
+    """
+    openapi_contents = await _get_openapi_spec_from_uri(openapi_uri)
+    return iter_openapi_json_tools(openapi_contents, connection_id, operation_filter=operation_filter, max_workers=max_workers)
+
 async def create_openapi_json_tools_from_content(
-        openapi_contents: dict,
-        connection_id: str = None
+        openapi_contents: 'dict | ResolvedOpenAPISpec',
+        connection_id: str = None,
+        operation_filter: OpenAPIOperationFilter = None
 ) -> List[OpenAPITool]:
-   
-    tools: List[OpenAPITool] = []
-
-    for path, methods in openapi_contents.get('paths', {}).items():
-        for method, spec in methods.items():
-            if method.lower() == 'head':
-                continue
-            success_codes = list(filter(lambda code: 200 <= int(code) < 300, spec['responses'].keys()))
-            if len(success_codes) > 1:
-                logger.warning(
-                    f"There were multiple candidate success codes for {method} {path}, using {success_codes[0]} to generate output schema")
-
-            tools.append(create_openapi_json_tool(
-                openapi_contents,
+    """
+    Creates a tool for every operation of an openapi spec, or only for the operations selected by operation_filter.
+    The spec's $refs are resolved once and shared by all of the tools.
+    """
+    return list(iter_openapi_json_tools(openapi_contents, connection_id, operation_filter=operation_filter))
+
+
+def _iter_tool_operations(resolved_spec: ResolvedOpenAPISpec, operation_filter: OpenAPIOperationFilter = None) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Yields (path, METHOD, success code) for every operation a tool should be created for."""
+    for path, method, spec in resolved_spec.iter_operations(operation_filter):
+        if method == 'head':
+            continue
+        success_codes = list(filter(lambda code: 200 <= int(code) < 300, spec['responses'].keys()))
+        if len(success_codes) > 1:
+            logger.warning(
+                f"There were multiple candidate success codes for {method} {path}, using {success_codes[0]} to generate output schema")
+        yield path, method.upper(), success_codes[0] if len(success_codes) > 0 else None
+
+
+# The spec resolved once by each worker of the process pool used by iter_openapi_json_tools
+_worker_resolved_spec: Optional[ResolvedOpenAPISpec] = None
+
+
+def _init_openapi_tool_worker(openapi_spec: dict) -> None:
+    global _worker_resolved_spec
+    _worker_resolved_spec = ResolvedOpenAPISpec(openapi_spec)
+
+
+def _create_openapi_json_tool_in_worker(args: Tuple[str, str, Optional[str], Optional[str]]) -> OpenAPITool:
+    path, method, success_code, connection_id = args
+    return create_openapi_json_tool(
+        _worker_resolved_spec,
+        http_path=path,
+        http_method=method,
+        http_success_response_code=success_code,
+        connection_id=connection_id
+    )
+
+
+def iter_openapi_json_tools(
+        openapi_contents: 'dict | ResolvedOpenAPISpec',
+        connection_id: str = None,
+        operation_filter: OpenAPIOperationFilter = None,
+        max_workers: int = 1,
+        chunk_size: int = DEFAULT_OPENAPI_TOOL_BUILD_CHUNK_SIZE
+) -> Iterator[OpenAPITool]:
+    """
+    Yields a tool for every operation of an openapi spec, or only for the operations selected by operation_filter, in
+    document order as soon as each one is built, so callers can start publishing tools before the whole spec is
+    processed.
+
+    With max_workers > 1 the tools are built across a process pool. Every worker resolves the spec once and builds
+    operations in batches of chunk_size, which only pays off for specs with hundreds of operations.
+    """
+    resolved_spec = ResolvedOpenAPISpec.from_spec(openapi_contents)
+    operations = _iter_tool_operations(resolved_spec, operation_filter)
+    found = False
+
+    if max_workers <= 1:
+        for path, method, success_code in operations:
+            found = True
+            yield create_openapi_json_tool(
+                resolved_spec,
                 http_path=path,
-                http_method=method.upper(),
-                http_success_response_code=success_codes[0] if len(success_codes) > 0 else None,
+                http_method=method,
+                http_success_response_code=success_code,
                 connection_id=connection_id
-            ))
-
-    return tools
+            )
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_openapi_tool_worker,
+            initargs=(resolved_spec.raw_spec,)
+        )
+        try:
+            worker_args = ((path, method, success_code, connection_id) for path, method, success_code in operations)
+            for tool in executor.map(_create_openapi_json_tool_in_worker, worker_args, chunksize=chunk_size):
+                found = True
+                yield tool
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    if operation_filter is not None and not found:
+        logger.warning("No operations in the openapi spec matched the provided filter")
@@ -1,6 +1,7 @@
 import typer
 from typing_extensions import Annotated, List, Optional
 from ibm_watsonx_orchestrate.cli.commands.agents.agents_controller import AgentsController
+from ibm_watsonx_orchestrate.cli.commands.agents.export_session import DEFAULT_EXPORT_MAX_WORKERS
 from ibm_watsonx_orchestrate.agent_builder.agents.types import DEFAULT_LLM, AgentKind, AgentStyle, ExternalAgentAuthScheme, AgentProvider
 import json
 
@@ -19,10 +20,18 @@ def agent_import(
             help='The app id of the connection to associate with this external agent. An application connection represents the server authentication credentials needed to connection to this agent (for example Api Keys, Basic, Bearer or OAuth credentials).'
         )
     ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Number of agents to import in parallel. When greater than 1, existing agents and their dependencies are looked up in bulk and a per-agent summary is printed",
+            min=1,
+        ),
+    ] = 1,
 ):
     agents_controller = AgentsController()
     agent_specs = agents_controller.import_agent(file=file, app_id=app_id)
-    agents_controller.publish_or_update_agents(agent_specs)
+    agents_controller.publish_or_update_agents(agent_specs, concurrency=concurrency)
 
 
 @agents_app.command(name="create", help='Create and import an agent into the active env')
@@ -257,10 +266,18 @@ def export_agent(
             "--agent-only",
             help="Export only the yaml to the specified agent, excluding its dependencies",
         ),
-    ]=False
+    ]=False,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Number of tool artifacts and knowledge bases to download in parallel",
+            min=1,
+        ),
+    ] = DEFAULT_EXPORT_MAX_WORKERS,
 ):  
     agents_controller = AgentsController()
-    agents_controller.export_agent(name=name, kind=kind, output_path=output_file, agent_only_flag=agent_only_flag)
+    agents_controller.export_agent(name=name, kind=kind, output_path=output_file, agent_only_flag=agent_only_flag, concurrency=concurrency)
 
 @agents_app.command(name="deploy", help="Deploy Agent")
 def deploy_agent(
@@ -8,8 +8,10 @@ import zipfile
 import sys
 import io
 import logging
+import time
 from pathlib import Path
 from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 
 from typing import Iterable, List, TypeVar
 from pydantic import BaseModel
@@ -18,7 +20,20 @@ from ibm_watsonx_orchestrate.agent_builder.tools.types import ToolSpec
 from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import import_python_tool, ToolsController
 from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller import import_python_knowledge_base, KnowledgeBaseController
 from ibm_watsonx_orchestrate.cli.commands.models.models_controller import import_python_model
-from ibm_watsonx_orchestrate.cli.common import ListFormats, rich_table_to_markdown
+from ibm_watsonx_orchestrate.cli.commands.agents.export_session import ExportSession, DEFAULT_EXPORT_MAX_WORKERS
+from ibm_watsonx_orchestrate.cli.common import (
+    ListFormats,
+    rich_table_to_markdown,
+    get_all_unique_resources,
+    construct_lookup_table,
+    lookup_resource_value,
+    batch_request_resource,
+    ImportResult,
+    ImportStatus,
+    describe_import_error,
+    import_failed,
+    print_import_summary,
+)
 
 from ibm_watsonx_orchestrate.agent_builder.agents import (
     Agent,
@@ -37,7 +52,6 @@ from ibm_watsonx_orchestrate.client.connections import get_connections_client
 from ibm_watsonx_orchestrate.client.knowledge_bases.knowledge_base_client import KnowledgeBaseClient
 
 from ibm_watsonx_orchestrate.client.utils import instantiate_client, is_local_dev
-from ibm_watsonx_orchestrate.utils.utils import check_file_in_zip
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -47,6 +61,9 @@ logger = logging.getLogger(__name__)
 # Helper generic type for any agent
 AnyAgentT = TypeVar("AnyAgentT", bound=Agent | ExternalAgent | AssistantAgent)
 
+DEFAULT_BULK_LOOKUP_CHUNK_SIZE = 50
+DEFAULT_IMPORT_MAX_WORKERS = 8
+
 
 def import_python_agent(file: str) -> List[Agent | ExternalAgent | AssistantAgent]:
     # Import tools
@@ -300,23 +317,30 @@ class AgentsController:
     def get_all_agents(self, client: None):
         return {entry["name"]: entry["id"] for entry in client.get()}
 
-    def dereference_collaborators(self, agent: Agent) -> Agent:
-        native_client = self.get_native_client()
-        external_client = self.get_external_client()
-        assistant_client = self.get_assistant_client()
+    @staticmethod
+    def _construct_name_id_lookup(resources: List[dict], resource_display_name: str) -> dict[str, str]:
+        name_id_lookup = {}
+        for resource in resources:
+            if resource.get("name") in name_id_lookup:
+                logger.error(f"Duplicate draft entries for {resource_display_name} '{resource.get('name')}'")
+                sys.exit(1)
+            name_id_lookup[resource.get("name")] = resource.get("id")
+        return name_id_lookup
 
+    def dereference_collaborators(self, agent: Agent, name_id_lookup: dict[str, str] | None = None) -> Agent:
         deref_agent = deepcopy(agent)
-        matching_native_agents = native_client.get_drafts_by_names(deref_agent.collaborators)
-        matching_external_agents = external_client.get_drafts_by_names(deref_agent.collaborators)
-        matching_assistant_agents = assistant_client.get_drafts_by_names(deref_agent.collaborators)
-        matching_agents = matching_native_agents + matching_external_agents + matching_assistant_agents
 
-        name_id_lookup = {}
-        for a in matching_agents:
-            if a.get("name") in name_id_lookup:
-                logger.error(f"Duplicate draft entries for collaborator '{a.get('name')}'")
-                sys.exit(1)
-            name_id_lookup[a.get("name")] = a.get("id")
+        if name_id_lookup is None:
+            native_client = self.get_native_client()
+            external_client = self.get_external_client()
+            assistant_client = self.get_assistant_client()
+
+            matching_native_agents = native_client.get_drafts_by_names(deref_agent.collaborators)
+            matching_external_agents = external_client.get_drafts_by_names(deref_agent.collaborators)
+            matching_assistant_agents = assistant_client.get_drafts_by_names(deref_agent.collaborators)
+            matching_agents = matching_native_agents + matching_external_agents + matching_assistant_agents
+
+            name_id_lookup = self._construct_name_id_lookup(matching_agents, "collaborator")
         
         deref_collaborators = []
         for name in agent.collaborators:
@@ -358,23 +382,19 @@ class AgentsController:
 
         return ref_agent
 
-    def dereference_tools(self, agent: Agent) -> Agent:
-        tool_client = self.get_tool_client()
-
+    def dereference_tools(self, agent: Agent, name_id_lookup: dict[str, str] | None = None) -> Agent:
         deref_agent = deepcopy(agent)
 
-        # If agent has style set to "planner" and have join_tool defined, then we need to include that tool as well
-        if agent.style == AgentStyle.PLANNER and agent.custom_join_tool:
-            matching_tools = tool_client.get_drafts_by_names(deref_agent.tools + [deref_agent.custom_join_tool])
-        else:
-            matching_tools = tool_client.get_drafts_by_names(deref_agent.tools)
+        if name_id_lookup is None:
+            tool_client = self.get_tool_client()
 
-        name_id_lookup = {}
-        for tool in matching_tools:
-            if tool.get("name") in name_id_lookup:
-                logger.error(f"Duplicate draft entries for tool '{tool.get('name')}'")
-                sys.exit(1)
-            name_id_lookup[tool.get("name")] = tool.get("id")
+            # If agent has style set to "planner" and have join_tool defined, then we need to include that tool as well
+            if agent.style == AgentStyle.PLANNER and agent.custom_join_tool:
+                matching_tools = tool_client.get_drafts_by_names(deref_agent.tools + [deref_agent.custom_join_tool])
+            else:
+                matching_tools = tool_client.get_drafts_by_names(deref_agent.tools)
+
+            name_id_lookup = self._construct_name_id_lookup(matching_tools, "tool")
         
         deref_tools = []
         for name in agent.tools:
@@ -430,18 +450,13 @@ class AgentsController:
 
         return ref_agent
     
-    def dereference_knowledge_bases(self, agent: Agent) -> Agent:
-        client = self.get_knowledge_base_client()
-
+    def dereference_knowledge_bases(self, agent: Agent, name_id_lookup: dict[str, str] | None = None) -> Agent:
         deref_agent = deepcopy(agent)
-        matching_knowledge_bases = client.get_by_names(deref_agent.knowledge_base)
 
-        name_id_lookup = {}
-        for kb in matching_knowledge_bases:
-            if kb.get("name") in name_id_lookup:
-                logger.error(f"Duplicate draft entries for knowledge base '{kb.get('name')}'")
-                sys.exit(1)
-            name_id_lookup[kb.get("name")] = kb.get("id")
+        if name_id_lookup is None:
+            client = self.get_knowledge_base_client()
+            matching_knowledge_bases = client.get_by_names(deref_agent.knowledge_base)
+            name_id_lookup = self._construct_name_id_lookup(matching_knowledge_bases, "knowledge base")
         
         deref_knowledge_bases = []
         for name in agent.knowledge_base:
@@ -470,9 +485,7 @@ class AgentsController:
         ref_agent.knowledge_base = ref_knowledge_bases
         return ref_agent
     
-    def dereference_guidelines(self, agent: Agent) -> Agent:
-        tool_client = self.get_tool_client()
-        
+    def dereference_guidelines(self, agent: Agent, name_id_lookup: dict[str, str] | None = None) -> Agent:
         guideline_tool_names = set()
 
         for guideline in agent.guidelines:
@@ -484,14 +497,10 @@ class AgentsController:
 
         deref_agent = deepcopy(agent)
 
-        matching_tools = tool_client.get_drafts_by_names(list(guideline_tool_names))
-
-        name_id_lookup = {}
-        for tool in matching_tools:
-            if tool.get("name") in name_id_lookup:
-                logger.error(f"Duplicate draft entries for tool '{tool.get('name')}'")
-                sys.exit(1)
-            name_id_lookup[tool.get("name")] = tool.get("id")
+        if name_id_lookup is None:
+            tool_client = self.get_tool_client()
+            matching_tools = tool_client.get_drafts_by_names(list(guideline_tool_names))
+            name_id_lookup = self._construct_name_id_lookup(matching_tools, "tool")
         
         for guideline in deref_agent.guidelines:
             if guideline.tool:
@@ -600,15 +609,16 @@ class AgentsController:
 
         return agent
 
-    def dereference_native_agent_dependencies(self, agent: Agent) -> Agent:
+    def dereference_native_agent_dependencies(self, agent: Agent, lookups: dict[str, dict[str, str]] | None = None) -> Agent:
+        lookups = lookups or {}
         if agent.collaborators and len(agent.collaborators):
-            agent = self.dereference_collaborators(agent)
+            agent = self.dereference_collaborators(agent, name_id_lookup=lookups.get("collaborators"))
         if (agent.tools and len(agent.tools)) or (agent.style == AgentStyle.PLANNER and agent.custom_join_tool):
-            agent = self.dereference_tools(agent)
+            agent = self.dereference_tools(agent, name_id_lookup=lookups.get("tools"))
         if agent.knowledge_base and len(agent.knowledge_base):
-            agent = self.dereference_knowledge_bases(agent)
+            agent = self.dereference_knowledge_bases(agent, name_id_lookup=lookups.get("knowledge_bases"))
         if agent.guidelines and len(agent.guidelines):
-            agent = self.dereference_guidelines(agent)
+            agent = self.dereference_guidelines(agent, name_id_lookup=lookups.get("tools"))
 
         return agent
     
@@ -641,11 +651,12 @@ class AgentsController:
         return agent
     
     # Convert all names used in an agent to the corresponding ids
-    def dereference_agent_dependencies(self, agent: AnyAgentT) -> AnyAgentT:
+    # lookups optionally holds prefetched name -> id tables keyed by "collaborators", "tools" and "knowledge_bases"
+    def dereference_agent_dependencies(self, agent: AnyAgentT, lookups: dict[str, dict[str, str]] | None = None) -> AnyAgentT:
 
         agent = self.dereference_common_agent_dependencies(agent)
         if isinstance(agent, Agent):
-            return self.dereference_native_agent_dependencies(agent)
+            return self.dereference_native_agent_dependencies(agent, lookups=lookups)
         if isinstance(agent, ExternalAgent) or isinstance(agent, AssistantAgent):
             return self.dereference_external_or_assistant_agent_dependencies(agent)
 
@@ -659,8 +670,14 @@ class AgentsController:
             return self.reference_external_or_assistant_agent_dependencies(agent)
 
     def publish_or_update_agents(
-        self, agents: Iterable[Agent | ExternalAgent | AssistantAgent]
+        self, agents: Iterable[Agent | ExternalAgent | AssistantAgent], concurrency: int = 1
     ):
+        if concurrency > 1:
+            results = self.bulk_publish_or_update_agents(agents, max_workers=concurrency)
+            if import_failed(results):
+                sys.exit(1)
+            return results
+
         for agent in agents:
             agent_name = agent.name
 
@@ -708,6 +725,186 @@ class AgentsController:
             else:
                 self.publish_agent(agent)
 
+    def bulk_publish_or_update_agents(
+        self, agents: Iterable[Agent | ExternalAgent | AssistantAgent], max_workers: int = DEFAULT_IMPORT_MAX_WORKERS, print_summary: bool = True
+    ) -> List[ImportResult]:
+        """
+        Imports agents concurrently. Existing agents, collaborators, tools and knowledge bases referenced by the whole
+        batch are fetched with chunked bulk lookups and turned into lookup tables once, then agents are upserted in a
+        bounded worker pool. Agents that collaborate with other agents from the same batch are imported in a later
+        wave once their collaborators exist. Upsert failures are captured per agent and reported in a summary, unless
+        print_summary is False because the caller reports the results itself.
+        """
+        agents = list(agents)
+        if not agents:
+            return []
+
+        batch_names = {agent.name for agent in agents}
+        collaborator_names = get_all_unique_resources(agents, "collaborators")
+
+        existing_agents = self._get_existing_agents(list(batch_names | set(collaborator_names)))
+        for name in batch_names:
+            if len(existing_agents.get(name, [])) > 1:
+                logger.error(f"Multiple agents with the name '{name}' found. Failed to update agent")
+                sys.exit(1)
+        for agent in agents:
+            existing = existing_agents.get(agent.name)
+            if existing and existing[0].kind != agent.kind:
+                logger.error(f"An agent with the name '{agent.name}' already exists with a different kind. Failed to create agent")
+                sys.exit(1)
+
+        tool_specs = self._get_agent_tool_specs(agents)
+        lookups = {
+            "collaborators": self._construct_name_id_lookup(
+                [{"name": a.name, "id": a.id} for matches in existing_agents.values() for a in matches],
+                "collaborator"
+            ),
+            "tools": self._construct_name_id_lookup(list(tool_specs.values()), "tool"),
+            "knowledge_bases": self._get_agent_knowledge_base_lookup(agents),
+        }
+
+        # Make sure clients are created before they are shared between worker threads
+        self.get_native_client()
+        self.get_external_client()
+        self.get_assistant_client()
+
+        results = []
+        pending = agents
+        while pending:
+            # Agents collaborating with an agent of the batch that failed to import can never be imported
+            failed_names = {result.name for result in results if result.status == ImportStatus.FAILED}
+            blocked = {}
+            for agent in pending:
+                failed_collaborator = next(
+                    (c for c in (getattr(agent, "collaborators", None) or []) if c in failed_names and c not in lookups["collaborators"]),
+                    None
+                )
+                if failed_collaborator is not None:
+                    blocked[id(agent)] = failed_collaborator
+            if blocked:
+                for agent in pending:
+                    if id(agent) in blocked:
+                        error = f"collaborator '{blocked[id(agent)]}' failed to import"
+                        logger.error(f"Failed to import agent '{agent.name}': {error}")
+                        results.append(ImportResult(name=agent.name, kind=str(agent.kind), status=ImportStatus.FAILED, duration=0, error=error))
+                pending = [agent for agent in pending if id(agent) not in blocked]
+                continue
+
+            ready = [
+                agent for agent in pending
+                if not any(c not in lookups["collaborators"] and c in batch_names for c in (getattr(agent, "collaborators", None) or []))
+            ]
+            if not ready:
+                for agent in pending:
+                    results.append(ImportResult(name=agent.name, kind=str(agent.kind), status=ImportStatus.FAILED, duration=0, error="collaborators form a cycle"))
+                logger.error(f"Failed to resolve collaborators for agents {', '.join(sorted(agent.name for agent in pending))}. Agents within an import cannot collaborate in a cycle")
+                break
+
+            deref_agents = []
+            for agent in ready:
+                deref_agent = self.dereference_agent_dependencies(agent, lookups=lookups)
+                if isinstance(deref_agent, Agent) and deref_agent.style == AgentStyle.PLANNER and isinstance(agent.custom_join_tool, str):
+                    join_tool_spec = ToolSpec.model_validate(tool_specs[agent.custom_join_tool])
+                    if not join_tool_spec.is_custom_join_tool():
+                        logger.error(
+                            f"Tool '{join_tool_spec.name}' configured as the custom join tool is not a valid join tool. A custom join tool must be a Python tool with specific input and output schema."
+                        )
+                        sys.exit(1)
+                deref_agents.append(deref_agent)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._publish_or_update_agent,
+                        agent=deref_agent,
+                        agent_id=existing_agents[agent.name][0].id if existing_agents.get(agent.name) else None
+                    )
+                    for agent, deref_agent in zip(ready, deref_agents)
+                ]
+                wave_results = [future.result() for future in futures]
+            results += wave_results
+
+            ready_ids = {id(agent) for agent in ready}
+            pending = [agent for agent in pending if id(agent) not in ready_ids]
+            if pending:
+                created = [result.name for result in wave_results if result.status == ImportStatus.CREATED]
+                for name, matches in self._get_existing_agents(created).items():
+                    lookups["collaborators"].setdefault(name, matches[0].id)
+
+        if print_summary:
+            print_import_summary(results, title="Agent import summary", resource_name="agents")
+        return results
+
+    def _get_existing_agents(
+        self, agent_names: List[str], chunk_size: int = DEFAULT_BULK_LOOKUP_CHUNK_SIZE
+    ) -> dict[str, List[Agent | ExternalAgent | AssistantAgent]]:
+        existing_agents = {}
+        if not agent_names:
+            return existing_agents
+
+        for client, agent_type in [
+            (self.get_native_client(), Agent),
+            (self.get_external_client(), ExternalAgent),
+            (self.get_assistant_client(), AssistantAgent),
+        ]:
+            for existing_agent in batch_request_resource(client.get_drafts_by_names, agent_names, batch_size=chunk_size):
+                existing_agent = agent_type.model_validate(existing_agent)
+                existing_agents.setdefault(existing_agent.name, []).append(existing_agent)
+        return existing_agents
+
+    def _get_agent_tool_specs(self, agents: List[Agent | ExternalAgent | AssistantAgent], chunk_size: int = DEFAULT_BULK_LOOKUP_CHUNK_SIZE) -> dict[str, dict]:
+        tool_names = set()
+        for agent in agents:
+            if not isinstance(agent, Agent):
+                continue
+            tool_names.update(agent.tools or [])
+            if agent.style == AgentStyle.PLANNER and agent.custom_join_tool:
+                tool_names.add(agent.custom_join_tool)
+            for guideline in agent.guidelines or []:
+                if guideline.tool:
+                    tool_names.add(guideline.tool)
+
+        if not tool_names:
+            return {}
+
+        tool_specs = {}
+        for tool in batch_request_resource(self.get_tool_client().get_drafts_by_names, list(tool_names), batch_size=chunk_size):
+            if tool.get("name") in tool_specs:
+                logger.error(f"Duplicate draft entries for tool '{tool.get('name')}'")
+                sys.exit(1)
+            tool_specs[tool.get("name")] = tool
+        return tool_specs
+
+    def _get_agent_knowledge_base_lookup(self, agents: List[Agent | ExternalAgent | AssistantAgent], chunk_size: int = DEFAULT_BULK_LOOKUP_CHUNK_SIZE) -> dict[str, str]:
+        knowledge_base_names = get_all_unique_resources([agent for agent in agents if isinstance(agent, Agent)], "knowledge_base")
+        if not knowledge_base_names:
+            return {}
+
+        knowledge_bases = batch_request_resource(self.get_knowledge_base_client().get_by_names, knowledge_base_names, batch_size=chunk_size)
+        return self._construct_name_id_lookup(knowledge_bases, "knowledge base")
+
+    def _publish_or_update_agent(self, agent: Agent | ExternalAgent | AssistantAgent, agent_id: str | None) -> ImportResult:
+        start = time.perf_counter()
+        status = ImportStatus.UPDATED if agent_id else ImportStatus.CREATED
+        error = None
+        try:
+            if agent_id:
+                self.update_agent(agent_id=agent_id, agent=agent)
+            else:
+                self.publish_agent(agent)
+        except (Exception, SystemExit) as e:
+            status = ImportStatus.FAILED
+            error = describe_import_error(e)
+            logger.error(f"Failed to import agent '{agent.name}': {error}")
+
+        return ImportResult(
+            name=agent.name,
+            kind=str(agent.kind),
+            status=status,
+            duration=time.perf_counter() - start,
+            error=error
+        )
+
     def publish_agent(self, agent: Agent, **kwargs) -> None:
         if isinstance(agent, Agent):
             response = self.get_native_client().create(agent.model_dump(exclude_none=True))
@@ -846,48 +1043,11 @@ class AgentsController:
         return (agents, parse_errors)
 
     def _get_all_unique_agent_resources(self, agents: List[Agent], target_attr: str) -> List[str]:
-        """
-            Given a list of agents get all the unique values of a certain field
-            Example: agent1.tools = [1 ,2 ,3] and agent2.tools = [2, 4, 5] then return [1, 2, 3, 4, 5]
-            Example: agent1.id = "123" and agent2.id = "456" then return ["123", "456"]
-
-            Args:
-                agents: List of agents
-                target_attr: The name of the field to access and get unique elements
-
-            Returns:
-                A list of unique elements from across all agents
-        """
-        all_ids = set()
-        for agent in agents:
-            attr_value = getattr(agent, target_attr, None)
-            if attr_value:
-                if isinstance(attr_value, list):
-                    all_ids.update(attr_value)
-                else:
-                    all_ids.add(attr_value)
-        return list(all_ids)
+        return get_all_unique_resources(agents, target_attr)
 
     def _construct_lut_agent_resource(self, resource_list: List[dict], key_attr: str, value_attr) -> dict:
-        """
-            Given a list of dictionaries build a key -> value look up table
-            Example [{id: 1, name: obj1}, {id: 2, name: obj2}] return {1: obj1, 2: obj2}
-
-            Args:
-                resource_list: A list of dictionries from which to build the lookup table from
-                key_attr: The name of the field whose value will form the key of the lookup table
-                value_attrL The name of the field whose value will form the value of the lookup table
+        return construct_lookup_table(resource_list, key_attr, value_attr)
 
-            Returns:
-                A lookup table
-        """
-        lut = {}
-        for resource in resource_list:
-            if isinstance(resource, BaseModel):
-                resource = resource.model_dump()
-            lut[resource.get(key_attr, None)] = resource.get(value_attr, None)
-        return lut
-    
     def _lookup_agent_resource_value(
             self,
             agent: Agent, 
@@ -895,43 +1055,10 @@ class AgentsController:
             target_attr: str,
             target_attr_display_name: str
         ) -> List[str] | str | None:
-        """
-        Using a lookup table convert all the strings in a given field of an agent into their equivalent in the lookup table
-        Example: lookup_table={1: obj1, 2: obj2} agent=Agent(tools=[1,2]) return. [obj1, obj2]
-
-        Args:
-            agent: An agent
-            lookup_table: A dictionary that maps one value to another
-            target_attr: The field to convert on the provided agent
-            target_attr_display_name: The name of the field to be displayed in the event of an error
-        """
-        attr_value = getattr(agent, target_attr, None)
-        if not attr_value:
-            return
-        
-        if isinstance(attr_value, list):
-            new_resource_list=[]
-            for value in attr_value:
-                if value in lookup_table:
-                    new_resource_list.append(lookup_table[value])
-                else:
-                    logger.warning(f"{target_attr_display_name} with ID '{value}' not found. Returning {target_attr_display_name} ID")
-                    new_resource_list.append(value)
-            return new_resource_list
-        else:
-            if attr_value in lookup_table:
-                return lookup_table[attr_value]
-            else:
-                logger.warning(f"{target_attr_display_name} with ID '{attr_value}' not found. Returning {target_attr_display_name} ID")
-                return attr_value
+        return lookup_resource_value(agent, lookup_table, target_attr, target_attr_display_name)
 
     def _batch_request_resource(self, client_fn, ids, batch_size=50) -> List[dict]:
-        resources = []
-        for i in range(0, len(ids), batch_size):
-                chunk = ids[i:i + batch_size]
-                resources += (client_fn(chunk))
-        return resources
-
+        return batch_request_resource(client_fn, ids, batch_size=batch_size)
 
     def _bulk_resolve_agent_tools(self, agents: List[Agent]) -> List[Agent]:
         new_agents = agents.copy()
@@ -1280,7 +1407,7 @@ class AgentsController:
             return AssistantAgent.model_validate(assistant_result)
         
 
-    def export_agent(self, name: str, kind: AgentKind, output_path: str, agent_only_flag: bool=False, zip_file_out: zipfile.ZipFile | None = None, with_tool_spec_file: bool = False) -> None:
+    def export_agent(self, name: str, kind: AgentKind, output_path: str, agent_only_flag: bool=False, zip_file_out: zipfile.ZipFile | None = None, with_tool_spec_file: bool = False, export_session: ExportSession | None = None, concurrency: int = DEFAULT_EXPORT_MAX_WORKERS) -> None:
         output_file = Path(output_path)
         output_file_extension = output_file.suffix
         output_file_name = output_file.stem
@@ -1305,9 +1432,13 @@ class AgentsController:
             return
         
         close_file_flag = False
-        if zip_file_out is None:
-            close_file_flag = True
-            zip_file_out = zipfile.ZipFile(output_path, "w")
+        close_session_flag = export_session is None
+        if export_session is None:
+            if zip_file_out is None:
+                close_file_flag = True
+                zip_file_out = zipfile.ZipFile(output_path, "w")
+            export_session = ExportSession(zip_file_out, tools_controller=ToolsController(), knowledge_base_controller=KnowledgeBaseController(), max_workers=concurrency)
+        zip_file_out = export_session.zip_file
 
         logger.info(f"Exporting agent definition for '{name}'")
         
@@ -1317,55 +1448,61 @@ class AgentsController:
 
         # Skip processing an agent if its already been saved
         agent_file_path = f"{output_file_name}/agents/{agent_spec_file_content.get('kind', 'unknown')}/{agent_spec_file_content.get('name')}.yaml"
-        if check_file_in_zip(file_path=agent_file_path, zip_file=zip_file_out):
+        if export_session.contains(agent_file_path):
             logger.warning(f"Skipping {agent_spec_file_content.get('name')}, agent with that name already exists in the output folder")
+            if close_session_flag:
+                export_session.close()
             if close_file_flag:
                 zip_file_out.close()
             return
         
-        zip_file_out.writestr(
+        export_session.writestr(
             agent_file_path,
             agent_spec_yaml_file.getvalue()
         )
 
         agent_tools = agent_spec_file_content.get("tools", [])
 
-        tools_controller = ToolsController()
-        tools_client = tools_controller.get_client() 
+        tools_controller = export_session.tools_controller
+        tools_client = export_session.tools_client
         tool_specs = None
         if with_tool_spec_file:
             tool_specs = {t.get('name'):t for t in tools_client.get_drafts_by_names(agent_tools) if t.get('name')}
 
-        for tool_name in agent_tools:
-
-            base_tool_file_path = f"{output_file_name}/tools/{tool_name}/"
-            if check_file_in_zip(file_path=base_tool_file_path, zip_file=zip_file_out):
-                continue
-            
+        def download_tool(tool_name: str) -> bytes | None:
             logger.info(f"Exporting tool '{tool_name}'")
-            tool_artifact_bytes = tools_controller.download_tool(tool_name)
+            return tools_controller.download_tool(tool_name)
+
+        # artifacts are downloaded in parallel and written one at a time as they arrive
+        tools_to_export = [tool_name for tool_name in agent_tools if not export_session.contains(f"{output_file_name}/tools/{tool_name}/")]
+        for tool_name, tool_artifact_bytes in export_session.fetch(download_tool, tools_to_export):
             if not tool_artifact_bytes:
                 continue
-            
+
+            base_tool_file_path = f"{output_file_name}/tools/{tool_name}/"
             with zipfile.ZipFile(io.BytesIO(tool_artifact_bytes), "r") as zip_file_in:
                 for item in zip_file_in.infolist():
-                    buffer = zip_file_in.read(item.filename)
                     if (item.filename != 'bundle-format'):
-                        zip_file_out.writestr(
+                        export_session.writestr(
                             f"{base_tool_file_path}{item.filename}",
-                            buffer
+                            zip_file_in.read(item.filename)
                         )
                 if with_tool_spec_file and tool_specs:
                     current_spec = tool_specs[tool_name]
-                    zip_file_out.writestr(
+                    export_session.writestr(
                         f"{base_tool_file_path}config.json",
                         ToolSpec.model_validate(current_spec).model_dump_json(exclude_unset=True,indent=2)
                     )
         
-        knowledge_base_controller = KnowledgeBaseController()
-        for kb_name in agent_spec_file_content.get("knowledge_base", []):
-            knowledge_base_file_path = f"{output_file_name}/knowledge-bases/{kb_name}.yaml"
-            knowledge_base_controller.knowledge_base_export(name=kb_name, output_path=knowledge_base_file_path, zip_file_out=zip_file_out)
+        knowledge_base_controller = export_session.knowledge_base_controller
+        knowledge_bases_to_export = [kb_name for kb_name in agent_spec_file_content.get("knowledge_base", []) if not export_session.contains(f"{output_file_name}/knowledge-bases/{kb_name}.yaml")]
+        for kb_name, knowledge_base_spec in export_session.fetch(lambda kb_name: knowledge_base_controller.get_knowledge_base_export_spec(name=kb_name), knowledge_bases_to_export):
+            if knowledge_base_spec is None:
+                continue
+            export_session.writestr(
+                f"{output_file_name}/knowledge-bases/{kb_name}.yaml",
+                yaml.dump(knowledge_base_spec, sort_keys=False, default_flow_style=False, allow_unicode=True).encode("utf-8")
+            )
         
         if kind == AgentKind.NATIVE:
             for collaborator_id in agent.collaborators:
@@ -1380,8 +1517,10 @@ class AgentsController:
                     kind=collaborator.kind,
                     output_path=output_path,
                     agent_only_flag=False,
-                    zip_file_out=zip_file_out)
+                    export_session=export_session)
         
+        if close_session_flag:
+            export_session.close()
         if close_file_flag:
             logger.info(f"Successfully wrote agents and tools to '{output_path}'")
             zip_file_out.close()
@@ -0,0 +1,91 @@
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController
+from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller import KnowledgeBaseController
+from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
+
+DEFAULT_EXPORT_MAX_WORKERS = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ExportSession:
+    """
+    State shared by everything written to one export archive. Written entries and every folder containing them are
+    indexed so checking whether an agent, tool or knowledge base was already exported is O(1), and the controllers
+    (and so their clients) are created once and reused by every recursive export.
+
+    Downloads run on a worker pool owned by the session, but the archive is only ever written from the calling thread.
+    """
+
+    def __init__(self, zip_file: zipfile.ZipFile, tools_controller: ToolsController, knowledge_base_controller: KnowledgeBaseController, max_workers: int = DEFAULT_EXPORT_MAX_WORKERS):
+        self.zip_file = zip_file
+        self.tools_controller = tools_controller
+        self.knowledge_base_controller = knowledge_base_controller
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._entries: set[str] = set()
+        self._folders: set[str] = set()
+
+        for name in zip_file.namelist():
+            self._add_entry(name)
+
+    def _add_entry(self, path: str) -> None:
+        self._entries.add(path)
+        folder_end = path.find("/")
+        while folder_end != -1:
+            self._folders.add(path[:folder_end + 1])
+            folder_end = path.find("/", folder_end + 1)
+
+    def contains(self, path: str) -> bool:
+        """Returns True if path was written, or if path is a folder with entries written under it."""
+        return path in self._entries or f"{path.rstrip('/')}/" in self._folders
+
+    def writestr(self, path: str, data: str | bytes) -> None:
+        self.zip_file.writestr(path, data)
+        self._add_entry(path)
+
+    @property
+    def tools_client(self) -> ToolClient:
+        return self.tools_controller.get_client()
+
+    def fetch(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[Tuple[T, R]]:
+        """
+        Calls fn for each item on the worker pool and yields (item, result) on the calling thread as the calls complete.
+        At most max_workers calls are in flight, so at most that many results are held in memory before being written.
+        """
+        pending_items = iter(items)
+        if self.max_workers <= 1:
+            for item in pending_items:
+                yield item, fn(item)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        in_flight: dict[Future, T] = {}
+        try:
+            while True:
+                for item in pending_items:
+                    in_flight[self._executor.submit(fn, item)] = item
+                    if len(in_flight) >= self.max_workers:
+                        break
+
+                if not in_flight:
+                    return
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    yield item, future.result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
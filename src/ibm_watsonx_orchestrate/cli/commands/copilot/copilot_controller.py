@@ -560,8 +560,17 @@ def refine_agent_with_trajectories(agent_name: str, chat_llm: str | None, output
                     f"No chats found for agent '{agent_name}'. To use autotune, please initiate at least one conversation with the agent. You can start a chat using `orchestrate chat start`.",
                    )
             last_10_threads = all_threads[:10] #TODO use batching when server allows
-            last_10_chats = [_format_thread_messages(chat) for chat in
-                             threads_client.get_threads_messages([thread['id'] for thread in last_10_threads])]
+            last_10_threads_messages = threads_client.get_threads_messages(
+                [thread['id'] for thread in last_10_threads], return_exceptions=True
+            )
+            failed = [(thread, e) for thread, e in zip(last_10_threads, last_10_threads_messages) if isinstance(e, Exception)]
+            if failed and len(failed) == len(last_10_threads):
+                raise failed[0][1]
+            for thread, e in failed:
+                logger.warning(f"Failed to retrieve chat '{thread['id']}': {e}")
+            fetched = [(thread, chat) for thread, chat in zip(last_10_threads, last_10_threads_messages) if not isinstance(chat, Exception)]
+            last_10_threads = [thread for thread, _ in fetched]
+            last_10_chats = [_format_thread_messages(chat) for _, chat in fetched]
 
             progress.remove_task(task)
             progress.refresh()
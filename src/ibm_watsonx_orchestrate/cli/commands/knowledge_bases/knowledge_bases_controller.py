@@ -348,17 +348,8 @@ class KnowledgeBaseController:
             exit(1)
 
 
-    def knowledge_base_export(self,
-            output_path: str,
-            id: Optional[str] = None,
-            name: Optional[str] = None, 
-            zip_file_out: Optional[ZipFile] = None) -> None:
-        output_file = Path(output_path)
-        output_file_extension = output_file.suffix
-        if output_file_extension not in  {".yaml", ".yml"} :
-            logger.error(f"Output file must end with the extension '.yaml'/'.yml'. Provided file '{output_path}' ends with '{output_file_extension}'")
-            sys.exit(1)
-        
+    def get_knowledge_base_export_spec(self, id: Optional[str] = None, name: Optional[str] = None) -> dict | None:
+        """Returns the exportable spec of a knowledge base, or None if it is not found. Does not write anything, so it is safe to call from worker threads."""
         knowledge_base_id = self.get_id(id, name)
         logEnding = f"with ID '{id}'" if id else f"'{name}'"  
         
@@ -368,7 +359,7 @@ class KnowledgeBaseController:
 
         if not knowledge_base:
             logger.error(f"Knowledge base'{knowledge_base_id}' not found.'")
-            return
+            return None
         
         knowledge_base.tenant_id = None
         knowledge_base.id = None
@@ -386,7 +377,24 @@ class KnowledgeBaseController:
             else:
                 logger.warning(f"Connection '{connection_id}' not found, unable to resolve app_id for Knowledge base {logEnding}")
 
-        knowledge_base_spec = knowledge_base.model_dump(mode="json", exclude_none=True, exclude_unset=True)
+        return knowledge_base.model_dump(mode="json", exclude_none=True, exclude_unset=True)
+
+    def knowledge_base_export(self,
+            output_path: str,
+            id: Optional[str] = None,
+            name: Optional[str] = None, 
+            zip_file_out: Optional[ZipFile] = None) -> None:
+        output_file = Path(output_path)
+        output_file_extension = output_file.suffix
+        if output_file_extension not in  {".yaml", ".yml"} :
+            logger.error(f"Output file must end with the extension '.yaml'/'.yml'. Provided file '{output_path}' ends with '{output_file_extension}'")
+            sys.exit(1)
+
+        logEnding = f"with ID '{id}'" if id else f"'{name}'"
+        knowledge_base_spec = self.get_knowledge_base_export_spec(id=id, name=name)
+        if knowledge_base_spec is None:
+            return
+
         if zip_file_out:
             knowledge_base_spec_yaml = yaml.dump(knowledge_base_spec, sort_keys=False, default_flow_style=False, allow_unicode=True)
             knowledge_base_spec_yaml_bytes = knowledge_base_spec_yaml.encode("utf-8")
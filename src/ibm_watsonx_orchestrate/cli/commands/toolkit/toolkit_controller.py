@@ -18,7 +18,14 @@ import typer
 import json
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from ibm_watsonx_orchestrate.cli.common import ListFormats, rich_table_to_markdown
+from ibm_watsonx_orchestrate.cli.common import (
+    ListFormats,
+    rich_table_to_markdown,
+    get_all_unique_resources,
+    construct_lookup_table,
+    lookup_resource_value,
+    batch_request_resource,
+)
 from rich.json import JSON
 import rich
 import rich.table
@@ -272,86 +279,17 @@ class ToolkitController:
             target_attr: str,
             target_attr_display_name: str
         ) -> List[str] | str | None:
-        """
-        Using a lookup table convert all the strings in a given field of an agent into their equivalent in the lookup table
-        Example: lookup_table={1: obj1, 2: obj2} agent=Toolkit(tools=[1,2]) return. [obj1, obj2]
-
-        Args:
-            toolkit: A toolkit
-            lookup_table: A dictionary that maps one value to another
-            target_attr: The field to convert on the provided agent
-            target_attr_display_name: The name of the field to be displayed in the event of an error
-        """
-        attr_value = getattr(toolkit, target_attr, None)
-        if not attr_value:
-            return
-        
-        if isinstance(attr_value, list):
-            new_resource_list=[]
-            for value in attr_value:
-                if value in lookup_table:
-                    new_resource_list.append(lookup_table[value])
-                else:
-                    logger.warning(f"{target_attr_display_name} with ID '{value}' not found. Returning {target_attr_display_name} ID")
-                    new_resource_list.append(value)
-            return new_resource_list
-        else:
-            if attr_value in lookup_table:
-                return lookup_table[attr_value]
-            else:
-                logger.warning(f"{target_attr_display_name} with ID '{attr_value}' not found. Returning {target_attr_display_name} ID")
-                return attr_value
+        return lookup_resource_value(toolkit, lookup_table, target_attr, target_attr_display_name)
 
     def _construct_lut_toolkit_resource(self, resource_list: List[dict], key_attr: str, value_attr) -> dict:
-        """
-            Given a list of dictionaries build a key -> value look up table
-            Example [{id: 1, name: obj1}, {id: 2, name: obj2}] return {1: obj1, 2: obj2}
-
-            Args:
-                resource_list: A list of dictionries from which to build the lookup table from
-                key_attr: The name of the field whose value will form the key of the lookup table
-                value_attrL The name of the field whose value will form the value of the lookup table
-
-            Returns:
-                A lookup table
-        """
-        lut = {}
-        for resource in resource_list:
-            if isinstance(resource, BaseModel):
-                resource = resource.model_dump()
-            lut[resource.get(key_attr, None)] = resource.get(value_attr, None)
-        return lut
-    
+        return construct_lookup_table(resource_list, key_attr, value_attr)
+
     def _batch_request_resource(self, client_fn, ids, batch_size=50) -> List[dict]:
-        resources = []
-        for i in range(0, len(ids), batch_size):
-                chunk = ids[i:i + batch_size]
-                resources += (client_fn(chunk))
-        return resources
+        return batch_request_resource(client_fn, ids, batch_size=batch_size)
 
     def _get_all_unique_toolkit_resources(self, toolkits: List[BaseToolkit], target_attr: str) -> List[str]:
-        """
-            Given a list of toolkits get all the unique values of a certain field
-            Example: tk1.tools = [1 ,2 ,3] and tk2.tools = [2, 4, 5] then return [1, 2, 3, 4, 5]
-            Example: tk1.id = "123" and tk2.id = "456" then return ["123", "456"]
-
-            Args:
-                toolkits: List of toolkits
-                target_attr: The name of the field to access and get unique elements
-
-            Returns:
-                A list of unique elements from across all toolkits
-        """
-        all_ids = set()
-        for toolkit in toolkits:
-            attr_value = getattr(toolkit, target_attr, None)
-            if attr_value:
-                if isinstance(attr_value, list):
-                    all_ids.update(attr_value)
-                else:
-                    all_ids.add(attr_value)
-        return list(all_ids)
-    
+        return get_all_unique_resources(toolkits, target_attr)
+
     def _bulk_resolve_toolkit_tools(self, toolkits: List[BaseToolkit]) -> List[BaseToolkit]:
         new_toolkit_specs = [tk.__toolkit_spec__ for tk in toolkits].copy()
         all_tools_ids = self._get_all_unique_toolkit_resources(new_toolkit_specs, "tools")
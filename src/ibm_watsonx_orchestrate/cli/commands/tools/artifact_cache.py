@@ -0,0 +1,86 @@
+import hashlib
+from threading import Lock
+from typing import List, Tuple
+
+from ibm_watsonx_orchestrate.cli.config import Config, AUTH_CONFIG_FILE_FOLDER
+
+TOOL_ARTIFACT_CACHE_FILE = "tool_artifacts.yaml"
+TOOL_ARTIFACT_CACHE_HEADER = "tool_artifacts"
+
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+def compute_artifact_digest(files: List[Tuple[str, str]], requirements: List[str], tool_spec: str) -> str:
+    """
+    Computes a content digest over everything that ends up in a python tool artifact.
+
+    Args:
+        files: (path, arcname) pairs of the files packaged in the artifact
+        requirements: the resolved requirements.txt lines
+        tool_spec: the serialized tool spec
+
+    Returns:
+        A sha256 hex digest
+    """
+    digest = hashlib.sha256()
+    for file_path, arcname in sorted(files, key=lambda x: x[1]):
+        digest.update(arcname.encode("utf-8"))
+        digest.update(b"\0")
+        with open(file_path, "rb") as fp:
+            while chunk := fp.read(_READ_CHUNK_SIZE):
+                digest.update(chunk)
+        digest.update(b"\0")
+
+    digest.update("".join(requirements).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(tool_spec.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ToolArtifactCache:
+    """
+    Persists the digest of the last artifact uploaded from this machine for each tool id so unchanged python tools can
+    skip rebuilding and re-uploading their artifact. The server is not consulted, so an artifact uploaded for the same
+    tool from elsewhere is not detected, which is why the cache is opt-in.
+
+    Digests are loaded once and recorded ones are only written when the cache is flushed, once per import.
+    """
+
+    def __init__(self, cache_folder: str = AUTH_CONFIG_FILE_FOLDER, cache_file: str = TOOL_ARTIFACT_CACHE_FILE):
+        self.cache_folder = cache_folder
+        self.cache_file = cache_file
+        self._digests: dict[str, str] | None = None
+        self._pending: dict[str, str] = {}
+        self._lock = Lock()
+
+    def _config(self) -> Config:
+        return Config(config_file_folder=self.cache_folder, config_file=self.cache_file)
+
+    def _load(self) -> dict[str, str]:
+        if self._digests is None:
+            self._digests = self._config().get().get(TOOL_ARTIFACT_CACHE_HEADER) or {}
+        return self._digests
+
+    def get(self, tool_id: str) -> str | None:
+        if not tool_id:
+            return None
+        with self._lock:
+            return self._load().get(str(tool_id))
+
+    def set(self, tool_id: str, digest: str) -> None:
+        if not tool_id or not digest:
+            return
+        with self._lock:
+            self._load()[str(tool_id)] = digest
+            self._pending[str(tool_id)] = digest
+
+    def flush(self) -> None:
+        """Writes the digests recorded since the last flush."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._config().save({TOOL_ARTIFACT_CACHE_HEADER: self._pending})
+            self._pending = {}
+
+    def matches(self, tool_id: str, digest: str) -> bool:
+        return digest is not None and self.get(tool_id) == digest
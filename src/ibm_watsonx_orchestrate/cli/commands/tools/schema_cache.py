@@ -0,0 +1,161 @@
+import hashlib
+import inspect
+import json
+import logging
+import marshal
+import os
+import sys
+import tempfile
+import typing
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from ibm_watsonx_orchestrate import __version__
+from ibm_watsonx_orchestrate.agent_builder.tools import PythonTool, ToolSpec
+from ibm_watsonx_orchestrate.cli.config import AUTH_CONFIG_FILE_FOLDER
+
+logger = logging.getLogger(__name__)
+
+TOOL_SCHEMA_CACHE_FOLDER = os.path.join(AUTH_CONFIG_FILE_FOLDER, "tool_schemas")
+
+# Digests of the source files hashed by this process, by path
+_file_digests: dict[str, str] = {}
+
+
+def _file_digest(file_path: str) -> str:
+    digest = _file_digests.get(file_path)
+    if digest is None:
+        digest = hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+        _file_digests[file_path] = digest
+    return digest
+
+
+def _collect_annotation_modules(annotation: typing.Any, modules: set[str], seen: set[int]) -> None:
+    """Collects the modules defining the types used by annotation, including the fields of pydantic models."""
+    if id(annotation) in seen:
+        return
+    seen.add(id(annotation))
+
+    for arg in typing.get_args(annotation):
+        _collect_annotation_modules(arg, modules, seen)
+
+    module = getattr(annotation, "__module__", None)
+    if module and module not in ("builtins", "typing"):
+        modules.add(module)
+
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        for field in annotation.model_fields.values():
+            _collect_annotation_modules(field.annotation, modules, seen)
+
+
+def _get_source_file(module_name: str) -> str | None:
+    module = sys.modules.get(module_name)
+    try:
+        return inspect.getsourcefile(module) if module is not None else None
+    except TypeError:
+        return None
+
+
+def compute_tool_schema_key(tool: PythonTool) -> str | None:
+    """
+    Computes a key for the spec generated for a python tool. The key covers the sdk version, the tool's function (its
+    compiled code, which includes its docstring, and its signature), the arguments of its @tool decorator, the location
+    it is imported from and the source files of every type used in its signature, so the spec is only reused while none
+    of them change.
+
+    Returns None if the tool's source can't be inspected, in which case its spec is not cached.
+    """
+    fn = tool.fn
+    try:
+        source_file = inspect.getsourcefile(fn)
+        # hashing the compiled code is much cheaper than inspect.getsource, which tokenizes the file for every function
+        code_digest = hashlib.sha256(marshal.dumps(fn.__code__)).hexdigest()
+        type_hints = typing.get_type_hints(fn)
+    except Exception:
+        return None
+
+    modules = set()
+    seen = set()
+    for annotation in type_hints.values():
+        _collect_annotation_modules(annotation, modules, seen)
+
+    annotation_files = {}
+    for module_name in sorted(modules):
+        module_file = _get_source_file(module_name)
+        if module_file and os.path.isfile(module_file):
+            annotation_files[module_name] = _file_digest(module_file)
+
+    key = {
+        "version": __version__,
+        "cwd": os.getcwd(),
+        "source_file": source_file,
+        "function": f"{fn.__module__}:{fn.__qualname__}",
+        "code": code_digest,
+        "doc": fn.__doc__,
+        "type_hints": {name: repr(annotation) for name, annotation in type_hints.items()},
+        "defaults": repr(fn.__defaults__),
+        "kwdefaults": repr(fn.__kwdefaults__),
+        "annotation_files": annotation_files,
+        "name": tool.name,
+        "description": tool.description,
+        "display_name": tool.display_name,
+        "permission": str(tool.permission),
+        "kind": str(tool.kind),
+        "input_schema": tool.input_schema.model_dump(mode="json") if tool.input_schema else None,
+        "output_schema": tool.output_schema.model_dump(mode="json") if tool.output_schema else None,
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class ToolSchemaCache:
+    """
+    Persists the spec generated for each python tool, so importing tools whose code did not change skips parsing their
+    docstrings and generating their json schemas. Every spec is stored in its own file, named after its key.
+    """
+
+    def __init__(self, cache_folder: str = TOOL_SCHEMA_CACHE_FOLDER):
+        self.cache_folder = cache_folder
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_folder, f"{key}.json")
+
+    def get(self, key: str) -> ToolSpec | None:
+        try:
+            with open(self._path(key), "r") as fp:
+                return ToolSpec.model_validate_json(fp.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.debug(f"Ignoring unreadable tool schema cache entry '{key}': {e}")
+            return None
+
+    def set(self, key: str, spec: ToolSpec) -> None:
+        try:
+            os.makedirs(self.cache_folder, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_folder, prefix=f".{key}.", suffix=".tmp")
+            with os.fdopen(fd, "w") as fp:
+                fp.write(spec.model_dump_json(exclude_unset=True, by_alias=True))
+            os.replace(temp_path, self._path(key))
+        except OSError as e:
+            logger.debug(f"Failed to write tool schema cache entry '{key}': {e}")
+
+    def load_spec(self, tool: PythonTool) -> bool:
+        """
+        Sets the spec of tool from the cache if it was generated before, or generates and caches it otherwise.
+        Returns True if the spec was found in the cache.
+        """
+        if tool._spec is not None:
+            return False
+
+        key = compute_tool_schema_key(tool)
+        if key is None:
+            return False
+
+        spec = self.get(key)
+        if spec is not None:
+            tool._spec = spec
+            return True
+
+        self.set(key, tool.__tool_spec__)
+        return False
@@ -49,8 +49,59 @@ included in this folder will be included within the uploaded package. Local depe
 relative to this package root folder or imported using relative imports from the --file. This only applies when the 
 --kind=python. If not specified it is assumed only a single python file is being uploaded."""),
     ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Number of tools to build and upload in parallel. When greater than 1, existing tools are looked up in bulk and a per-tool summary is printed",
+            min=1,
+        ),
+    ] = 1,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Always regenerate python tool schemas, even if they are unchanged since the last import",
+        ),
+    ] = False,
+    skip_unchanged_artifacts: Annotated[
+        bool,
+        typer.Option(
+            "--skip-unchanged-artifacts",
+            help="Skip rebuilding and uploading python tool artifacts that are unchanged since they were last uploaded from this machine. Only use this if the tools are not also imported from elsewhere, since the artifacts on the server are not checked",
+        ),
+    ] = False,
+    tags: Annotated[
+        List[str],
+        typer.Option(
+            "--tag",
+            help="Only import the operations of the OpenAPI spec with this tag. Can be repeated. Only applies when --kind=openapi",
+        ),
+    ] = None,
+    paths: Annotated[
+        List[str],
+        typer.Option(
+            "--path",
+            help="Only import the operations of the OpenAPI spec whose path matches this glob, for example '/pets/*'. Can be repeated. Only applies when --kind=openapi",
+        ),
+    ] = None,
+    operation_ids: Annotated[
+        List[str],
+        typer.Option(
+            "--operation-id",
+            help="Only import the operation of the OpenAPI spec with this operationId. Can be repeated. Only applies when --kind=openapi",
+        ),
+    ] = None,
+    build_processes: Annotated[
+        int,
+        typer.Option(
+            "--build-processes",
+            help="Number of processes used to build the tools of the OpenAPI spec. Only worthwhile for specs with hundreds of operations. Only applies when --kind=openapi",
+            min=1,
+        ),
+    ] = 1,
 ):
-    tools_controller = ToolsController(kind, file, requirements_file)
+    tools_controller = ToolsController(kind, file, requirements_file, use_artifact_cache=skip_unchanged_artifacts)
     tools = tools_controller.import_tool(
         kind=kind,
         file=file,
@@ -59,9 +110,14 @@ relative to this package root folder or imported using relative imports from the
         # skill_operation_path=skill_operation_path,
         app_id=app_id,
         requirements_file=requirements_file,
-        package_root=package_root
+        package_root=package_root,
+        tags=tags,
+        paths=paths,
+        operation_ids=operation_ids,
+        build_processes=build_processes,
+        use_schema_cache=not no_cache
     )
-    tools_controller.publish_or_update_tools(tools=tools, package_root=package_root)
+    tools_controller.publish_or_update_tools(tools=tools, package_root=package_root, concurrency=concurrency)
  
 @tools_app.command(name="list", help='List the imported tools in the active environment')
 def list_tools(
@@ -5,8 +5,13 @@ import sys
 import io
 import re
 import tempfile
+import time
 import requests
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from threading import Lock
 from enum import Enum
 from os import path
 from pathlib import Path
@@ -20,18 +25,31 @@ import typer
 
 from rich.panel import Panel
 
-from ibm_watsonx_orchestrate.agent_builder.tools import BaseTool, ToolSpec, ToolListEntry
+from ibm_watsonx_orchestrate.agent_builder.tools import BaseTool, PythonTool, ToolSpec, ToolListEntry
 from ibm_watsonx_orchestrate.agent_builder.tools.flow_tool import create_flow_json_tool
 from ibm_watsonx_orchestrate.agent_builder.tools.langflow_tool import LangflowTool, create_langflow_tool
-from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_openapi_json_tools_from_uri,create_openapi_json_tools_from_content
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import iter_openapi_json_tools_from_uri,create_openapi_json_tools_from_content, OpenAPIOperationFilter
 from ibm_watsonx_orchestrate.cli.commands.models.models_controller import ModelHighlighter
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
+from ibm_watsonx_orchestrate.cli.commands.tools.artifact_cache import ToolArtifactCache, compute_artifact_digest
+from ibm_watsonx_orchestrate.cli.commands.tools.schema_cache import ToolSchemaCache
 from ibm_watsonx_orchestrate.cli.commands.connections.connections_controller import configure_connection, remove_connection, add_connection
-from ibm_watsonx_orchestrate.cli.common import ListFormats, rich_table_to_markdown
+from ibm_watsonx_orchestrate.cli.common import (
+    ListFormats,
+    rich_table_to_markdown,
+    get_all_unique_resources,
+    construct_lookup_table,
+    batch_request_resource,
+    ImportResult,
+    ImportStatus,
+    describe_import_error,
+    import_failed,
+    print_import_summary,
+)
 from ibm_watsonx_orchestrate.agent_builder.connections.types import  ConnectionType, ConnectionEnvironment, ConnectionPreference
 from ibm_watsonx_orchestrate.cli.config import Config, CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, \
     PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT, \
-    DEFAULT_CONFIG_FILE_CONTENT, PYTHON_REGISTRY_SKIP_VERSION_CHECK_OPT
+    DEFAULT_CONFIG_FILE_CONTENT, PYTHON_REGISTRY_SKIP_VERSION_CHECK_OPT, AUTH_CONFIG_FILE_FOLDER
 from ibm_watsonx_orchestrate.agent_builder.connections import ConnectionSecurityScheme, ExpectedCredentials
 from ibm_watsonx_orchestrate.flow_builder.flows.decorators import FlowWrapper
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
@@ -60,6 +78,17 @@ DEFAULT_LANGFLOW_RUNNER_MODULES = [
     "lfx-nightly"
 ]
 
+DEFAULT_BULK_LOOKUP_CHUNK_SIZE = 50
+DEFAULT_PUBLISH_MAX_WORKERS = 8
+
+REGISTRY_CACHE_FOLDER = AUTH_CONFIG_FILE_FOLDER
+REGISTRY_CACHE_FILE = "registry_cache.yaml"
+REGISTRY_CACHE_HEADER = "wheels"
+REGISTRY_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+_REGISTRY_CACHE: dict[str, str] = {}
+_REGISTRY_CACHE_LOCK = Lock()
+
 class ToolKind(str, Enum):
     openapi = "openapi"
     python = "python"
@@ -176,6 +205,10 @@ def validate_params(kind: ToolKind, **args) -> None:
             raise typer.BadParameter(
                 f"Missing flags {missing_params} required for kind skill"
             )
+    if kind != "openapi" and any(args.get(option) for option in ("tags", "paths", "operation_ids")):
+        raise typer.BadParameter(
+            "--tag, --path and --operation-id are only supported when kind is set to openapi"
+        )
     validate_app_ids(kind=kind, **args)
 
 def get_connection_id(app_id: str) -> str:
@@ -352,7 +385,7 @@ def get_requirement_lines (requirements_file, remove_trailing_newlines=True):
 
 
 
-def import_python_tool(file: str, requirements_file: str = None, app_id: List[str] = None, package_root: str = None) -> List[BaseTool]:
+def import_python_tool(file: str, requirements_file: str = None, app_id: List[str] = None, package_root: str = None, use_schema_cache: bool = True) -> List[BaseTool]:
     try:
         file_path = Path(file).absolute()
         file_path_str = str(file_path)
@@ -417,10 +450,14 @@ def import_python_tool(file: str, requirements_file: str = None, app_id: List[st
             raise typer.BadParameter(f"Failed to read file {resolved_requirements_file} {e}")
 
     tools = []
+    schema_cache = ToolSchemaCache() if use_schema_cache else None
     for _, obj in inspect.getmembers(module):
         if not isinstance(obj, BaseTool):
             continue
 
+        if schema_cache is not None and isinstance(obj, PythonTool):
+            schema_cache.load_spec(obj)
+
         obj.__tool_spec__.binding.python.requirements = requirements
 
         if __supported_characters_pattern.match(obj.__tool_spec__.name) is None:
@@ -558,8 +595,9 @@ The [bold]flow tool[/bold] is being imported from [green]`{file}`[/green].
 
     return tools
 
-async def import_openapi_tool(file: str, connection_id: str) -> List[BaseTool]:
-    tools = await create_openapi_json_tools_from_uri(file, connection_id)
+async def import_openapi_tool(file: str, connection_id: str, operation_filter: OpenAPIOperationFilter | None = None, build_processes: int = 1) -> Iterable[BaseTool]:
+    # tools are built lazily as they are consumed, so publishing starts before the whole spec is processed
+    tools = await iter_openapi_json_tools_from_uri(file, connection_id, operation_filter=operation_filter, max_workers=build_processes)
     return tools
 
 async def import_langflow_tool(file: str, app_id: List[str] = None):    
@@ -594,6 +632,12 @@ async def import_langflow_tool(file: str, app_id: List[str] = None):
     return tool    
 
 
+def _iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterable[List[Any]]:
+    items = iter(items)
+    while chunk := list(islice(items, chunk_size)):
+        yield chunk
+
+
 def _get_kind_from_spec(spec: dict) -> ToolKind:
     name = spec.get("name")
     tool_binding = spec.get("binding")
@@ -612,18 +656,48 @@ def _get_kind_from_spec(spec: dict) -> ToolKind:
         logger.error(f"Could not determine 'kind' of tool '{name}'")
         sys.exit(1) 
 
-def get_whl_in_registry(registry_url: str, version: str) -> str| None:
-    orchestrate_links = requests.get(registry_url).text
-    wheel_files = [x.group(1) for x in re.finditer( r'href="(.*\.whl).*"', orchestrate_links)]
-    wheel_file = next(filter(lambda x: f"{version}-py3-none-any.whl" in x, wheel_files), None)
-    return wheel_file
+def _get_registry_cache() -> Config:
+    return Config(config_file_folder=REGISTRY_CACHE_FOLDER, config_file=REGISTRY_CACHE_FILE)
+
+def get_whl_in_registry(registry_url: str, version: str, ttl: int = REGISTRY_CACHE_TTL_SECONDS) -> str| None:
+    """
+    Looks up the wheel for a given version in a python package index.
+
+    Found wheels are memoized in-process and persisted to the registry cache file for ttl seconds,
+    so a multi-tool import queries the registry at most once per version. Misses are never cached
+    so a freshly published version is picked up on the next lookup.
+    """
+    cache_key = f"{registry_url}=={version}"
+    with _REGISTRY_CACHE_LOCK:
+        wheel_file = _REGISTRY_CACHE.get(cache_key)
+        if wheel_file:
+            return wheel_file
+
+        cached_entry = _get_registry_cache().read(REGISTRY_CACHE_HEADER, cache_key)
+        if isinstance(cached_entry, dict) and time.time() - cached_entry.get("fetched_at", 0) < ttl:
+            wheel_file = cached_entry.get("wheel_file")
+            if wheel_file:
+                _REGISTRY_CACHE[cache_key] = wheel_file
+                return wheel_file
+
+        orchestrate_links = requests.get(registry_url).text
+        wheel_files = [x.group(1) for x in re.finditer( r'href="(.*\.whl).*"', orchestrate_links)]
+        wheel_file = next(filter(lambda x: f"{version}-py3-none-any.whl" in x, wheel_files), None)
+
+        if wheel_file:
+            _REGISTRY_CACHE[cache_key] = wheel_file
+            _get_registry_cache().write(REGISTRY_CACHE_HEADER, cache_key, {"wheel_file": wheel_file, "fetched_at": int(time.time())})
+        return wheel_file
 
 class ToolsController:
-    def __init__(self, tool_kind: ToolKind = None, file: str = None, requirements_file: Optional[str] = None):
+    def __init__(self, tool_kind: ToolKind = None, file: str = None, requirements_file: Optional[str] = None, use_artifact_cache: bool = False):
         self.client = None
         self.tool_kind = tool_kind
         self.file = file
         self.requirements_file = requirements_file
+        self.artifact_cache = ToolArtifactCache() if use_artifact_cache else None
+        self._artifact_digests = {}
+        self._artifact_digests_lock = Lock()
 
     def get_client(self) -> ToolClient:
         if not self.client:
@@ -644,7 +718,8 @@ class ToolsController:
                     file=args["file"],
                     requirements_file=args.get("requirements_file"),
                     app_id=args.get("app_id"),
-                    package_root=args.get("package_root")
+                    package_root=args.get("package_root"),
+                    use_schema_cache=args.get("use_schema_cache", True)
                 )
 
             case "openapi":
@@ -655,7 +730,10 @@ class ToolsController:
                     app_id = app_id[0]
                     connection = connections_client.get_draft_by_app_id(app_id=app_id)
                     connection_id = connection.connection_id
-                tools = run_coroutine_sync(import_openapi_tool(file=args["file"], connection_id=connection_id))
+                operation_filter = None
+                if args.get("tags") or args.get("paths") or args.get("operation_ids"):
+                    operation_filter = OpenAPIOperationFilter(tags=args.get("tags"), paths=args.get("paths"), operation_ids=args.get("operation_ids"))
+                tools = run_coroutine_sync(import_openapi_tool(file=args["file"], connection_id=connection_id, operation_filter=operation_filter, build_processes=args.get("build_processes") or 1))
             case "flow":
                 tools = run_coroutine_sync(import_flow_tool(file=args["file"]))
             case "skill":
@@ -666,13 +744,30 @@ class ToolsController:
             case _:
                 raise BadRequest("Invalid kind selected")
 
-        if not isinstance(tools,list):
+        if isinstance(tools, BaseTool):
             tools = [tools]
 
         for tool in tools:
             yield tool
 
 
+    def _get_toolkit_names_lut(self, tools: List[BaseTool]) -> dict[str, str]:
+        """
+            Resolves the names of every toolkit referenced by the given tools using batched
+            id lookups rather than one request per tool
+
+            Returns:
+                A toolkit id -> toolkit name lookup table
+        """
+        toolkit_ids = get_all_unique_resources([tool.__tool_spec__ for tool in tools], "toolkit_id")
+        if not toolkit_ids:
+            return {}
+
+        toolkit_client = instantiate_client(ToolKitClient)
+        toolkits = batch_request_resource(toolkit_client.get_drafts_by_ids, toolkit_ids)
+        toolkits = [toolkit for toolkit in toolkits or [] if isinstance(toolkit, dict)]
+        return construct_lookup_table(toolkits, "id", "name")
+
     def list_tools(self, verbose=False, format: ListFormats| None = None) -> List[dict[str, Any]] | str | None:
         if verbose and format:
             logger.error("For tools list, `--verbose` and `--format` are mutually exclusive options")
@@ -710,6 +805,8 @@ class ToolsController:
 
             connections_dict = {conn.connection_id: conn for conn in connections}
 
+            toolkit_names_lut = self._get_toolkit_names_lut(tools)
+
             table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True)
             column_args = {
                 "Name": {"overflow": "fold"},
@@ -772,12 +869,7 @@ class ToolsController:
                 toolkit_name = ""
 
                 if tool.__tool_spec__.toolkit_id:
-                    toolkit_client = instantiate_client(ToolKitClient)
-                    toolkit = toolkit_client.get_draft_by_id(tool.__tool_spec__.toolkit_id)
-                    if isinstance(toolkit, dict) and "name" in toolkit:
-                        toolkit_name = toolkit["name"]
-                    elif toolkit:
-                        toolkit_name = str(toolkit)
+                    toolkit_name = toolkit_names_lut.get(tool.__tool_spec__.toolkit_id) or ""
                 
                 entry = ToolListEntry(
                     name=tool.__tool_spec__.name,
@@ -807,11 +899,17 @@ class ToolsController:
     def get_all_tools(self) -> dict:
         return {entry["name"]: entry["id"] for entry in self.get_client().get()}
 
-    def publish_or_update_tools(self, tools: Iterable[BaseTool], package_root: str = None) -> None:
+    def publish_or_update_tools(self, tools: Iterable[BaseTool], package_root: str = None, concurrency: int = 1) -> List[ImportResult] | None:
+        if concurrency and concurrency > 1:
+            results = self.bulk_publish_or_update_tools(tools=tools, package_root=package_root, max_workers=concurrency)
+            if import_failed(results):
+                sys.exit(1)
+            return results
+
         resolved_package_root = get_package_root(package_root)
 
         # Zip the tool's supporting artifacts for python tools
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory() as tmpdir, self._flushing_artifact_cache():
             for tool in tools:
                 exist = False
                 tool_id = None
@@ -826,129 +924,254 @@ class ToolsController:
                     exist = True
                     tool_id = existing_tool.get("id")
 
-                tool_artifact = None
-                if self.tool_kind == ToolKind.python:
-                    tool_artifact = path.join(tmpdir, "artifacts.zip")
-                    with zipfile.ZipFile(tool_artifact, "w", zipfile.ZIP_DEFLATED) as zip_tool_artifacts:
-                        resolved_requirements_file = get_resolved_py_tool_reqs_file(tool_file=self.file,
-                                                                                    requirements_file=self.requirements_file,
-                                                                                    package_root=resolved_package_root)
-
-                        if resolved_package_root is None:
-                            # single file.
-                            file_path = Path(self.file)
-                            zip_tool_artifacts.write(file_path, arcname=f"{file_path.stem}.py")
-
-                        else:
-                            # multi-file.
-                            path_strs = sorted(set([x for x in glob.iglob(path.join(resolved_package_root, '**/**'), include_hidden=True, recursive=True)]))
-                            for path_str in path_strs:
-                                path_obj = Path(path_str)
-
-                                if not path_obj.is_file() or "/__pycache__/" in path_str or path_obj.name.lower() == "requirements.txt":
-                                    continue
-
-                                if path_obj.is_symlink():
-                                    raise typer.BadParameter(f"Symbolic links in packages are not supported. - {path_str}")
-
-                                try:
-                                    zip_tool_artifacts.write(path_str, arcname=str(Path(path_str).relative_to(Path(resolved_package_root))))
-
-                                except Exception as ex:
-                                    logger.error(f"Could not write file {path_str} to artifact. {ex}")
-                                    raise ex
-
-                            zip_tool_artifacts.writestr("tool-spec.json", tool.dumps_spec())
-
-                        requirements = []
-                        if resolved_requirements_file is not None:
-                            requirements = get_requirement_lines(requirements_file=resolved_requirements_file, remove_trailing_newlines=False)
-
-                        # Ensure there is a newline at the end of the file
-                        if len(requirements) > 0 and not requirements[-1].endswith("\n"):
-                            requirements[-1] = requirements[-1]+"\n"
-
-                        cfg = Config()
-                        registry_type = cfg.read(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT) or DEFAULT_CONFIG_FILE_CONTENT[PYTHON_REGISTRY_HEADER][PYTHON_REGISTRY_TYPE_OPT]
-                        skip_version_check = cfg.read(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_SKIP_VERSION_CHECK_OPT) or DEFAULT_CONFIG_FILE_CONTENT[PYTHON_REGISTRY_HEADER][PYTHON_REGISTRY_SKIP_VERSION_CHECK_OPT]
-
-                        version = __version__
-                        if registry_type == RegistryType.LOCAL:
-                            logger.warning(f"Using a local registry which is for development purposes only")
-                            requirements.append(f"/packages/ibm_watsonx_orchestrate-0.6.0-py3-none-any.whl\n")
-                        elif registry_type == RegistryType.PYPI:
-                            if not skip_version_check:
-                                wheel_file = get_whl_in_registry(registry_url='https://pypi.org/simple/ibm-watsonx-orchestrate', version=version)
-                                if not wheel_file:
-                                    logger.error(f"Could not find ibm-watsonx-orchestrate@{version} on https://pypi.org/project/ibm-watsonx-orchestrate")
-                                    exit(1)
-                            requirements.append(f"ibm-watsonx-orchestrate=={version}\n")
-                        elif registry_type == RegistryType.TESTPYPI:
-                            override_version = cfg.get(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT) or version
-                            wheel_file = get_whl_in_registry(registry_url='https://test.pypi.org/simple/ibm-watsonx-orchestrate', version=override_version)
-                            if not wheel_file:
-                                logger.error(f"Could not find ibm-watsonx-orchestrate@{override_version} on https://test.pypi.org/project/ibm-watsonx-orchestrate")
-                                exit(1)
-                            requirements.append(f"ibm-watsonx-orchestrate @ {wheel_file}\n")
-                        else:
-                            logger.error(f"Unrecognized registry type provided to orchestrate env activate local --registry <registry>")
-                            exit(1)
-                        requirements_file = path.join(tmpdir, 'requirements.txt')
-
-                        requirements = list(dict.fromkeys(requirements))
-
-                        with open(requirements_file, 'w') as fp:
-                            fp.writelines(requirements)
-                        requirements_file_path = Path(requirements_file)
-                        zip_tool_artifacts.write(requirements_file_path, arcname='requirements.txt')
-
-                        zip_tool_artifacts.writestr("bundle-format", "2.0.0\n")
-                        
-                elif self.tool_kind == ToolKind.langflow:
-
-                    tool_artifact = path.join(tmpdir, "artifacts.zip")
-
-                    with zipfile.ZipFile(tool_artifact, "w", zipfile.ZIP_DEFLATED) as zip_tool_artifacts:
-                        tool_path = Path(self.file)
-                        zip_tool_artifacts.write(tool_path, arcname=f"{tool_path.stem}.json")
-
-                        requirements = []
-
-                        if self.requirements_file:
-                            requirements_file_path = Path(self.requirements_file)
-                            requirements.extend(
-                                get_requirement_lines(requirements_file=requirements_file_path, remove_trailing_newlines=False)
-                            )
-
-                        langflowTool = cast(LangflowTool, tool)
-                        # if there are additional requriements from the langflow model, we should add it to the requirement set
-                        if langflowTool.requirements and len(langflowTool.requirements) > 0:
-                            requirements.extend(langflowTool.requirements)
-
-                        # now check if the requirements contain modules listed in DEFAULT_LANGFLOW_RUNNER_MODULES
-                        # if it is needed, we are assuming the user wants to override the default langflow module
-                        # with a specific version
-                        runner_overridden = False
-                        for r in requirements:
-                            # get the module name from the requirements
-                            module_name = r.strip().split('==')[0].split('=')[0].split('>=')[0].split('<=')[0].split('~=')[0].lower()
-                            if not module_name.startswith('#'):
-                                if module_name in DEFAULT_LANGFLOW_RUNNER_MODULES:
-                                    runner_overridden = True
-                        
-                        if not runner_overridden:
-                            # add the default runner to the top of requirement list
-                            requirements = DEFAULT_LANGFLOW_TOOL_REQUIREMENTS + list(requirements)
-
-                        requirements_content = '\n'.join(requirements) + '\n'
-                        zip_tool_artifacts.writestr("requirements.txt",requirements_content)  
-                        zip_tool_artifacts.writestr("bundle-format", "2.0.0\n")
+                tool_artifact = self._build_tool_artifact(tool=tool, tool_artifact=path.join(tmpdir, "artifacts.zip"), resolved_package_root=resolved_package_root, tool_id=tool_id)
 
                 if exist:
                     self.update_tool(tool_id=tool_id, tool=tool, tool_artifact=tool_artifact)
                 else:
                     self.publish_tool(tool=tool, tool_artifact=tool_artifact)
 
+    def bulk_publish_or_update_tools(
+        self,
+        tools: Iterable[BaseTool],
+        package_root: str = None,
+        max_workers: int = DEFAULT_PUBLISH_MAX_WORKERS,
+        artifacts: dict[str, str | None] | None = None,
+        print_summary: bool = True
+    ) -> List[ImportResult]:
+        """
+        Publishes tools concurrently. Tools are consumed in chunks as they are produced, so tools from a lazy iterable
+        are uploaded while later ones are still being built. Existing tools are resolved with one name lookup per
+        chunk, then each tool's artifact is built and uploaded in a bounded worker pool. Failures are captured per tool
+        and reported in a summary rather than aborting the whole import, callers decide how to exit.
+
+        When artifacts is given, it holds the already built artifact of each tool by name (None for tools without
+        one), which is uploaded as is instead of building the artifact from the tool's source.
+        """
+        resolved_package_root = get_package_root(package_root)
+        futures = []
+
+        with tempfile.TemporaryDirectory() as tmpdir, self._flushing_artifact_cache(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk in _iter_chunks(tools, DEFAULT_BULK_LOOKUP_CHUNK_SIZE):
+                existing_tool_ids = self._get_existing_tool_ids([tool.__tool_spec__.name for tool in chunk])
+                for tool in chunk:
+                    futures.append(executor.submit(
+                        self._publish_or_update_tool,
+                        tool=tool,
+                        tool_id=existing_tool_ids.get(tool.__tool_spec__.name),
+                        tool_artifact=artifacts.get(tool.__tool_spec__.name) if artifacts is not None else path.join(tmpdir, str(len(futures)), "artifacts.zip"),
+                        resolved_package_root=resolved_package_root,
+                        build_artifact=artifacts is None
+                    ))
+            results = [future.result() for future in futures]
+
+        if not results:
+            return []
+
+        if print_summary:
+            print_import_summary(results, title="Tool import summary", resource_name="tools")
+        return results
+
+    def _get_existing_tool_ids(self, tool_names: List[str], chunk_size: int = DEFAULT_BULK_LOOKUP_CHUNK_SIZE) -> dict[str, str]:
+        unique_names = list(dict.fromkeys(tool_names))
+        existing_tools = {}
+        for i in range(0, len(unique_names), chunk_size):
+            for existing_tool in self.get_client().get_drafts_by_names(unique_names[i:i + chunk_size]):
+                existing_tools.setdefault(existing_tool.get("name"), []).append(existing_tool)
+
+        for name, matches in existing_tools.items():
+            if len(matches) > 1:
+                logger.error(f"Multiple existing tools found with name '{name}'. Failed to update tool")
+                sys.exit(1)
+
+        return {name: matches[0].get("id") for name, matches in existing_tools.items()}
+
+    def _publish_or_update_tool(self, tool: BaseTool, tool_id: str | None, tool_artifact: str | None, resolved_package_root: str | None, build_artifact: bool = True) -> ImportResult:
+        start = time.perf_counter()
+        status = ImportStatus.UPDATED if tool_id else ImportStatus.CREATED
+        error = None
+        try:
+            if build_artifact:
+                Path(tool_artifact).parent.mkdir(parents=True, exist_ok=True)
+                tool_artifact = self._build_tool_artifact(tool=tool, tool_artifact=tool_artifact, resolved_package_root=resolved_package_root, tool_id=tool_id)
+            if tool_id:
+                self.update_tool(tool_id=tool_id, tool=tool, tool_artifact=tool_artifact)
+            else:
+                self.publish_tool(tool=tool, tool_artifact=tool_artifact)
+        except (Exception, SystemExit) as e:
+            # building python tool artifacts exits when the sdk can't be found in the registry, which must only fail this tool
+            status = ImportStatus.FAILED
+            error = describe_import_error(e)
+            logger.error(f"Failed to import tool '{tool.__tool_spec__.name}': {error}")
+
+        return ImportResult(
+            name=tool.__tool_spec__.name,
+            status=status,
+            duration=time.perf_counter() - start,
+            error=error
+        )
+
+    def _get_python_tool_artifact_files(self, resolved_package_root: str | None) -> List[tuple[str | Path, str]]:
+        if resolved_package_root is None:
+            # single file.
+            file_path = Path(self.file)
+            return [(file_path, f"{file_path.stem}.py")]
+
+        # multi-file.
+        files = []
+        path_strs = sorted(set([x for x in glob.iglob(path.join(resolved_package_root, '**/**'), include_hidden=True, recursive=True)]))
+        for path_str in path_strs:
+            path_obj = Path(path_str)
+
+            if not path_obj.is_file() or "/__pycache__/" in path_str or path_obj.name.lower() == "requirements.txt":
+                continue
+
+            if path_obj.is_symlink():
+                raise typer.BadParameter(f"Symbolic links in packages are not supported. - {path_str}")
+
+            files.append((path_str, str(Path(path_str).relative_to(Path(resolved_package_root)))))
+        return files
+
+    def _get_python_tool_requirements(self, resolved_package_root: str | None) -> List[str]:
+        resolved_requirements_file = get_resolved_py_tool_reqs_file(tool_file=self.file,
+                                                                    requirements_file=self.requirements_file,
+                                                                    package_root=resolved_package_root)
+
+        requirements = []
+        if resolved_requirements_file is not None:
+            requirements = get_requirement_lines(requirements_file=resolved_requirements_file, remove_trailing_newlines=False)
+
+        # Ensure there is a newline at the end of the file
+        if len(requirements) > 0 and not requirements[-1].endswith("\n"):
+            requirements[-1] = requirements[-1]+"\n"
+
+        cfg = Config()
+        registry_type = cfg.read(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT) or DEFAULT_CONFIG_FILE_CONTENT[PYTHON_REGISTRY_HEADER][PYTHON_REGISTRY_TYPE_OPT]
+        skip_version_check = cfg.read(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_SKIP_VERSION_CHECK_OPT) or DEFAULT_CONFIG_FILE_CONTENT[PYTHON_REGISTRY_HEADER][PYTHON_REGISTRY_SKIP_VERSION_CHECK_OPT]
+
+        version = __version__
+        if registry_type == RegistryType.LOCAL:
+            logger.warning(f"Using a local registry which is for development purposes only")
+            requirements.append(f"/packages/ibm_watsonx_orchestrate-0.6.0-py3-none-any.whl\n")
+        elif registry_type == RegistryType.PYPI:
+            if not skip_version_check:
+                wheel_file = get_whl_in_registry(registry_url='https://pypi.org/simple/ibm-watsonx-orchestrate', version=version)
+                if not wheel_file:
+                    logger.error(f"Could not find ibm-watsonx-orchestrate@{version} on https://pypi.org/project/ibm-watsonx-orchestrate")
+                    exit(1)
+            requirements.append(f"ibm-watsonx-orchestrate=={version}\n")
+        elif registry_type == RegistryType.TESTPYPI:
+            override_version = cfg.get(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT) or version
+            wheel_file = get_whl_in_registry(registry_url='https://test.pypi.org/simple/ibm-watsonx-orchestrate', version=override_version)
+            if not wheel_file:
+                logger.error(f"Could not find ibm-watsonx-orchestrate@{override_version} on https://test.pypi.org/project/ibm-watsonx-orchestrate")
+                exit(1)
+            requirements.append(f"ibm-watsonx-orchestrate @ {wheel_file}\n")
+        else:
+            logger.error(f"Unrecognized registry type provided to orchestrate env activate local --registry <registry>")
+            exit(1)
+
+        return list(dict.fromkeys(requirements))
+
+    def _build_tool_artifact(self, tool: BaseTool, tool_artifact: str, resolved_package_root: str | None, tool_id: str | None = None) -> str | None:
+        if self.tool_kind == ToolKind.python:
+            artifact_files = self._get_python_tool_artifact_files(resolved_package_root)
+            requirements = self._get_python_tool_requirements(resolved_package_root)
+            tool_spec_json = tool.dumps_spec()
+
+            digest = None
+            if self.artifact_cache is not None:
+                try:
+                    # the digest covers the spec pushed with the artifact, so a changed spec is never skipped
+                    digest = compute_artifact_digest(artifact_files, requirements, tool_spec_json)
+                except OSError as e:
+                    logger.debug(f"Unable to compute artifact digest for tool '{tool.__tool_spec__.name}': {e}")
+                if tool_id and self.artifact_cache.matches(tool_id, digest):
+                    logger.info(f"Artifact for tool '{tool.__tool_spec__.name}' is unchanged. Skipping upload")
+                    return None
+
+            with zipfile.ZipFile(tool_artifact, "w", zipfile.ZIP_DEFLATED) as zip_tool_artifacts:
+                for file_path, arcname in artifact_files:
+                    try:
+                        zip_tool_artifacts.write(file_path, arcname=arcname)
+
+                    except Exception as ex:
+                        logger.error(f"Could not write file {file_path} to artifact. {ex}")
+                        raise ex
+
+                if resolved_package_root is not None:
+                    zip_tool_artifacts.writestr("tool-spec.json", tool_spec_json)
+
+                requirements_file = path.join(path.dirname(tool_artifact), 'requirements.txt')
+
+                with open(requirements_file, 'w') as fp:
+                    fp.writelines(requirements)
+                requirements_file_path = Path(requirements_file)
+                zip_tool_artifacts.write(requirements_file_path, arcname='requirements.txt')
+
+                zip_tool_artifacts.writestr("bundle-format", "2.0.0\n")
+
+            if digest is not None:
+                with self._artifact_digests_lock:
+                    self._artifact_digests[tool_artifact] = digest
+
+        elif self.tool_kind == ToolKind.langflow:
+
+            with zipfile.ZipFile(tool_artifact, "w", zipfile.ZIP_DEFLATED) as zip_tool_artifacts:
+                tool_path = Path(self.file)
+                zip_tool_artifacts.write(tool_path, arcname=f"{tool_path.stem}.json")
+
+                requirements = []
+
+                if self.requirements_file:
+                    requirements_file_path = Path(self.requirements_file)
+                    requirements.extend(
+                        get_requirement_lines(requirements_file=requirements_file_path, remove_trailing_newlines=False)
+                    )
+
+                langflowTool = cast(LangflowTool, tool)
+                # if there are additional requriements from the langflow model, we should add it to the requirement set
+                if langflowTool.requirements and len(langflowTool.requirements) > 0:
+                    requirements.extend(langflowTool.requirements)
+
+                # now check if the requirements contain modules listed in DEFAULT_LANGFLOW_RUNNER_MODULES
+                # if it is needed, we are assuming the user wants to override the default langflow module
+                # with a specific version
+                runner_overridden = False
+                for r in requirements:
+                    # get the module name from the requirements
+                    module_name = r.strip().split('==')[0].split('=')[0].split('>=')[0].split('<=')[0].split('~=')[0].lower()
+                    if not module_name.startswith('#'):
+                        if module_name in DEFAULT_LANGFLOW_RUNNER_MODULES:
+                            runner_overridden = True
+                
+                if not runner_overridden:
+                    # add the default runner to the top of requirement list
+                    requirements = DEFAULT_LANGFLOW_TOOL_REQUIREMENTS + list(requirements)
+
+                requirements_content = '\n'.join(requirements) + '\n'
+                zip_tool_artifacts.writestr("requirements.txt",requirements_content)  
+                zip_tool_artifacts.writestr("bundle-format", "2.0.0\n")
+
+        else:
+            return None
+
+        return tool_artifact
+
+    @contextmanager
+    def _flushing_artifact_cache(self):
+        try:
+            yield
+        finally:
+            if self.artifact_cache is not None:
+                self.artifact_cache.flush()
+
+    def _record_artifact_digest(self, tool_id: str, tool_artifact: str) -> None:
+        with self._artifact_digests_lock:
+            digest = self._artifact_digests.pop(tool_artifact, None)
+        if digest is not None and self.artifact_cache is not None:
+            self.artifact_cache.set(tool_id, digest)
+
     def publish_tool(self, tool: BaseTool, tool_artifact: str) -> None:
         tool_spec = tool.__tool_spec__.model_dump(mode='json', exclude_unset=True, exclude_none=True, by_alias=True)
 
@@ -956,9 +1179,11 @@ class ToolsController:
         tool_id = response.get("id")
 
         if tool_artifact is not None:
-            match self.tool_kind:
+            # a controller without a kind publishes tools of any kind, e.g. from a workspace bundle
+            match self.tool_kind or _get_kind_from_spec(tool_spec):
                 case ToolKind.langflow | ToolKind.python:
                     self.get_client().upload_tools_artifact(tool_id=tool_id, file_path=tool_artifact)
+                    self._record_artifact_digest(tool_id=tool_id, tool_artifact=tool_artifact)
                 case _:
                     raise ValueError(f"Unexpected artifact for {self.tool_kind} tool")
 
@@ -972,9 +1197,10 @@ class ToolsController:
         self.get_client().update(tool_id, tool_spec)
 
         if tool_artifact is not None:
-            match self.tool_kind:
+            match self.tool_kind or _get_kind_from_spec(tool_spec):
                 case ToolKind.langflow | ToolKind.python:
                     self.get_client().upload_tools_artifact(tool_id=tool_id, file_path=tool_artifact)
+                    self._record_artifact_digest(tool_id=tool_id, tool_artifact=tool_artifact)
                 case _:
                     raise ValueError(f"Unexpected artifact for {self.tool_kind} tool")
 
@@ -1025,7 +1251,12 @@ class ToolsController:
             logger.error(f"No tool named '{name}' found")
             sys.exit(1)
 
-        draft_tool = draft_tools[0]
+        return self.download_tool_artifact(draft_tools[0])
+
+    def download_tool_artifact(self, draft_tool: dict) -> bytes | None:
+        """Downloads the artifact of a tool from its draft spec, or returns None if its kind has no exportable artifact."""
+        tool_client = self.get_client()
+        name = draft_tool.get("name")
         draft_tool_kind = _get_kind_from_spec(draft_tool)
         
         # TODO: Add openapi tool support
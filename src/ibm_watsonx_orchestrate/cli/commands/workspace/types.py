@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+WORKSPACE_BUNDLE_VERSION = "1.0.0"
+WORKSPACE_MANIFEST_FILE = "manifest.json"
+
+
+class WorkspaceResourceKind(str, Enum):
+    CONNECTION = 'connection'
+    MODEL = 'model'
+    MODEL_POLICY = 'model_policy'
+    KNOWLEDGE_BASE = 'knowledge_base'
+    TOOLKIT = 'toolkit'
+    TOOL = 'tool'
+    AGENT = 'agent'
+
+    def __str__(self):
+        return str(self.value)
+
+
+# Order in which resources are imported, so every resource is imported after the resources it references
+WORKSPACE_IMPORT_ORDER = [
+    WorkspaceResourceKind.CONNECTION,
+    WorkspaceResourceKind.MODEL,
+    WorkspaceResourceKind.MODEL_POLICY,
+    WorkspaceResourceKind.KNOWLEDGE_BASE,
+    WorkspaceResourceKind.TOOLKIT,
+    WorkspaceResourceKind.TOOL,
+    WorkspaceResourceKind.AGENT,
+]
+
+
+class WorkspaceManifestEntry(BaseModel):
+    kind: WorkspaceResourceKind
+    name: str
+    path: str = Field(description="Path of the resource spec within the bundle")
+    artifact: Optional[str] = Field(default=None, description="Path of the resource artifact within the bundle, if it has one")
+
+
+class WorkspaceManifest(BaseModel):
+    version: str = WORKSPACE_BUNDLE_VERSION
+    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    orchestrate_version: Optional[str] = None
+    connections: dict[str, str] = Field(default_factory=dict, description="app_id of each connection_id in the exported workspace, used to rebind resources on import")
+    resources: List[WorkspaceManifestEntry] = Field(default_factory=list)
@@ -0,0 +1,49 @@
+import typer
+from typing_extensions import Annotated
+from ibm_watsonx_orchestrate.cli.commands.workspace.workspace_controller import WorkspaceController
+from ibm_watsonx_orchestrate.cli.commands.agents.agents_controller import DEFAULT_IMPORT_MAX_WORKERS
+from ibm_watsonx_orchestrate.cli.commands.agents.export_session import DEFAULT_EXPORT_MAX_WORKERS
+
+workspace_app = typer.Typer(no_args_is_help=True)
+
+
+@workspace_app.command(name="export", help="Export every agent, tool, toolkit, knowledge base, model, model policy and connection configuration in the active env to a single zip file")
+def workspace_export(
+    output_file: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Path to a where the zip file containing the exported workspace should be saved",
+        ),
+    ],
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Number of resources to download in parallel",
+            min=1,
+        ),
+    ] = DEFAULT_EXPORT_MAX_WORKERS,
+):
+    workspace_controller = WorkspaceController()
+    workspace_controller.export_workspace(output_path=output_file, concurrency=concurrency)
+
+
+@workspace_app.command(name="import", help="Import a workspace exported with `orchestrate workspace export` into the active env")
+def workspace_import(
+    file: Annotated[
+        str,
+        typer.Option("--file", "-f", help="Zip file created by `orchestrate workspace export`"),
+    ],
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Number of resources of the same kind to import in parallel",
+            min=1,
+        ),
+    ] = DEFAULT_IMPORT_MAX_WORKERS,
+):
+    workspace_controller = WorkspaceController()
+    workspace_controller.import_workspace(file=file, concurrency=concurrency)
@@ -0,0 +1,409 @@
+import json
+import logging
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List
+
+import yaml
+
+from ibm_watsonx_orchestrate import __version__
+from ibm_watsonx_orchestrate.agent_builder.agents import Agent, ExternalAgent, AssistantAgent, SpecVersion
+from ibm_watsonx_orchestrate.agent_builder.models.types import VirtualModel
+from ibm_watsonx_orchestrate.agent_builder.model_policies.types import ModelPolicy
+from ibm_watsonx_orchestrate.agent_builder.tools import BaseTool, ToolSpec
+from ibm_watsonx_orchestrate.cli.commands.agents.agents_controller import AgentsController, DEFAULT_IMPORT_MAX_WORKERS
+from ibm_watsonx_orchestrate.cli.commands.agents.export_session import ExportSession, DEFAULT_EXPORT_MAX_WORKERS
+from ibm_watsonx_orchestrate.cli.commands.connections.connections_controller import (
+    get_connection_configs,
+    import_connection,
+    _combine_connection_configs,
+)
+from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller import KnowledgeBaseController
+from ibm_watsonx_orchestrate.cli.commands.models.models_controller import ModelsController, create_model_from_spec, create_policy_from_spec
+from ibm_watsonx_orchestrate.cli.commands.toolkit.toolkit_controller import ToolkitController
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController, ToolKind
+from ibm_watsonx_orchestrate.cli.common import ImportResult, ImportStatus, describe_import_error, import_failed, print_import_summary
+from ibm_watsonx_orchestrate.cli.commands.workspace.types import (
+    WORKSPACE_BUNDLE_VERSION,
+    WORKSPACE_IMPORT_ORDER,
+    WORKSPACE_MANIFEST_FILE,
+    WorkspaceManifest,
+    WorkspaceManifestEntry,
+    WorkspaceResourceKind,
+)
+from ibm_watsonx_orchestrate.client.connections import get_connections_client
+from ibm_watsonx_orchestrate.flow_builder.utils import import_flow_model
+from ibm_watsonx_orchestrate.utils.async_helpers import run_coroutine_sync
+
+logger = logging.getLogger(__name__)
+
+# Tool kinds whose implementation is stored as an artifact next to their spec
+ARTIFACT_TOOL_KINDS = [ToolKind.python, ToolKind.langflow, ToolKind.flow]
+
+
+def _to_file_name(name: str) -> str:
+    return name.replace("/", "_")
+
+
+def _to_yaml(content: dict) -> bytes:
+    return yaml.dump(content, sort_keys=False, default_flow_style=False, allow_unicode=True).encode("utf-8")
+
+
+def _get_tool_kind(tool_spec: dict) -> ToolKind | None:
+    binding = tool_spec.get("binding") or {}
+    return next((kind for kind in ToolKind if kind.value in binding), None)
+
+
+class WorkspaceController:
+    """
+    Exports every resource of the active env to a single zip bundle described by a manifest, and imports such a
+    bundle into the active env.
+
+    Export downloads resources on the worker pool of an ExportSession and streams each one into the archive as it
+    arrives. Import applies the resources kind by kind in WORKSPACE_IMPORT_ORDER, so every resource is created after
+    the resources it references, and imports the resources of each kind in parallel. Connection ids referenced by
+    tools and models are rebound to the connections with the same app_id in the active env.
+    """
+
+    def __init__(self):
+        self.agents_controller = AgentsController()
+        self.tools_controller = ToolsController()
+        self.knowledge_base_controller = KnowledgeBaseController()
+        self.models_controller = ModelsController()
+        self.toolkit_controller = ToolkitController()
+
+    def export_workspace(self, output_path: str, concurrency: int = DEFAULT_EXPORT_MAX_WORKERS) -> WorkspaceManifest:
+        output_file = Path(output_path)
+        if output_file.suffix != ".zip":
+            logger.error(f"Output file must end with the extension '.zip'. Provided file '{output_path}' ends with '{output_file.suffix}'")
+            sys.exit(1)
+        if output_file.exists():
+            logger.error(f"Specified output file '{output_path}' already exists")
+            sys.exit(1)
+
+        manifest = WorkspaceManifest(orchestrate_version=__version__)
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zip_file_out:
+            export_session = ExportSession(zip_file_out, tools_controller=self.tools_controller, knowledge_base_controller=self.knowledge_base_controller, max_workers=concurrency)
+            try:
+                self._export_connections(export_session, manifest)
+                self._export_models(export_session, manifest)
+                self._export_model_policies(export_session, manifest)
+                self._export_knowledge_bases(export_session, manifest)
+                self._export_toolkits(export_session, manifest)
+                self._export_tools(export_session, manifest)
+                self._export_agents(export_session, manifest)
+                # written last so a bundle with a manifest is always complete
+                export_session.writestr(WORKSPACE_MANIFEST_FILE, manifest.model_dump_json(indent=2))
+            finally:
+                export_session.close()
+
+        logger.info(f"Successfully exported {len(manifest.resources)} resources to '{output_path}'")
+        return manifest
+
+    @staticmethod
+    def _add_resource(export_session: ExportSession, manifest: WorkspaceManifest, kind: WorkspaceResourceKind, name: str, path: str, content: str | bytes, artifact: bytes | None = None) -> None:
+        export_session.writestr(path, content)
+        artifact_path = None
+        if artifact is not None:
+            artifact_path = f"{Path(path).parent.as_posix()}/artifact.zip"
+            export_session.writestr(artifact_path, artifact)
+        manifest.resources.append(WorkspaceManifestEntry(kind=kind, name=name, path=path, artifact=artifact_path))
+
+    def _export_connections(self, export_session: ExportSession, manifest: WorkspaceManifest) -> None:
+        connections = get_connections_client().list()
+        for connection in connections:
+            if connection.connection_id and connection.app_id:
+                manifest.connections[connection.connection_id] = connection.app_id
+
+        app_ids = list(dict.fromkeys(connection.app_id for connection in connections if connection.app_id))
+        for app_id, configs in export_session.fetch(lambda app_id: get_connection_configs(app_id=app_id), app_ids):
+            if not configs:
+                continue
+            logger.info(f"Exporting connection '{app_id}'")
+            self._add_resource(export_session, manifest, WorkspaceResourceKind.CONNECTION, app_id, f"connections/{_to_file_name(app_id)}.yaml", _to_yaml(_combine_connection_configs(configs)))
+
+    def _export_models(self, export_session: ExportSession, manifest: WorkspaceManifest) -> None:
+        for model in self.models_controller.get_models_client().list():
+            if not model.name or not model.name.startswith("virtual-model/"):
+                continue
+            logger.info(f"Exporting model '{model.name}'")
+            model_spec = {key: value for key, value in model.model_dump(mode="json", exclude_none=True).items() if key in VirtualModel.model_fields}
+            self._add_resource(export_session, manifest, WorkspaceResourceKind.MODEL, model.name, f"models/{_to_file_name(model.name)}.yaml", _to_yaml(model_spec))
+
+    def _export_model_policies(self, export_session: ExportSession, manifest: WorkspaceManifest) -> None:
+        for policy in self.models_controller.get_model_policies_client().list():
+            logger.info(f"Exporting model policy '{policy.name}'")
+            policy_spec = {key: value for key, value in policy.model_dump(mode="json", exclude_none=True).items() if key in ModelPolicy.model_fields}
+            self._add_resource(export_session, manifest, WorkspaceResourceKind.MODEL_POLICY, policy.name, f"policies/{_to_file_name(policy.name)}.yaml", _to_yaml(policy_spec))
+
+    def _export_knowledge_bases(self, export_session: ExportSession, manifest: WorkspaceManifest) -> None:
+        knowledge_bases = self.knowledge_base_controller.get_client().get()
+        knowledge_base_controller = export_session.knowledge_base_controller
+        for knowledge_base, knowledge_base_spec in export_session.fetch(lambda kb: knowledge_base_controller.get_knowledge_base_export_spec(id=kb.get("id")), knowledge_bases):
+            if knowledge_base_spec is None:
+                continue
+            name = knowledge_base.get("name")
+            self._add_resource(export_session, manifest, WorkspaceResourceKind.KNOWLEDGE_BASE, name, f"knowledge-bases/{_to_file_name(name)}.yaml", _to_yaml(knowledge_base_spec))
+
+    def _export_toolkits(self, export_session: ExportSession, manifest: WorkspaceManifest) -> None:
+        for toolkit in self.toolkit_controller.get_client().get():
+            name = toolkit.get("name")
+            logger.info(f"Exporting toolkit '{name}'")
+            self._add_resource(export_session, manifest, WorkspaceResourceKind.TOOLKIT, name, f"toolkits/{_to_file_name(name)}.json", json.dumps(toolkit, indent=2))
+
+    def _export_tools(self, export_session: ExportSession, manifest: WorkspaceManifest) -> None:
+        tool_specs = []
+        for tool_spec in export_session.tools_client.get():
+            name = tool_spec.get("name")
+            # tools of a toolkit are recreated when the toolkit is imported
+            if tool_spec.get("toolkit_id"):
+                continue
+            if _get_tool_kind(tool_spec) is None:
+                logger.warning(f"Skipping '{name}', its kind is unsupported by export")
+                continue
+            tool_specs.append(tool_spec)
+
+        def download_tool(tool_spec: dict) -> bytes | None:
+            if _get_tool_kind(tool_spec) not in ARTIFACT_TOOL_KINDS:
+                return None
+            logger.info(f"Exporting tool '{tool_spec.get('name')}'")
+            return export_session.tools_controller.download_tool_artifact(tool_spec)
+
+        for tool_spec, tool_artifact_bytes in export_session.fetch(download_tool, tool_specs):
+            name = tool_spec.get("name")
+            if _get_tool_kind(tool_spec) in ARTIFACT_TOOL_KINDS and not tool_artifact_bytes:
+                continue
+            try:
+                spec = ToolSpec.model_validate(tool_spec, context="list").model_dump(mode="json", exclude_unset=True, exclude_none=True, by_alias=True)
+            except ValueError as e:
+                logger.warning(f"Skipping '{name}', its spec could not be parsed: {e}")
+                continue
+            spec.pop("id", None)
+            self._add_resource(export_session, manifest, WorkspaceResourceKind.TOOL, name, f"tools/{_to_file_name(name)}/spec.json", json.dumps(spec, indent=2), artifact=tool_artifact_bytes)
+
+    def _export_agents(self, export_session: ExportSession, manifest: WorkspaceManifest) -> None:
+        agents = []
+        for client, agent_type in [
+            (self.agents_controller.get_native_client(), Agent),
+            (self.agents_controller.get_external_client(), ExternalAgent),
+            (self.agents_controller.get_assistant_client(), AssistantAgent),
+        ]:
+            agents += [agent_type.model_validate(agent) for agent in client.get()]
+
+        for agent, agent_spec in export_session.fetch(self.agents_controller.get_spec_file_content, agents):
+            logger.info(f"Exporting agent '{agent.name}'")
+            agent_spec.pop("hidden", None)
+            agent_spec.pop("id", None)
+            agent_spec["spec_version"] = SpecVersion.V1.value
+            self._add_resource(export_session, manifest, WorkspaceResourceKind.AGENT, agent.name, f"agents/{agent_spec.get('kind', 'unknown')}/{_to_file_name(agent.name)}.yaml", _to_yaml(agent_spec))
+
+    def import_workspace(self, file: str, concurrency: int = DEFAULT_IMPORT_MAX_WORKERS) -> List[ImportResult]:
+        if not zipfile.is_zipfile(file):
+            logger.error(f"Workspace bundle '{file}' is not a zip file")
+            sys.exit(1)
+
+        with tempfile.TemporaryDirectory() as bundle_dir:
+            with zipfile.ZipFile(file, "r") as zip_file_in:
+                if WORKSPACE_MANIFEST_FILE not in zip_file_in.namelist():
+                    logger.error(f"No '{WORKSPACE_MANIFEST_FILE}' found in '{file}'. Please ensure the file was created with `orchestrate workspace export`")
+                    sys.exit(1)
+                manifest = WorkspaceManifest.model_validate_json(zip_file_in.read(WORKSPACE_MANIFEST_FILE))
+                if manifest.version.split(".")[0] != WORKSPACE_BUNDLE_VERSION.split(".")[0]:
+                    logger.error(f"Unsupported workspace bundle version '{manifest.version}'. Expected version '{WORKSPACE_BUNDLE_VERSION}'")
+                    sys.exit(1)
+                zip_file_in.extractall(bundle_dir)
+
+            entries = {}
+            for entry in manifest.resources:
+                entries.setdefault(entry.kind, []).append(entry)
+
+            results = []
+            connection_ids = {}
+            for kind in WORKSPACE_IMPORT_ORDER:
+                kind_entries = entries.get(kind)
+                if not kind_entries:
+                    continue
+                logger.info(f"Importing {len(kind_entries)} {kind} resources")
+                # the controllers create their clients lazily, so a client is created before the pool rather than
+                # by several workers at once
+                match kind:
+                    case WorkspaceResourceKind.CONNECTION:
+                        results += self._import_resources(kind, kind_entries, lambda entry: self._import_connection(bundle_dir, entry), concurrency)
+                        connection_ids = self._get_connection_id_rebinding(manifest)
+                    case WorkspaceResourceKind.MODEL:
+                        self.models_controller.get_models_client()
+                        results += self._import_resources(kind, kind_entries, lambda entry: self._import_model(bundle_dir, entry, connection_ids), concurrency)
+                    case WorkspaceResourceKind.MODEL_POLICY:
+                        self.models_controller.get_model_policies_client()
+                        results += self._import_resources(kind, kind_entries, lambda entry: self._import_model_policy(bundle_dir, entry), concurrency)
+                    case WorkspaceResourceKind.KNOWLEDGE_BASE:
+                        self.knowledge_base_controller.get_client()
+                        results += self._import_resources(kind, kind_entries, lambda entry: self._import_knowledge_base(bundle_dir, entry), concurrency)
+                    case WorkspaceResourceKind.TOOLKIT:
+                        results += self._import_resources(kind, kind_entries, self._import_toolkit, concurrency)
+                    case WorkspaceResourceKind.TOOL:
+                        results += self._import_tools(bundle_dir, kind_entries, connection_ids, concurrency)
+                    case WorkspaceResourceKind.AGENT:
+                        results += self._import_agents(bundle_dir, kind_entries, concurrency)
+
+        print_import_summary(results, title="Workspace import summary", resource_name="resources")
+        if import_failed(results):
+            sys.exit(1)
+        return results
+
+    def _import_resources(self, kind: WorkspaceResourceKind, entries: List[WorkspaceManifestEntry], import_fn: Callable[[WorkspaceManifestEntry], ImportStatus], max_workers: int) -> List[ImportResult]:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._import_resource, kind, entry, import_fn) for entry in entries]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _import_resource(kind: WorkspaceResourceKind, entry: WorkspaceManifestEntry, import_fn: Callable[[WorkspaceManifestEntry], ImportStatus]) -> ImportResult:
+        start = time.perf_counter()
+        error = None
+        try:
+            status = import_fn(entry)
+        # the import helpers of the other commands exit on invalid resources, which should only fail this resource
+        except (Exception, SystemExit) as e:
+            return WorkspaceController._failed_result(kind, entry.name, e, time.perf_counter() - start)
+
+        return ImportResult(
+            kind=str(kind),
+            name=entry.name,
+            status=status,
+            duration=time.perf_counter() - start
+        )
+
+    @staticmethod
+    def _failed_result(kind: WorkspaceResourceKind, name: str, e: BaseException, duration: float) -> ImportResult:
+        error = describe_import_error(e)
+        logger.error(f"Failed to import {kind} '{name}': {error}")
+        return ImportResult(kind=str(kind), name=name, status=ImportStatus.FAILED, duration=duration, error=error)
+
+    @staticmethod
+    def _get_connection_id_rebinding(manifest: WorkspaceManifest) -> dict[str, str]:
+        """Maps the connection ids of the exported workspace to the ids of the connections with the same app_id in the active env."""
+        target_connection_ids = {connection.app_id: connection.connection_id for connection in get_connections_client().list() if connection.app_id and connection.connection_id}
+        return {
+            connection_id: target_connection_ids[app_id]
+            for connection_id, app_id in manifest.connections.items()
+            if app_id in target_connection_ids
+        }
+
+    @staticmethod
+    def _rebind_connection_id(connection_id: str | None, connection_ids: dict[str, str], resource_name: str) -> str | None:
+        if not connection_id:
+            return connection_id
+        if connection_id not in connection_ids:
+            logger.warning(f"No connection found in the active env for connection '{connection_id}' used by '{resource_name}'")
+            return connection_id
+        return connection_ids[connection_id]
+
+    @staticmethod
+    def _read_spec(bundle_dir: str, entry: WorkspaceManifestEntry) -> dict:
+        with open(Path(bundle_dir) / entry.path, "r") as f:
+            if entry.path.endswith(".json"):
+                return json.load(f)
+            return yaml.load(f, Loader=yaml.SafeLoader)
+
+    @staticmethod
+    def _import_connection(bundle_dir: str, entry: WorkspaceManifestEntry) -> ImportStatus:
+        import_connection(file=str(Path(bundle_dir) / entry.path))
+        return ImportStatus.IMPORTED
+
+    def _import_model(self, bundle_dir: str, entry: WorkspaceManifestEntry, connection_ids: dict[str, str]) -> ImportStatus:
+        model = create_model_from_spec(self._read_spec(bundle_dir, entry))
+        model.connection_id = self._rebind_connection_id(model.connection_id, connection_ids, model.name)
+        self.models_controller.publish_or_update_models(model)
+        return ImportStatus.IMPORTED
+
+    def _import_model_policy(self, bundle_dir: str, entry: WorkspaceManifestEntry) -> ImportStatus:
+        self.models_controller.publish_or_update_model_policies(create_policy_from_spec(self._read_spec(bundle_dir, entry)))
+        return ImportStatus.IMPORTED
+
+    def _import_knowledge_base(self, bundle_dir: str, entry: WorkspaceManifestEntry) -> ImportStatus:
+        self.knowledge_base_controller.import_knowledge_base(file=str(Path(bundle_dir) / entry.path), app_id=None)
+        return ImportStatus.IMPORTED
+
+    @staticmethod
+    def _import_toolkit(entry: WorkspaceManifestEntry) -> ImportStatus:
+        logger.warning(f"Skipping toolkit '{entry.name}', toolkit packages are not included in workspace bundles. Import it with `orchestrate toolkits import`")
+        return ImportStatus.SKIPPED
+
+    def _import_tools(self, bundle_dir: str, entries: List[WorkspaceManifestEntry], connection_ids: dict[str, str], concurrency: int) -> List[ImportResult]:
+        results = []
+        tools = []
+        artifacts = {}
+        flow_entries = []
+        for entry in entries:
+            start = time.perf_counter()
+            try:
+                tool_spec = self._read_spec(bundle_dir, entry)
+                if _get_tool_kind(tool_spec) == ToolKind.flow:
+                    flow_entries.append(entry)
+                    continue
+                self._rebind_tool_connections(tool_spec, connection_ids, entry.name)
+                tool = BaseTool(spec=ToolSpec.model_validate(tool_spec))
+            except (Exception, SystemExit) as e:
+                results.append(self._failed_result(WorkspaceResourceKind.TOOL, entry.name, e, time.perf_counter() - start))
+                continue
+            tools.append(tool)
+            artifacts[tool.__tool_spec__.name] = str(Path(bundle_dir) / entry.artifact) if entry.artifact else None
+
+        # flows are compiled tools, importing the flow model recreates the tool
+        results += self._import_resources(WorkspaceResourceKind.TOOL, flow_entries, lambda entry: self._import_flow_tool(bundle_dir, entry), concurrency)
+        if not tools:
+            return results
+
+        # the other tools are uploaded with their exported artifacts through the same path as `orchestrate tools import`
+        start = time.perf_counter()
+        try:
+            tool_results = self.tools_controller.bulk_publish_or_update_tools(tools, max_workers=concurrency, artifacts=artifacts, print_summary=False)
+        except (Exception, SystemExit) as e:
+            duration = time.perf_counter() - start
+            return results + [self._failed_result(WorkspaceResourceKind.TOOL, tool.__tool_spec__.name, e, duration) for tool in tools]
+
+        return results + [result.model_copy(update={"kind": str(WorkspaceResourceKind.TOOL)}) for result in tool_results]
+
+    def _rebind_tool_connections(self, tool_spec: dict, connection_ids: dict[str, str], tool_name: str) -> None:
+        binding = tool_spec.get("binding") or {}
+        for kind in (ToolKind.python, ToolKind.langflow):
+            connections = (binding.get(kind.value) or {}).get("connections")
+            if connections:
+                binding[kind.value]["connections"] = {app_id: self._rebind_connection_id(connection_id, connection_ids, tool_name) for app_id, connection_id in connections.items()}
+        if binding.get(ToolKind.openapi.value):
+            binding[ToolKind.openapi.value]["connection_id"] = self._rebind_connection_id(binding[ToolKind.openapi.value].get("connection_id"), connection_ids, tool_name)
+
+    @staticmethod
+    def _import_flow_tool(bundle_dir: str, entry: WorkspaceManifestEntry) -> ImportStatus:
+        with zipfile.ZipFile(Path(bundle_dir) / entry.artifact, "r") as artifact:
+            flow_model = json.loads(artifact.read(artifact.namelist()[0]))
+        run_coroutine_sync(import_flow_model(flow_model))
+        return ImportStatus.IMPORTED
+
+    def _import_agents(self, bundle_dir: str, entries: List[WorkspaceManifestEntry], concurrency: int) -> List[ImportResult]:
+        results = []
+        agents = []
+        # like every other resource, an invalid agent only fails that agent rather than the whole import
+        for entry in entries:
+            start = time.perf_counter()
+            try:
+                agents += AgentsController.import_agent(file=str(Path(bundle_dir) / entry.path), app_id=None)
+            except (Exception, SystemExit) as e:
+                results.append(self._failed_result(WorkspaceResourceKind.AGENT, entry.name, e, time.perf_counter() - start))
+
+        if not agents:
+            return results
+
+        # agents are imported in waves so collaborators in the bundle are created before the agents that use them
+        start = time.perf_counter()
+        try:
+            agent_results = self.agents_controller.bulk_publish_or_update_agents(agents, max_workers=concurrency, print_summary=False)
+        except (Exception, SystemExit) as e:
+            duration = time.perf_counter() - start
+            return results + [self._failed_result(WorkspaceResourceKind.AGENT, agent.name, e, duration) for agent in agents]
+
+        return results + [result.model_copy(update={"kind": str(WorkspaceResourceKind.AGENT)}) for result in agent_results]
@@ -1,6 +1,15 @@
+import logging
 from enum import Enum
+from typing import Any, Callable, Iterable, List, Optional
+import requests
+import rich
+from pydantic import BaseModel
 from rich.table import Table
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+
 class ListFormats(str, Enum):
     Table = "table"
     JSON = "json"
@@ -11,6 +20,66 @@ class ListFormats(str, Enum):
     def __repr__(self):
         return repr(self.value)
 
+class ImportStatus(str, Enum):
+    CREATED = 'created'
+    UPDATED = 'updated'
+    IMPORTED = 'imported'
+    SKIPPED = 'skipped'
+    FAILED = 'failed'
+
+    def __str__(self):
+        return str(self.value)
+
+
+class ImportResult(BaseModel):
+    """The outcome of importing one resource in a bulk import."""
+    name: str
+    kind: Optional[str] = None
+    status: ImportStatus
+    duration: float
+    error: Optional[str] = None
+
+
+def describe_import_error(e: BaseException) -> str:
+    """
+        Describes why importing a resource failed. The import helpers of the commands exit on invalid resources, so
+        SystemExit is described as well.
+    """
+    if isinstance(e, requests.HTTPError) and e.response is not None:
+        return e.response.text
+    if isinstance(e, SystemExit):
+        return f"Exited with code {e.code}"
+    return str(e)
+
+
+def import_failed(results: Iterable[ImportResult]) -> bool:
+    return any(result.status == ImportStatus.FAILED for result in results)
+
+
+def print_import_summary(results: List[ImportResult], title: str, resource_name: str) -> None:
+    """
+        Prints a table of the results of a bulk import, with a kind column if any result has a kind, and logs how many
+        resources failed
+
+        Args:
+            results: The result of each imported resource
+            title: The title of the table
+            resource_name: The plural name of the resources, used in the failure message
+    """
+    show_kind = any(result.kind for result in results)
+    table = Table(show_header=True, header_style="bold white", title=title)
+    for column in ["Name"] + (["Kind"] if show_kind else []) + ["Status", "Duration (s)", "Error"]:
+        table.add_column(column, overflow="fold")
+    for result in results:
+        kind = [result.kind or ""] if show_kind else []
+        table.add_row(result.name, *kind, str(result.status), f"{result.duration:.2f}", result.error or "")
+    rich.print(table)
+
+    failed = [result for result in results if result.status == ImportStatus.FAILED]
+    if failed:
+        logger.error(f"{len(failed)} of {len(results)} {resource_name} failed to import")
+
+
 def rich_table_to_markdown(table: Table) -> str:
     headers = [column.header for column in table.columns]
     cols = [[cell for cell in col.cells] for col in table.columns]
@@ -23,4 +92,103 @@ def rich_table_to_markdown(table: Table) -> str:
     # # Data rows
     for row in rows:
         md += "| " + " | ".join(row) + " |\n"
-    return md
\ No newline at end of file
+    return md
+
+
+def get_all_unique_resources(items: Iterable[Any], target_attr: str) -> List[str]:
+    """
+        Given a list of objects get all the unique values of a certain field
+        Example: agent1.tools = [1 ,2 ,3] and agent2.tools = [2, 4, 5] then return [1, 2, 3, 4, 5]
+        Example: agent1.id = "123" and agent2.id = "456" then return ["123", "456"]
+
+        Args:
+            items: List of objects (agents, toolkits, tool specs, ...)
+            target_attr: The name of the field to access and get unique elements
+
+        Returns:
+            A list of unique elements from across all objects
+    """
+    all_ids = set()
+    for item in items:
+        attr_value = getattr(item, target_attr, None)
+        if attr_value:
+            if isinstance(attr_value, list):
+                all_ids.update(attr_value)
+            else:
+                all_ids.add(attr_value)
+    return list(all_ids)
+
+def construct_lookup_table(resource_list: List[dict | BaseModel], key_attr: str, value_attr: str) -> dict:
+    """
+        Given a list of dictionaries build a key -> value look up table
+        Example [{id: 1, name: obj1}, {id: 2, name: obj2}] return {1: obj1, 2: obj2}
+
+        Args:
+            resource_list: A list of dictionries from which to build the lookup table from
+            key_attr: The name of the field whose value will form the key of the lookup table
+            value_attr: The name of the field whose value will form the value of the lookup table
+
+        Returns:
+            A lookup table
+    """
+    lut = {}
+    for resource in resource_list:
+        if isinstance(resource, BaseModel):
+            resource = resource.model_dump()
+        lut[resource.get(key_attr, None)] = resource.get(value_attr, None)
+    return lut
+
+def lookup_resource_value(
+        item: Any,
+        lookup_table: dict[str, str],
+        target_attr: str,
+        target_attr_display_name: str
+    ) -> List[str] | str | None:
+    """
+    Using a lookup table convert all the strings in a given field of an object into their equivalent in the lookup table
+    Example: lookup_table={1: obj1, 2: obj2} agent=Agent(tools=[1,2]) return. [obj1, obj2]
+
+    Args:
+        item: An object holding the field to convert
+        lookup_table: A dictionary that maps one value to another
+        target_attr: The field to convert on the provided object
+        target_attr_display_name: The name of the field to be displayed in the event of an error
+    """
+    attr_value = getattr(item, target_attr, None)
+    if not attr_value:
+        return
+
+    if isinstance(attr_value, list):
+        new_resource_list=[]
+        for value in attr_value:
+            if value in lookup_table:
+                new_resource_list.append(lookup_table[value])
+            else:
+                logger.warning(f"{target_attr_display_name} with ID '{value}' not found. Returning {target_attr_display_name} ID")
+                new_resource_list.append(value)
+        return new_resource_list
+    else:
+        if attr_value in lookup_table:
+            return lookup_table[attr_value]
+        else:
+            logger.warning(f"{target_attr_display_name} with ID '{attr_value}' not found. Returning {target_attr_display_name} ID")
+            return attr_value
+
+def batch_request_resource(client_fn: Callable[[List[str]], List[Any]], ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Any]:
+    """
+        Fetches resources for a list of ids in chunks of batch_size using a bulk client method
+        such as ToolClient.get_drafts_by_ids
+
+        Args:
+            client_fn: A client method that takes a list of ids and returns the matching resources
+            ids: The ids to resolve
+            batch_size: The maximum number of ids sent per request
+
+        Returns:
+            The concatenated resources from every batch
+    """
+    resources = []
+    for i in range(0, len(ids), batch_size):
+        chunk = ids[i:i + batch_size]
+        resources += (client_fn(chunk))
+    return resources
@@ -1,8 +1,18 @@
 import os
 import logging
+import stat
+import tempfile
+import threading
 import yaml
+from contextlib import contextmanager
 from copy import deepcopy
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
 from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
 from enum import Enum
@@ -62,6 +72,17 @@ AUTH_CONFIG_FILE_CONTENT = {
 
 logger = logging.getLogger(__name__)
 
+# Parsed config files of this process by path, along with the (inode, mtime, size) of the file they were parsed from.
+# Saves replace the file atomically, so any change made by another process gives the file a new inode.
+_config_cache: dict[str, tuple[tuple[int, int, int], dict]] = {}
+_config_cache_lock = threading.Lock()
+
+
+def clear_config_cache() -> None:
+    """Drops the parsed config files, so they are parsed again on their next read."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
 
 def merge_configs(source: dict, destination: dict) -> dict:
     if source:
@@ -91,6 +112,33 @@ def clear_protected_env_credentials_token():
         auth_cfg.delete(AUTH_SECTION_HEADER, PROTECTED_ENV_NAME, AUTH_MCSP_TOKEN_OPT)
 
 
+def _get_file_version(file_path: str) -> tuple[int, int, int] | None:
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
+
+
+@contextmanager
+def _file_lock(file_path: str):
+    """Holds an exclusive lock on file_path.lock, so concurrent cli processes do not interleave their updates of file_path."""
+    with open(f"{file_path}.lock", 'a+') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
 class ConfigFileTypes(str, Enum):
     AUTH = 'auth'
     CONFIG = 'config'
@@ -118,22 +166,21 @@ class Config:
             self.create_config_file()
 
         # Check if file has defaults
-        with open(self.config_file_path, 'r') as conf_file:
-            config_data = yaml_safe_load(conf_file) or {}
-            if self.file_type == ConfigFileTypes.CONFIG:
-                if not config_data.get(ENVIRONMENTS_SECTION_HEADER, {}).get(PROTECTED_ENV_NAME, False):
-                    logger.debug("Setting default config data")
-                    self.create_defaults(DEFAULT_CONFIG_FILE_CONTENT)
-
-                if not config_data.get(PYTHON_REGISTRY_HEADER, {}).get(PYTHON_REGISTRY_TYPE_OPT, False):
-                    self.create_defaults({
-                        PYTHON_REGISTRY_HEADER: DEFAULT_CONFIG_FILE_CONTENT.get(PYTHON_REGISTRY_HEADER, {})
-                    })
-
-            elif self.file_type == ConfigFileTypes.AUTH:
-                if PROTECTED_ENV_NAME not in set(config_data.get(AUTH_SECTION_HEADER, {}).keys()):
-                    logger.debug("Setting default credentials data")
-                    self.create_defaults(AUTH_CONFIG_FILE_CONTENT)
+        config_data = self._load()
+        if self.file_type == ConfigFileTypes.CONFIG:
+            if not (config_data.get(ENVIRONMENTS_SECTION_HEADER) or {}).get(PROTECTED_ENV_NAME, False):
+                logger.debug("Setting default config data")
+                self.create_defaults(DEFAULT_CONFIG_FILE_CONTENT)
+
+            if not (config_data.get(PYTHON_REGISTRY_HEADER) or {}).get(PYTHON_REGISTRY_TYPE_OPT, False):
+                self.create_defaults({
+                    PYTHON_REGISTRY_HEADER: DEFAULT_CONFIG_FILE_CONTENT.get(PYTHON_REGISTRY_HEADER, {})
+                })
+
+        elif self.file_type == ConfigFileTypes.AUTH:
+            if PROTECTED_ENV_NAME not in set((config_data.get(AUTH_SECTION_HEADER) or {}).keys()):
+                logger.debug("Setting default credentials data")
+                self.create_defaults(AUTH_CONFIG_FILE_CONTENT)
 
     def create_config_file(self) -> None:
         logger.info(f'Creating config file at location "{self.config_file_path}"')
@@ -141,6 +188,56 @@ class Config:
         os.makedirs(os.path.dirname(self.config_file_path), exist_ok=True)
         open(self.config_file_path, 'a').close()
 
+    def _load(self) -> dict:
+        """
+        Returns the parsed config file, only parsing it again if it changed since it was last parsed by this process.
+        The returned data is shared, so it must be copied before being modified or handed out.
+        """
+        file_version = _get_file_version(self.config_file_path)
+        if file_version is None:
+            return {}
+
+        with _config_cache_lock:
+            cached = _config_cache.get(self.config_file_path)
+        if cached is not None and cached[0] == file_version:
+            return cached[1]
+
+        try:
+            with open(self.config_file_path, 'r') as conf_file:
+                config_data = yaml_safe_load(conf_file) or {}
+        except FileNotFoundError:
+            return {}
+
+        with _config_cache_lock:
+            _config_cache[self.config_file_path] = (file_version, config_data)
+        return config_data
+
+    def _dump(self, config_data: dict) -> None:
+        """Writes config_data to a temporary file which then replaces the config file, so readers never see a partial file."""
+        config_file_mode = None
+        try:
+            config_file_mode = stat.S_IMODE(os.stat(self.config_file_path).st_mode)
+        except FileNotFoundError:
+            pass
+
+        fd, temp_path = tempfile.mkstemp(dir=self.config_file_folder, prefix=f".{self.config_file}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as temp_file:
+                yaml.dump(config_data, temp_file, allow_unicode=True)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            if config_file_mode is not None:
+                os.chmod(temp_path, config_file_mode)
+            os.replace(temp_path, self.config_file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        file_version = _get_file_version(self.config_file_path)
+        with _config_cache_lock:
+            _config_cache[self.config_file_path] = (file_version, config_data)
+
     def create_defaults(self, default_content):
         self.save(default_content)
 
@@ -152,12 +249,8 @@ class Config:
 
     def read(self, section: str, option: str) -> any:
         try:
-            with open(self.config_file_path, "r") as conf_file:
-                config_data = yaml.load(conf_file, Loader=yaml.SafeLoader)
-                if config_data is None:
-                    return None
-                return config_data[section][option]
-        except KeyError:
+            return deepcopy(self._load()[section][option])
+        except (KeyError, TypeError):
             return None
 
     def write(self, section: str, option: str, value: any) -> None:
@@ -167,17 +260,9 @@ class Config:
         self.save(obj)
 
     def save(self, object: dict) -> None:
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
-
-        config_data = merge_configs(config_data, object)
-
-        with open(self.config_file_path, 'w') as conf_file:
-            yaml.dump(config_data, conf_file, allow_unicode=True)
+        with _file_lock(self.config_file_path):
+            config_data = merge_configs(self._load(), object)
+            self._dump(config_data)
 
     def get(self, *args):
         """
@@ -186,22 +271,17 @@ class Config:
         as keys to access deeper sections of the config and then returning the last specified key.
         """
 
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
+        config_data = self._load()
 
         if len(args) < 1:
-            return config_data
+            return deepcopy(config_data)
 
         try:
             nested_dict = config_data
             for key in args[:-1]:
                 nested_dict = nested_dict[key]
 
-            return nested_dict[args[-1]]
+            return deepcopy(nested_dict[args[-1]])
         except KeyError as e:
             raise KeyError(f"Failed to get data from config. Key {e} not in {list(nested_dict.keys())}")
 
@@ -214,50 +294,32 @@ class Config:
         if len(args) < 1:
             raise BadRequest("Config.delete() requires at least one positional argument")
 
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
-
-        try:
-            deletion_data = deepcopy(config_data)
-            nested_dict = deletion_data
-            for key in args[:-1]:
-                nested_dict = nested_dict[key]
+        with _file_lock(self.config_file_path):
+            try:
+                deletion_data = deepcopy(self._load())
+                nested_dict = deletion_data
+                for key in args[:-1]:
+                    nested_dict = nested_dict[key]
 
-            del (nested_dict[args[-1]])
-        except KeyError as e:
-            raise KeyError(f"Failed to delete from config. Key {e} not in {list(nested_dict.keys())}")
+                del (nested_dict[args[-1]])
+            except KeyError as e:
+                raise KeyError(f"Failed to delete from config. Key {e} not in {list(nested_dict.keys())}")
 
-        with open(self.config_file_path, 'w') as conf_file:
-            yaml.dump(deletion_data, conf_file, allow_unicode=True)
+            self._dump(deletion_data)
 
     def exists(self, *args) -> bool:
         """
         Determines if an item of arbitrary depth exists in the config file.
         Takes an arbitrary number of args. Uses the args in order
-        as keys to access deeper sections of the config and then deleting the last specified key.
+        as keys to access deeper sections of the config and then checking the last specified key.
         """
         if len(args) < 1:
-            raise BadRequest("Config.delete() requires at least one positional argument")
+            raise BadRequest("Config.exists() requires at least one positional argument")
 
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
-
-        expression = "config_data"
+        nested_dict = self._load()
         for key in args:
-            temp = eval(expression)
-
-            if not isinstance(temp, dict) or key not in temp:
+            if not isinstance(nested_dict, dict) or key not in nested_dict:
                 return False
-
-            else:
-                expression += f"['{key}']"
+            nested_dict = nested_dict[key]
 
         return True
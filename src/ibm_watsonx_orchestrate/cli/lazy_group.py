@@ -0,0 +1,43 @@
+import importlib
+from typing import NamedTuple, Optional
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazySubcommand(NamedTuple):
+    # "package.module:attribute" of the typer.Typer (or click command) implementing the command
+    import_path: str
+    help: Optional[str] = None
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    A command group whose subcommands are only imported when they are looked up, so running a command only pays for
+    importing the command group that is invoked rather than every command group of the cli.
+
+    Subclasses declare their subcommands in lazy_subcommands, in the order they should be listed in the help.
+    """
+    lazy_subcommands: dict[str, LazySubcommand] = {}
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        commands = super().list_commands(ctx)
+        return commands + [name for name in self.lazy_subcommands if name not in commands]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = self._load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str):
+        subcommand = self.lazy_subcommands[cmd_name]
+        module_name, attribute = subcommand.import_path.split(":")
+        target = getattr(importlib.import_module(module_name), attribute)
+
+        command = typer.main.get_command(target) if isinstance(target, typer.Typer) else target
+        command.name = cmd_name
+        if subcommand.help is not None:
+            command.help = subcommand.help
+        return command
@@ -2,50 +2,45 @@
 import typer
 import sys
 
-from ibm_watsonx_orchestrate.cli.commands.connections.connections_command import connections_app
-from ibm_watsonx_orchestrate.cli.commands.login.login_command import login_app
-from ibm_watsonx_orchestrate.cli.commands.settings.settings_command import settings_app
-from ibm_watsonx_orchestrate.cli.commands.tools.tools_command import tools_app
-from ibm_watsonx_orchestrate.cli.commands.agents.agents_command import agents_app
-from ibm_watsonx_orchestrate.cli.commands.server.server_command import server_app
-from ibm_watsonx_orchestrate.cli.commands.chat.chat_command import chat_app
-from ibm_watsonx_orchestrate.cli.commands.models.models_command import models_app
-from ibm_watsonx_orchestrate.cli.commands.environment.environment_command import environment_app
-from ibm_watsonx_orchestrate.cli.commands.partners.partners_command import partners_app
-from ibm_watsonx_orchestrate.cli.commands.channels.channels_command import channel_app
-from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_command import knowledge_bases_app
-from ibm_watsonx_orchestrate.cli.commands.toolkit.toolkit_command import toolkits_app
-from ibm_watsonx_orchestrate.cli.commands.evaluations.evaluations_command import evaluation_app
-from ibm_watsonx_orchestrate.cli.commands.copilot.copilot_command import copilot_app
-from ibm_watsonx_orchestrate.cli.commands.voice_configurations.voice_configurations_command import voice_configurations_app
+from ibm_watsonx_orchestrate.cli.lazy_group import LazySubcommand, LazyTyperGroup
 from ibm_watsonx_orchestrate.cli.init_helper import init_callback
 
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+# Command groups are only imported when invoked, so running one command does not import every command's dependencies
+COMMANDS = {
+    "login": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.login.login_command:login_app"),
+    "env": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.environment.environment_command:environment_app", help='Add, remove, or select the activate env other commands will interact with (either your local server or a production instance)'),
+    "agents": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.agents.agents_command:agents_app", help='Interact with the agents in your active env'),
+    "tools": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.tools.tools_command:tools_app", help='Interact with the tools in your active env'),
+    "toolkits": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.toolkit.toolkit_command:toolkits_app", help="Interact with the toolkits in your active env"),
+    "knowledge-bases": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_command:knowledge_bases_app", help="Upload knowledge your agents can search through to your active env"),
+    "connections": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.connections.connections_command:connections_app", help='Interact with the agents in your active env'),
+    "voice-configs": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.voice_configurations.voice_configurations_command:voice_configurations_app", help="Configure voice providers to enable voice interaction with your agents"),
+    "server": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.server.server_command:server_app", help='Manipulate your local Orchestrate Developer Edition server [requires entitlement]'),
+    "chat": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.chat.chat_command:chat_app", help='Launch the chat ui for your local Developer Edition server [requires entitlement]'),
+    "models": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.models.models_command:models_app", help='List the available large language models (llms) that can be used in your agent definitions'),
+    "channels": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.channels.channels_command:channel_app", help="Configure channels where your agent can exist on (such as embedded webchat)"),
+    "evaluations": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.evaluations.evaluations_command:evaluation_app", help='Evaluate the performance of your agents in your active env'),
+    "copilot": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.copilot.copilot_command:copilot_app", help='Access AI powered assistance to help refine your agents'),
+    "settings": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.settings.settings_command:settings_app", help='Configure the settings for your active env'),
+    "workspace": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.workspace.workspace_command:workspace_app", help='Export or import a snapshot of every resource in your active env, for example to promote it to another env'),
+    "partners": LazySubcommand("ibm_watsonx_orchestrate.cli.commands.partners.partners_command:partners_app", help='Generate a well-structured, submission-ready agent artifact package for partner-built agents'),
+}
+
+
+class OrchestrateGroup(LazyTyperGroup):
+    lazy_subcommands = COMMANDS
+
+
 app = typer.Typer(
+    cls=OrchestrateGroup,
     no_args_is_help=True,
     pretty_exceptions_enable=False,
     callback=init_callback
 )
 
-app.add_typer(login_app)
-app.add_typer(environment_app, name="env", help='Add, remove, or select the activate env other commands will interact with (either your local server or a production instance)')
-app.add_typer(agents_app, name="agents", help='Interact with the agents in your active env')
-app.add_typer(tools_app, name="tools", help='Interact with the tools in your active env')
-app.add_typer(toolkits_app, name="toolkits", help="Interact with the toolkits in your active env")
-app.add_typer(knowledge_bases_app, name="knowledge-bases", help="Upload knowledge your agents can search through to your active env")
-app.add_typer(connections_app, name="connections", help='Interact with the agents in your active env')
-app.add_typer(voice_configurations_app, name="voice-configs", help="Configure voice providers to enable voice interaction with your agents")
-app.add_typer(server_app, name="server", help='Manipulate your local Orchestrate Developer Edition server [requires entitlement]')
-app.add_typer(chat_app, name="chat", help='Launch the chat ui for your local Developer Edition server [requires entitlement]')
-app.add_typer(models_app, name="models", help='List the available large language models (llms) that can be used in your agent definitions')
-app.add_typer(channel_app, name="channels", help="Configure channels where your agent can exist on (such as embedded webchat)")
-app.add_typer(evaluation_app, name="evaluations", help='Evaluate the performance of your agents in your active env')
-app.add_typer(copilot_app, name="copilot", help='Access AI powered assistance to help refine your agents')
-app.add_typer(settings_app, name="settings", help='Configure the settings for your active env')
-app.add_typer(partners_app, name="partners", help='Generate a well-structured, submission-ready agent artifact package for partner-built agents')
-
 if __name__ == "__main__":
     app()
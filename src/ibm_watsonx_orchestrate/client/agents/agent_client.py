@@ -1,10 +1,11 @@
-from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
+from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, AsyncBaseAPIClient, ClientAPIException
 from typing_extensions import List, Optional
 from enum import Enum
 
 from ibm_watsonx_orchestrate.client.utils import is_local_dev
 from pydantic import BaseModel
 import time
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -183,4 +184,90 @@ class AgentClient(BaseAPIClient):
     def get_environments_for_agent(self, agent_id: str):
         return self._get(f"{self.base_endpoint}/{agent_id}/environment")
 
-    
+
+class AsyncAgentClient(AsyncBaseAPIClient):
+    """
+    Async client to handle CRUD operations for Native Agent endpoint
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_endpoint = "/orchestrate/agents" if is_local_dev(self.base_url) else "/agents"
+
+    async def create(self, payload: dict) -> AgentUpsertResponse:
+        response = await self._post(self.base_endpoint, data=transform_agents_from_flat_agent_spec(payload))
+        return AgentUpsertResponse.model_validate(response)
+
+    async def get(self) -> dict:
+        return transform_agents_to_flat_agent_spec(await self._get(f"{self.base_endpoint}?include_hidden=true"))
+
+    async def update(self, agent_id: str, data: dict) -> AgentUpsertResponse:
+        response = await self._patch(f"{self.base_endpoint}/{agent_id}", data=transform_agents_from_flat_agent_spec(data))
+        return AgentUpsertResponse.model_validate(response)
+
+    async def delete(self, agent_id: str) -> dict:
+        return await self._delete(f"{self.base_endpoint}/{agent_id}")
+
+    async def get_draft_by_name(self, agent_name: str) -> List[dict]:
+        return await self.get_drafts_by_names([agent_name])
+
+    async def get_drafts_by_names(self, agent_names: List[str]) -> List[dict]:
+        formatted_agent_names = [f"names={x}" for x  in agent_names]
+        return transform_agents_to_flat_agent_spec(await self._get(f"{self.base_endpoint}?{'&'.join(formatted_agent_names)}&include_hidden=true"))
+
+    async def get_draft_by_id(self, agent_id: str) -> List[dict]:
+        if agent_id is None:
+            return ""
+        else:
+            try:
+                agent = transform_agents_to_flat_agent_spec(await self._get(f"{self.base_endpoint}/{agent_id}"))
+                return agent
+            except ClientAPIException as e:
+                if e.response.status_code == 404 and ("not found with the given name" in e.response.text or ("Agent" in e.response.text and "not found" in e.response.text)):
+                    return ""
+                raise(e)
+
+    async def get_drafts_by_ids(self, agent_ids: List[str]) -> List[dict]:
+        formatted_agent_ids = [f"ids={x}" for x  in agent_ids]
+        return transform_agents_to_flat_agent_spec(await self._get(f"{self.base_endpoint}?{'&'.join(formatted_agent_ids)}&include_hidden=true"))
+
+    async def poll_release_status(self, agent_id: str, environment_id: str, mode: str = "deploy") -> bool:
+        expected_status = {
+            ReleaseMode.DEPLOY: ReleaseStatus.SUCCESS,
+            ReleaseMode.UNDEPLOY: ReleaseStatus.NONE
+        }[mode]
+
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = await self._get(
+                    f"{self.base_endpoint}/{agent_id}/releases/status?environment_id={environment_id}"
+                )
+            except Exception as e:
+                logger.error(f"Polling for Deployment/Undeployment failed on attempt {attempt + 1}: {e}")
+                return False
+
+            if not isinstance(response, dict):
+                logger.warning(f"Invalid response format: {response}")
+                return False
+
+            status = response.get("deployment_status")
+
+            if status == expected_status:
+                return True
+            elif status == "failed":
+                return False
+
+            await asyncio.sleep(POLL_INTERVAL)
+
+        logger.warning(f"{mode.capitalize()} status polling timed out")
+        return False
+
+    async def deploy(self, agent_id: str, environment_id: str) -> bool:
+        await self._post(f"{self.base_endpoint}/{agent_id}/releases", data={"environment_id": environment_id})
+        return await self.poll_release_status(agent_id, environment_id, mode=ReleaseMode.DEPLOY)
+
+    async def undeploy(self, agent_id: str, version: str, environment_id: str) -> bool:
+        await self._post(f"{self.base_endpoint}/{agent_id}/releases/{version}/undeploy")
+        return await self.poll_release_status(agent_id, environment_id, mode=ReleaseMode.UNDEPLOY)
+
+    async def get_environments_for_agent(self, agent_id: str):
+        return await self._get(f"{self.base_endpoint}/{agent_id}/environment")
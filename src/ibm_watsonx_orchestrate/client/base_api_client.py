@@ -1,10 +1,106 @@
 import json
 from ibm_watsonx_orchestrate.utils.exceptions import BadRequest
 import requests
+import httpx
 from abc import ABC, abstractmethod
 from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator
 from typing_extensions import List
 from contextlib import contextmanager
+from threading import Lock
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+_SESSION_SETTINGS = {
+    "pool_connections": DEFAULT_POOL_CONNECTIONS,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+    "max_retries": DEFAULT_MAX_RETRIES,
+    "backoff_factor": DEFAULT_BACKOFF_FACTOR,
+    "status_forcelist": DEFAULT_RETRY_STATUS_CODES,
+}
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = Lock()
+
+
+def _session_key(base_url: str) -> str:
+    parsed = urlparse(base_url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def _build_session() -> requests.Session:
+    # Only idempotent methods are retried (urllib3 default), so a failed POST is never replayed
+    retry = Retry(
+        total=_SESSION_SETTINGS["max_retries"],
+        backoff_factor=_SESSION_SETTINGS["backoff_factor"],
+        status_forcelist=_SESSION_SETTINGS["status_forcelist"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_SESSION_SETTINGS["pool_connections"],
+        pool_maxsize=_SESSION_SETTINGS["pool_maxsize"],
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def get_session(base_url: str) -> requests.Session:
+    """
+    Returns the keep-alive session shared by every client talking to the same scheme and host.
+    Sessions are created lazily and reused for the lifetime of the process.
+    """
+    key = _session_key(base_url)
+    session = _SESSIONS.get(key)
+    if session is not None:
+        return session
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _build_session()
+            _SESSIONS[key] = session
+        return session
+
+
+def close_sessions() -> None:
+    """
+    Closes all shared sessions and their pooled connections.
+    """
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+def configure_sessions(
+    pool_connections: int | None = None,
+    pool_maxsize: int | None = None,
+    max_retries: int | None = None,
+    backoff_factor: float | None = None,
+    status_forcelist: tuple[int, ...] | None = None,
+) -> None:
+    """
+    Tunes the connection pool and retry policy used by the shared sessions.
+    Existing sessions are closed so the new settings apply to subsequent requests.
+    """
+    overrides = {
+        "pool_connections": pool_connections,
+        "pool_maxsize": pool_maxsize,
+        "max_retries": max_retries,
+        "backoff_factor": backoff_factor,
+        "status_forcelist": status_forcelist,
+    }
+    with _SESSIONS_LOCK:
+        _SESSION_SETTINGS.update({k: v for k, v in overrides.items() if v is not None})
+    close_sessions()
 
 @contextmanager
 def ssl_handler():
@@ -17,6 +113,10 @@ def ssl_handler():
         else:
             reason = error_message
         raise BadRequest(f"SSL handshake failed for request '{e.request.path_url}'. Reason: '{reason}'")
+    except httpx.ConnectError as e:
+        if "CERTIFICATE_VERIFY_FAILED" not in str(e):
+            raise
+        raise BadRequest(f"SSL handshake failed for request '{e.request.url.path}'. Reason: '{e}'")
 
 
 class ClientAPIException(requests.HTTPError):
@@ -53,6 +153,10 @@ class BaseAPIClient:
         else:
             self.base_url = f"{self.base_url}/v1"
 
+    @property
+    def session(self) -> requests.Session:
+        return get_session(self.base_url)
+
     def _get_headers(self) -> dict:
         headers = {}
         if self.api_key:
@@ -64,7 +168,7 @@ class BaseAPIClient:
     def _get(self, path: str, params: dict = None, data=None, return_raw=False) -> dict:
         url = f"{self.base_url}{path}"
         with ssl_handler():
-            response = requests.get(url, headers=self._get_headers(), params=params, data=data, verify=self.verify)
+            response = self.session.get(url, headers=self._get_headers(), params=params, data=data, verify=self.verify)
         self._check_response(response)
         if not return_raw:
             return response.json()
@@ -74,14 +178,14 @@ class BaseAPIClient:
     def _post(self, path: str, data: dict = None, files: dict = None) -> dict:
         url = f"{self.base_url}{path}"
         with ssl_handler():
-            response = requests.post(url, headers=self._get_headers(), json=data, files=files, verify=self.verify)
+            response = self.session.post(url, headers=self._get_headers(), json=data, files=files, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
     
     def _post_nd_json(self, path: str, data: dict = None, files: dict = None) -> List[dict]:
         url = f"{self.base_url}{path}"
         with ssl_handler():
-            response = requests.post(url, headers=self._get_headers(), json=data, files=files)
+            response = self.session.post(url, headers=self._get_headers(), json=data, files=files)
         self._check_response(response)
 
         res = []
@@ -94,7 +198,7 @@ class BaseAPIClient:
         url = f"{self.base_url}{path}"
         with ssl_handler():
             # Use data argument instead of json so data is encoded as application/x-www-form-urlencoded
-            response = requests.post(url, headers=self._get_headers(), data=data, files=files, verify=self.verify)
+            response = self.session.post(url, headers=self._get_headers(), data=data, files=files, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
 
@@ -102,28 +206,28 @@ class BaseAPIClient:
 
         url = f"{self.base_url}{path}"
         with ssl_handler():
-            response = requests.put(url, headers=self._get_headers(), json=data, verify=self.verify)
+            response = self.session.put(url, headers=self._get_headers(), json=data, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
 
     def _patch(self, path: str, data: dict = None) -> dict:
         url = f"{self.base_url}{path}"
         with ssl_handler():
-            response = requests.patch(url, headers=self._get_headers(), json=data, verify=self.verify)
+            response = self.session.patch(url, headers=self._get_headers(), json=data, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
     
     def _patch_form_data(self, path: str, data: dict = None, files = None) -> dict:
         url = f"{self.base_url}{path}"
         with ssl_handler():
-            response = requests.patch(url, headers=self._get_headers(), data=data, files=files, verify=self.verify)
+            response = self.session.patch(url, headers=self._get_headers(), data=data, files=files, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
 
     def _delete(self, path: str, data=None) -> dict:
         url = f"{self.base_url}{path}"
         with ssl_handler():
-            response = requests.delete(url, headers=self._get_headers(), json=data, verify=self.verify)
+            response = self.session.delete(url, headers=self._get_headers(), json=data, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
 
@@ -147,4 +251,138 @@ class BaseAPIClient:
 
     @abstractmethod
     def get(self, *args, **kwargs):
-        raise NotImplementedError("get method of the client must be implemented")
\ No newline at end of file
+        raise NotImplementedError("get method of the client must be implemented")
+
+class AsyncBaseAPIClient:
+    """
+    Asynchronous counterpart of BaseAPIClient built on httpx.AsyncClient.
+
+    The underlying httpx client is created lazily on first use and keeps its connection pool
+    until aclose() is called, or the client is used as an async context manager.
+    """
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str = None,
+        is_local: bool = False,
+        verify: str = None,
+        authenticator: MCSPAuthenticator = None,
+        max_connections: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float | None = None,
+        transport: httpx.AsyncBaseTransport | None = None
+    ):
+        self.base_url = base_url.rstrip("/")  # remove trailing slash
+        self.api_key = api_key
+        self.authenticator = authenticator
+        self.is_local = is_local
+        self.verify = verify
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+        if not self.is_local:
+            self.base_url = f"{self.base_url}/v1/orchestrate"
+        else:
+            self.base_url = f"{self.base_url}/v1"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                verify=self.verify if self.verify is not None else True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+                transport=self._transport
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_headers(self) -> dict:
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        elif self.authenticator:
+            headers["Authorization"] = f"Bearer {self.authenticator.token_manager.get_token()}"
+        return headers
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        url = f"{self.base_url}{path}"
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        with ssl_handler():
+            response = await self.client.request(method, url, headers=self._get_headers(), **kwargs)
+        self._check_response(response)
+        return response
+
+    async def _get(self, path: str, params: dict = None, data=None, return_raw=False) -> dict:
+        response = await self._request("GET", path, params=params, data=data)
+        if not return_raw:
+            return response.json()
+        else:
+            return response
+
+    async def _post(self, path: str, data: dict = None, files: dict = None) -> dict:
+        # mirrors requests, which drops the json body when files are sent as multipart
+        response = await self._request("POST", path, json=None if files else data, files=files)
+        return response.json() if response.text else {}
+
+    async def _post_nd_json(self, path: str, data: dict = None, files: dict = None) -> List[dict]:
+        response = await self._request("POST", path, json=None if files else data, files=files)
+
+        res = []
+        if response.text:
+            for line in response.text.splitlines():
+                res.append(json.loads(line))
+        return res
+
+    async def _post_form_data(self, path: str, data: dict = None, files: dict = None) -> dict:
+        response = await self._request("POST", path, data=data, files=files)
+        return response.json() if response.text else {}
+
+    async def _put(self, path: str, data: dict = None) -> dict:
+        response = await self._request("PUT", path, json=data)
+        return response.json() if response.text else {}
+
+    async def _patch(self, path: str, data: dict = None) -> dict:
+        response = await self._request("PATCH", path, json=data)
+        return response.json() if response.text else {}
+
+    async def _patch_form_data(self, path: str, data: dict = None, files = None) -> dict:
+        response = await self._request("PATCH", path, data=data, files=files)
+        return response.json() if response.text else {}
+
+    async def _delete(self, path: str, data=None) -> dict:
+        response = await self._request("DELETE", path, json=data)
+        return response.json() if response.text else {}
+
+    def _check_response(self, response: httpx.Response):
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise ClientAPIException(request=e.request, response=e.response)
+
+    @abstractmethod
+    async def create(self, *args, **kwargs):
+        raise NotImplementedError("create method of the client must be implemented")
+
+    @abstractmethod
+    async def delete(self, *args, **kwargs):
+        raise NotImplementedError("delete method of the client must be implemented")
+
+    @abstractmethod
+    async def update(self, *args, **kwargs):
+        raise NotImplementedError("update method of the client must be implemented")
+
+    @abstractmethod
+    async def get(self, *args, **kwargs):
+        raise NotImplementedError("get method of the client must be implemented")
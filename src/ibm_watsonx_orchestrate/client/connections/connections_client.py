@@ -1,10 +1,11 @@
+import asyncio
 from typing import List
 
 from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator
 from pydantic import BaseModel, ValidationError
 from typing import Optional
 
-from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
+from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, AsyncBaseAPIClient, ClientAPIException
 from ibm_watsonx_orchestrate.agent_builder.connections.types import ConnectionEnvironment, ConnectionPreference, ConnectionConfiguration, ConnectionAuthType, ConnectionSecurityScheme, IdpConfigData, AppConfigData, ConnectionType, FetchConfigAuthTypes
 from ibm_watsonx_orchestrate.client.utils import is_cpd_env, is_local_dev
 
@@ -180,4 +181,119 @@ class ConnectionsClient(BaseAPIClient):
         except ClientAPIException as e:
             if e.response.status_code == 404:
                 return []
-            raise e
\ No newline at end of file
+            raise e
+
+
+class AsyncConnectionsClient(AsyncBaseAPIClient):
+    """
+    Async client to handle CRUD operations for Connections endpoint
+    """
+    def __init__(self, base_url: str, api_key: str = None, is_local: bool = False, verify: str = None, authenticator: MCSPAuthenticator = None, **kwargs):
+        super(AsyncConnectionsClient, self).__init__(base_url, api_key, is_local, verify, authenticator, **kwargs)
+        if is_local_dev(base_url):
+            self.base_url = f"{base_url.rstrip('/')}/api/v1/orchestrate"
+        else:
+            self.base_url = f"{base_url.rstrip('/')}/v1/orchestrate"
+
+    async def create(self, payload: dict) -> None:
+        await self._post("/connections/applications", data=payload)
+
+    async def delete(self, app_id: str) -> dict:
+        return await self._delete(f"/connections/applications/{app_id}")
+
+    async def get(self, app_id: str) -> GetConnectionResponse | None:
+        try:
+            return GetConnectionResponse.model_validate(await self._get(f"/connections/applications?app_id={app_id}"))
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    async def list(self) -> List[ListConfigsResponse]:
+        try:
+            res = await self._get(f"/connections/applications?include_details=true")
+            return [ListConfigsResponse.model_validate(conn) for conn in res.get("applications", [])]
+        except ValidationError as e:
+            logger.error("Recieved unexpected response from server")
+            raise e
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return []
+            raise e
+
+    async def create_config(self, app_id: str, payload: dict) -> None:
+        await self._post(f"/connections/applications/{app_id}/configurations", data=payload)
+
+    async def update_config(self, app_id: str, env: ConnectionEnvironment, payload: dict) -> None:
+        await self._patch(f"/connections/applications/{app_id}/configurations/{env}", data=payload)
+
+    async def get_config(self, app_id: str, env: ConnectionEnvironment) -> GetConfigResponse:
+        try:
+            res = await self._get(f"/connections/applications/{app_id}/configurations/{env}")
+            return GetConfigResponse.model_validate(res)
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    async def create_credentials(self, app_id: str, env: ConnectionEnvironment, payload: dict, use_app_credentials: bool) -> None:
+        if use_app_credentials:
+            await self._post(f"/connections/applications/{app_id}/configs/{env}/credentials", data=payload)
+        else:
+            await self._post(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials", data=payload)
+
+    async def update_credentials(self, app_id: str, env: ConnectionEnvironment, payload: dict, use_app_credentials: bool) -> None:
+        if use_app_credentials:
+            await self._patch(f"/connections/applications/{app_id}/configs/{env}/credentials", data=payload)
+        else:
+            await self._patch(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials", data=payload)
+
+    async def get_credentials(self, app_id: str, env: ConnectionEnvironment, use_app_credentials: bool) -> dict:
+        try:
+            if use_app_credentials:
+                return await self._get(f"/connections/applications/{app_id}/credentials/{env}")
+            else:
+                return await self._get(f"/connections/applications/runtime_credentials?app_id={app_id}&env={env}")
+        except ClientAPIException as e:
+            # Returns 400 when app creds exist but runtime cred don't yet exist
+            if e.response.status_code == 404 or e.response.status_code == 400:
+                return None
+            raise e
+
+    async def delete_credentials(self, app_id: str, env: ConnectionEnvironment, use_app_credentials: bool) -> None:
+        if use_app_credentials:
+            await self._delete(f"/connections/applications/{app_id}/configs/{env}/credentials")
+        else:
+            await self._delete(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials")
+
+    async def get_draft_by_app_id(self, app_id: str) -> GetConnectionResponse:
+        return await self.get(app_id=app_id)
+
+    async def get_draft_by_app_ids(self, app_ids: List[str]) -> List[GetConnectionResponse]:
+        connections = await asyncio.gather(*(self.get_draft_by_app_id(app_id) for app_id in app_ids))
+        return [connection for connection in connections if connection]
+
+    async def get_draft_by_id(self, conn_id) -> str:
+        """Retrieve the app ID for a given connection ID."""
+        if conn_id is None:
+            return ""
+        try:
+            app_details = await self._get(f"/connections/applications?connection_id={conn_id}")
+            return app_details.get("app_id")
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                logger.warning(f"Connections not found. Returning connection ID: {conn_id}")
+                return conn_id
+            raise e
+
+    async def get_drafts_by_ids(self, conn_ids) -> List[ListConfigsResponse]:
+        try:
+            res = await self._get(f"/connections/applications?connectionIds={','.join(conn_ids)}")
+            return [ListConfigsResponse.model_validate(conn) for conn in res.get("applications", [])]
+        except ValidationError as e:
+            logger.error("Recieved unexpected response from server")
+            raise e
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return []
+            raise e
@@ -1,4 +1,4 @@
-from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
+from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, AsyncBaseAPIClient, ClientAPIException
 import json
 from typing_extensions import List
 from ibm_watsonx_orchestrate.client.utils import is_local_dev
@@ -49,7 +49,49 @@ class KnowledgeBaseClient(BaseAPIClient):
 
     def delete(self, knowledge_base_id: str,) -> dict:
         return self._delete(f"{self.base_endpoint}/{knowledge_base_id}")
-        
-    
 
-    
+
+class AsyncKnowledgeBaseClient(AsyncBaseAPIClient):
+    """
+    Async client to handle CRUD operations for Native Knowledge Base endpoint
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_endpoint = "/orchestrate/knowledge-bases" if is_local_dev(self.base_url) else "/knowledge-bases"
+
+    async def create(self, payload: dict) -> dict:
+        return await self._post_form_data(f"{self.base_endpoint}/documents", data=payload)
+
+    async def create_built_in(self, payload: dict, files: list) -> dict:
+        return await self._post_form_data(f"{self.base_endpoint}/documents", data=payload, files=files)
+
+    async def get(self) -> dict:
+        return await self._get(self.base_endpoint)
+
+    async def get_by_name(self, name: str) -> List[dict]:
+        kbs = await self.get_by_names([name])
+        return None if len(kbs) == 0 else kbs[0]
+
+    async def get_by_id(self, knowledge_base_id: str) -> dict:
+        return await self._get(f"{self.base_endpoint}/{knowledge_base_id}")
+
+    async def get_by_names(self, names: List[str]) -> List[dict]:
+        formatted_names = [f"names={x}" for x in names]
+        return await self._get(f"{self.base_endpoint}?{'&'.join(formatted_names)}")
+
+    async def get_by_ids(self, ids: List[str]) -> List[dict]:
+        formatted_names = [f"ids={x}" for x in ids]
+        return await self._get(f"{self.base_endpoint}?{'&'.join(formatted_names)}")
+
+    async def status(self, knowledge_base_id: str) -> dict:
+        return await self._get(f"{self.base_endpoint}/{knowledge_base_id}/status")
+
+    async def update(self, knowledge_base_id: str, payload: dict) -> dict:
+        return await self._patch_form_data(f"{self.base_endpoint}/{knowledge_base_id}/documents", data=payload)
+
+    async def update_with_documents(self, knowledge_base_id: str, payload: dict, files: list) -> dict:
+        return await self._patch_form_data(f"{self.base_endpoint}/{knowledge_base_id}/documents", data=payload, files=files)
+
+    async def delete(self, knowledge_base_id: str,) -> dict:
+        return await self._delete(f"{self.base_endpoint}/{knowledge_base_id}")
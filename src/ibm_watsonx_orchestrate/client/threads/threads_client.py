@@ -1,4 +1,35 @@
-from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, AsyncBaseAPIClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_MAX_PAGES = 1000
+
+
+def _first_message_id(page: list):
+    return page[0].get("id") if page and isinstance(page[0], dict) else None
+
+
+def _add_page(messages: list, page: list, previous_page: list | None, page_size: int) -> bool:
+    """
+    Adds a page of messages and returns whether there are more pages. Besides a short or empty page, a page longer
+    than page_size or starting with the same message as the previous page ends the pagination, as the server then
+    ignores limit or offset and further requests would only repeat messages.
+    """
+    if not page:
+        return False
+    if previous_page and _first_message_id(page) is not None and _first_message_id(page) == _first_message_id(previous_page):
+        return False
+    messages.extend(page)
+    return len(page) == page_size
+
+
+def _warn_max_pages(thread_id, max_pages: int) -> None:
+    logger.warning(f"Stopped fetching the messages of thread '{thread_id}' after {max_pages} pages, the remaining messages are not included")
 
 
 class ThreadsClient(BaseAPIClient):
@@ -13,22 +44,114 @@ class ThreadsClient(BaseAPIClient):
     def get_all_threads(self, agent_id) -> dict:
         return self._get(self.base_endpoint, params={"agent_id": agent_id})
 
-    def get_thread_messages(self, thread_id) -> dict:
-        return self._get(f"{self.base_endpoint}/{thread_id}/messages")
+    def get_thread_messages(self, thread_id, page_size: int | None = None, max_pages: int = DEFAULT_MAX_PAGES) -> dict:
+        """
+        get the messages of a single thread (chat)
+        :param thread_id:
+        :param page_size: when set, messages are fetched in pages of this size (limit/offset) and concatenated
+        :param max_pages: maximum number of pages fetched when page_size is set
+        :return:
+        """
+        if page_size is None:
+            return self._get(f"{self.base_endpoint}/{thread_id}/messages")
+
+        messages = []
+        previous_page = None
+        for _ in range(max_pages):
+            page = self._get(f"{self.base_endpoint}/{thread_id}/messages", params={"limit": page_size, "offset": len(messages)})
+            if not isinstance(page, list):
+                return page
+            if not _add_page(messages, page, previous_page, page_size):
+                return messages
+            previous_page = page
+
+        _warn_max_pages(thread_id, max_pages)
+        return messages
 
     def get(self) -> dict:
         return self._get(self.base_endpoint)
 
-    def get_threads_messages(self, thread_ids: list[str]):
+    def get_threads_messages(
+        self,
+        thread_ids: list[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        page_size: int | None = None,
+        return_exceptions: bool = False
+    ):
         """
-        get the messages for a list of threads (chats) ids
+        get the messages for a list of threads (chats) ids concurrently, preserving the order of thread_ids
         :param thread_ids:
-        :param threads_client:
+        :param max_concurrency: maximum number of in-flight requests
+        :param page_size: page size used when fetching each thread's messages, None fetches each thread in one request
+        :param return_exceptions: when True a failed thread's exception is returned in its place instead of being raised
         :return:
         """
-        all_thread_messages = []
-        for thread_id in thread_ids:
-            thread_messages = self.get_thread_messages(thread_id=thread_id)
-            all_thread_messages.append(thread_messages)
+        def fetch(thread_id):
+            try:
+                return self.get_thread_messages(thread_id=thread_id, page_size=page_size)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        if max_concurrency <= 1 or len(thread_ids) <= 1:
+            return [fetch(thread_id) for thread_id in thread_ids]
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(thread_ids))) as executor:
+            return list(executor.map(fetch, thread_ids))
+
+
+class AsyncThreadsClient(AsyncBaseAPIClient):
+    """
+    Async client to handle read operations for Threads (chat history- trajectories) endpoints
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_endpoint = "/threads"
+
+    async def get_all_threads(self, agent_id) -> dict:
+        return await self._get(self.base_endpoint, params={"agent_id": agent_id})
+
+    async def get_thread_messages(self, thread_id, page_size: int | None = None, max_pages: int = DEFAULT_MAX_PAGES) -> dict:
+        if page_size is None:
+            return await self._get(f"{self.base_endpoint}/{thread_id}/messages")
+
+        messages = []
+        previous_page = None
+        for _ in range(max_pages):
+            page = await self._get(f"{self.base_endpoint}/{thread_id}/messages", params={"limit": page_size, "offset": len(messages)})
+            if not isinstance(page, list):
+                return page
+            if not _add_page(messages, page, previous_page, page_size):
+                return messages
+            previous_page = page
+
+        _warn_max_pages(thread_id, max_pages)
+        return messages
+
+    async def get(self) -> dict:
+        return await self._get(self.base_endpoint)
+
+    async def get_threads_messages(
+        self,
+        thread_ids: list[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        page_size: int | None = None,
+        return_exceptions: bool = False
+    ):
+        """
+        get the messages for a list of threads (chats) ids concurrently, preserving the order of thread_ids
+        :param thread_ids:
+        :param max_concurrency: maximum number of in-flight requests
+        :param page_size: page size used when fetching each thread's messages, None fetches each thread in one request
+        :param return_exceptions: when True a failed thread's exception is returned in its place instead of being raised
+        :return:
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(thread_id):
+            async with semaphore:
+                return await self.get_thread_messages(thread_id=thread_id, page_size=page_size)
 
-        return all_thread_messages
+        return list(await asyncio.gather(*(fetch(thread_id) for thread_id in thread_ids), return_exceptions=return_exceptions))
@@ -80,6 +80,11 @@ class ToolKitClient(BaseAPIClient):
 
         return self._get(f"/toolkits?{'&'.join(formatted_toolkit_names)}")
 
+    def get_drafts_by_ids(self, toolkit_ids: List[str]) -> List[dict]:
+        formatted_toolkit_ids = [f"ids={x}" for x in toolkit_ids]
+
+        return self._get(f"/toolkits?{'&'.join(formatted_toolkit_ids)}")
+
     
     def get_draft_by_id(self, toolkit_id: str) -> dict:
         if toolkit_id is None:
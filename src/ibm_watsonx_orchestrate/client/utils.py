@@ -13,14 +13,15 @@ from ibm_watsonx_orchestrate.cli.config import (
     ENVIRONMENTS_SECTION_HEADER,
     ENV_WXO_URL_OPT,
     BYPASS_SSL,
-    VERIFY
+    VERIFY,
+    clear_config_cache
 )
 from threading import Lock
-from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient
-from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, AsyncBaseAPIClient
 from ibm_watsonx_orchestrate.cli.commands.channels.types import RuntimeEnvironmentType
 import logging
 from typing import TypeVar
+from functools import lru_cache
 import os
 import jwt
 import time
@@ -28,7 +29,10 @@ import sys
 
 logger = logging.getLogger(__name__)
 LOCK = Lock()
-T = TypeVar("T", bound=BaseAPIClient)
+T = TypeVar("T", bound=BaseAPIClient | AsyncBaseAPIClient)
+
+# Client instances keyed by (client class, env, url, token, ssl settings)
+_CLIENT_CACHE: dict[tuple, BaseAPIClient] = {}
 
 def get_current_env_url() -> str:
     cfg = Config()
@@ -105,10 +109,14 @@ def get_environment() -> str:
         return RuntimeEnvironmentType.AWS
     return None
 
+@lru_cache(maxsize=32)
+def _decode_token_expiry(token: str) -> int | None:
+    token_claimset = jwt.decode(token, options={"verify_signature": False})
+    return token_claimset.get('exp')
+
 def check_token_validity(token: str) -> bool:
     try:
-        token_claimset = jwt.decode(token, options={"verify_signature": False})
-        expiry = token_claimset.get('exp')
+        expiry = _decode_token_expiry(token)
 
         current_timestamp = int(time.time())
         # Check if the token is not expired (or will not be expired in 10 minutes)
@@ -118,31 +126,27 @@ def check_token_validity(token: str) -> bool:
     except:
         return False
 
+def clear_client_cache() -> None:
+    with LOCK:
+        clear_config_cache()
+        _CLIENT_CACHE.clear()
+
 
 def instantiate_client(client: type[T] , url: str | None=None) -> T:
     try:
         with LOCK:
-            with open(os.path.join(DEFAULT_CONFIG_FILE_FOLDER, DEFAULT_CONFIG_FILE), "r") as f:
-                config = yaml_safe_load(f)
-            active_env = config.get(CONTEXT_SECTION_HEADER, {}).get(CONTEXT_ACTIVE_ENV_OPT)
-            bypass_ssl = (
-                config.get(ENVIRONMENTS_SECTION_HEADER, {})
-                    .get(active_env, {})
-                    .get(BYPASS_SSL, None)
-            )
-
-            verify = (
-                config.get(ENVIRONMENTS_SECTION_HEADER, {})
-                    .get(active_env, {})
-                    .get(VERIFY, None)
-            )
+            # Config only parses a file again once it changed, so warm calls do not read the yaml files
+            config = Config(config_file_folder=DEFAULT_CONFIG_FILE_FOLDER, config_file=DEFAULT_CONFIG_FILE)
+            active_env = config.read(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT)
+            env_config = config.read(ENVIRONMENTS_SECTION_HEADER, active_env) or {}
+            bypass_ssl = env_config.get(BYPASS_SSL, None)
+            verify = env_config.get(VERIFY, None)
 
             if not url:
-                url = config.get(ENVIRONMENTS_SECTION_HEADER, {}).get(active_env, {}).get(ENV_WXO_URL_OPT)
+                url = env_config.get(ENV_WXO_URL_OPT)
 
-            with open(os.path.join(AUTH_CONFIG_FILE_FOLDER, AUTH_CONFIG_FILE), "r") as f:
-                auth_config = yaml_safe_load(f)
-            auth_settings = auth_config.get(AUTH_SECTION_HEADER, {}).get(active_env, {})
+            auth_config = Config(config_file_folder=AUTH_CONFIG_FILE_FOLDER, config_file=AUTH_CONFIG_FILE)
+            auth_settings = auth_config.read(AUTH_SECTION_HEADER, active_env) or {}
 
             if not active_env:
                 logger.error("No active environment set. Use `orchestrate env activate` to activate an environment")
@@ -157,6 +161,13 @@ def instantiate_client(client: type[T] , url: str | None=None) -> T:
             if not check_token_validity(token):
                 logger.error(f"The token found for environment '{active_env}' is missing or expired. Use `orchestrate env activate {active_env}` to fetch a new one")
                 exit(1)
+
+            # Async clients hold an event-loop bound connection pool so they are never shared
+            cacheable = issubclass(client, BaseAPIClient)
+            cache_key = (client, active_env, url, token, bypass_ssl, verify)
+            if cacheable and cache_key in _CLIENT_CACHE:
+                return _CLIENT_CACHE[cache_key]
+
             is_cpd = is_cpd_env(url)
             if is_cpd:
                 if bypass_ssl is True:
@@ -168,6 +179,9 @@ def instantiate_client(client: type[T] , url: str | None=None) -> T:
             else:
                 client_instance = client(base_url=url, api_key=token, is_local=is_local_dev(url))
 
+            if cacheable:
+                _CLIENT_CACHE[cache_key] = client_instance
+
         return client_instance
     except FileNotFoundError as e:
         message = "No active environment found. Please run `orchestrate env activate` to activate an environment"
@@ -3,7 +3,7 @@ from .constants import START, END, RESERVED
 from ..types import FlowContext, TaskData, TaskEventType, DocProcInput, DecisionsCondition, DecisionsRule
 from ..node import UserNode, AgentNode, StartNode, EndNode, PromptNode, ToolNode, DecisionsNode
 
-from .flow import Flow, CompiledFlow, FlowRun, FlowEvent, FlowEventType, FlowFactory, MatchPolicy, WaitPolicy, ForeachPolicy, Branch, Foreach, Loop
+from .flow import Flow, CompiledFlow, FlowRun, FlowRunResult, FlowEvent, FlowEventType, FlowFactory, MatchPolicy, WaitPolicy, ForeachPolicy, Branch, Foreach, Loop
 from .decorators import flow
 from ..data_map import Assignment, DataMap
 
@@ -34,6 +34,7 @@ __all__ = [
     "Flow",    
     "CompiledFlow",
     "FlowRun",
+    "FlowRunResult",
     "FlowEvent",
     "FlowEventType",
     "FlowFactory",
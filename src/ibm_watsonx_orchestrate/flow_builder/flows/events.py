@@ -1,9 +1,13 @@
-import redis
-import time
+import asyncio
 import json
+import logging
+import weakref
 from dotenv import load_dotenv
 import os
 
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+
 from typing import (
     AsyncIterator, TypeVar, Union
 )
@@ -14,37 +18,258 @@ from ..types import (
     FlowEventType, TaskEventType, FlowEvent, FlowContext
 )
 
-class StreamConsumer:
-    def __init__(self, instance_id: str):
-        
+logger = logging.getLogger(__name__)
+
+STREAM_PREFIX = "tempus:"
+DEFAULT_BLOCK_MS = 5000
+DEFAULT_DISPATCHER_BLOCK_MS = 1000
+DEFAULT_BATCH_COUNT = 100
+DEFAULT_SUBSCRIPTION_MAX_EVENTS = 1000
+DEFAULT_MAX_CONNECTIONS = 512
+DEFAULT_INITIAL_BACKOFF_SECONDS = 0.1
+DEFAULT_MAX_BACKOFF_SECONDS = 5.0
+
+# connection pools are bound to the event loop that created them, so they are shared per loop
+_CONNECTION_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, aioredis.ConnectionPool]]" = weakref.WeakKeyDictionary()
+
+
+def get_connection_pool(host: str, port: int, db: int, max_connections: int = DEFAULT_MAX_CONNECTIONS) -> aioredis.ConnectionPool:
+    """Returns the redis connection pool shared by every StreamConsumer on the running event loop."""
+    pools = _CONNECTION_POOLS.setdefault(asyncio.get_running_loop(), {})
+    key = (host, int(port), int(db))
+    if key not in pools:
+        pools[key] = aioredis.ConnectionPool(host=host, port=int(port), db=int(db), max_connections=max_connections)
+    return pools[key]
+
+
+class _RedisStreamReader:
+    """Redis settings and the lazily created client shared by the stream readers."""
+    def __init__(
+        self,
+        batch_count: int = DEFAULT_BATCH_COUNT,
+        block_ms: int = DEFAULT_BLOCK_MS,
+        max_backoff: float = DEFAULT_MAX_BACKOFF_SECONDS
+    ):
         load_dotenv()
         self.redis_host = os.getenv("REDIS_HOST", "localhost")
         self.redis_port = os.getenv("REDIS_PORT", 6379)
         self.redis_db = os.getenv("REDIS_DB", 0)
-        self.redis = redis.Redis(host=self.redis_host, port=self.redis_port, db=self.redis_db)
+        self.redis = None
+        self.batch_count = batch_count
+        self.block_ms = block_ms
+        self.max_backoff = max_backoff
+
+    def _get_redis(self) -> aioredis.Redis:
+        if self.redis is None:
+            self.redis = aioredis.Redis(connection_pool=get_connection_pool(self.redis_host, self.redis_port, self.redis_db))
+        return self.redis
+
+    async def _close_redis(self) -> None:
+        # the pool is shared, so only this reader's client is released
+        if self.redis is not None:
+            await self.redis.aclose(close_connection_pool=False)
+            self.redis = None
+
+
+class StreamConsumer(_RedisStreamReader):
+    def __init__(
+        self,
+        instance_id: str,
+        batch_count: int = DEFAULT_BATCH_COUNT,
+        block_ms: int = DEFAULT_BLOCK_MS,
+        max_backoff: float = DEFAULT_MAX_BACKOFF_SECONDS
+    ):
+        super().__init__(batch_count=batch_count, block_ms=block_ms, max_backoff=max_backoff)
         self.instance_id = instance_id
-        self.stream_name = f"tempus:{self.instance_id}"
+        self.stream_name = get_stream_name(instance_id)
         self.last_processed_id = 0
-        
+
+    async def aclose(self) -> None:
+        await self._close_redis()
 
     async def consume(self) -> AsyncIterator[FlowEvent]:
-        
+        backoff = DEFAULT_INITIAL_BACKOFF_SECONDS
         while True:
             try:
-                # XREAD command: Read new messages from the stream
-                messages = self.redis.xread({self.stream_name: self.last_processed_id}, block=5000, count=10)
+                # XREAD returns as soon as new messages arrive, block only bounds how long an idle read waits
+                messages = await self._get_redis().xread(
+                    {self.stream_name: self.last_processed_id}, block=self.block_ms, count=self.batch_count
+                )
+            except (RedisConnectionError, RedisTimeoutError, OSError) as e:
+                logger.warning(f"Lost connection to event stream `{self.stream_name}`: {e}. Retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                continue
 
-                for stream, events in messages:
-                    for event_id, event_data in events:
-                        self.last_processed_id = event_id  # Update the last read event ID
+            backoff = DEFAULT_INITIAL_BACKOFF_SECONDS
+            for stream, events in messages:
+                for event_id, event_data in events:
+                    self.last_processed_id = event_id  # Update the last read event ID
+                    try:
                         flow_event = deserialize_flow_event(event_data)
-                        yield flow_event
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.error(f"Skipping malformed event `{event_id}` on stream `{self.stream_name}`: {e}")
+                        continue
+                    yield flow_event
+
+
+class StreamSubscription:
+    """
+    The events of one flow instance, routed to it by a StreamDispatcher. Mirrors the StreamConsumer interface.
+
+    At most max_events events are queued, the dispatcher stops reading the stream while the queue is full.
+    """
+    def __init__(self, dispatcher: "StreamDispatcher", instance_id: str, max_events: int = DEFAULT_SUBSCRIPTION_MAX_EVENTS):
+        self.dispatcher = dispatcher
+        self.instance_id = instance_id
+        self.stream_name = get_stream_name(instance_id)
+        self.queue: asyncio.Queue[Union[FlowEvent, BaseException]] = asyncio.Queue(maxsize=max_events)
+        self.error: BaseException | None = None
+
+    async def aclose(self) -> None:
+        self.dispatcher._unsubscribe(self.stream_name)
+
+    def _fail(self, error: BaseException) -> None:
+        # a full queue is drained first, the error is raised once it is empty
+        self.error = error
+        if not self.queue.full():
+            self.queue.put_nowait(error)
+
+    async def consume(self) -> AsyncIterator[FlowEvent]:
+        while True:
+            if self.error is not None and self.queue.empty():
+                raise self.error
+            item = await self.queue.get()
+            if isinstance(item, BaseException):
+                raise item
+            self.dispatcher._resume(self.stream_name)
+            yield item
 
+
+class StreamDispatcher(_RedisStreamReader):
+    """
+    Reads the event streams of every subscribed flow instance with a single XREAD on one connection and routes the
+    events to a queue per subscription, tracking the last processed id of each stream.
+
+    When the streams to read change, i.e. a stream is subscribed or a paused stream can be read again, a blocked read
+    is restarted so the change does not wait for block_ms. A stream is paused while its subscription's queue is full,
+    its remaining events stay in redis and are read once the subscriber catches up, so a slow subscriber neither
+    holds up the others nor grows its queue without bound.
+    """
+    def __init__(
+        self,
+        batch_count: int = DEFAULT_BATCH_COUNT,
+        block_ms: int = DEFAULT_DISPATCHER_BLOCK_MS,
+        max_backoff: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        max_events: int = DEFAULT_SUBSCRIPTION_MAX_EVENTS
+    ):
+        super().__init__(batch_count=batch_count, block_ms=block_ms, max_backoff=max_backoff)
+        self.max_events = max_events
+        self.last_processed_ids: dict[str, Union[int, bytes, str]] = {}
+        self._subscriptions: dict[str, StreamSubscription] = {}
+        self._paused: set[str] = set()
+        self._streams_changed = asyncio.Event()
+        self._read: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "StreamDispatcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def subscribe(self, instance_id: str) -> StreamSubscription:
+        stream_name = get_stream_name(instance_id)
+        if stream_name in self._subscriptions:
+            raise ValueError(f"Event stream `{stream_name}` already has a subscription")
+
+        subscription = StreamSubscription(self, instance_id, max_events=self.max_events)
+        self._subscriptions[stream_name] = subscription
+        self.last_processed_ids[stream_name] = 0
+        self._wake()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._dispatch())
+        return subscription
+
+    def _unsubscribe(self, stream_name: str) -> None:
+        # events of a stream unsubscribed while a read is in flight are dropped, so the read is not restarted
+        self._subscriptions.pop(stream_name, None)
+        self.last_processed_ids.pop(stream_name, None)
+        self._paused.discard(stream_name)
+
+    def _resume(self, stream_name: str) -> None:
+        if stream_name in self._paused:
+            self._paused.discard(stream_name)
+            self._wake()
+
+    def _wake(self) -> None:
+        self._streams_changed.set()
+        if self._read is not None and not self._read.done():
+            self._read.cancel()
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._close_redis()
+
+    async def _dispatch(self) -> None:
+        backoff = DEFAULT_INITIAL_BACKOFF_SECONDS
+        while True:
+            self._streams_changed.clear()
+            streams = {stream_name: last_id for stream_name, last_id in self.last_processed_ids.items() if stream_name not in self._paused}
+            if not streams:
+                await self._streams_changed.wait()
+                continue
+
+            self._read = asyncio.create_task(self._get_redis().xread(streams, block=self.block_ms, count=self.batch_count))
+            try:
+                await asyncio.wait({self._read})
+            finally:
+                if not self._read.done():
+                    # the dispatcher is closed
+                    self._read.cancel()
+            if self._read.cancelled():
+                # restarted by _wake to read the changed streams
+                continue
+
+            try:
+                messages = self._read.result()
+            except (RedisConnectionError, RedisTimeoutError, OSError) as e:
+                logger.warning(f"Lost connection to {len(streams)} event streams: {e}. Retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                continue
             except Exception as e:
-                print(f"Error occurred: {e}")
-                time.sleep(5)  # Wait for 5 seconds before retrying
+                logger.error(f"Event stream dispatcher stopped: {e}")
+                for subscription in self._subscriptions.values():
+                    subscription._fail(e)
+                raise
+
+            backoff = DEFAULT_INITIAL_BACKOFF_SECONDS
+            for stream, events in messages or []:
+                stream_name = stream.decode("utf-8") if isinstance(stream, bytes) else stream
+                subscription = self._subscriptions.get(stream_name)
+                if subscription is None:
+                    # unsubscribed while the read was in flight
+                    continue
+                for event_id, event_data in events:
+                    if subscription.queue.full():
+                        self._paused.add(stream_name)
+                        break
+                    self.last_processed_ids[stream_name] = event_id
+                    try:
+                        flow_event = deserialize_flow_event(event_data)
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.error(f"Skipping malformed event `{event_id}` on stream `{stream_name}`: {e}")
+                        continue
+                    subscription.queue.put_nowait(flow_event)
+
 
-            time.sleep(1)  # Sleep for 1 second before checking for new messages
+def get_stream_name(instance_id: str) -> str:
+    return f"{STREAM_PREFIX}{instance_id}"
 
 def deserialize_flow_event(byte_data: bytes) -> FlowEvent:
     """Deserialize byte data into a FlowEvent object."""
@@ -4,21 +4,24 @@ the Flow model.
 """
 
 import asyncio
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 import inspect
 from typing import (
-    Any, AsyncIterator, Callable, Optional, cast, List, Sequence, Union, Tuple
+    IO, Any, AsyncIterator, Callable, Iterable, Iterator, Optional, cast, List, Sequence, Union, Tuple
 )
 import json
 import logging
 import copy
+import hashlib
+import time
 import uuid
 import pytz
 import os
 
 from typing_extensions import Self
-from pydantic import BaseModel, Field, SerializeAsAny, create_model, TypeAdapter
+from pydantic import BaseModel, Field, PrivateAttr, SerializeAsAny, create_model, TypeAdapter
 import yaml
 from ibm_watsonx_orchestrate.agent_builder.tools.python_tool import PythonTool
 from ibm_watsonx_orchestrate.agent_builder.models.types import ListVirtualModel
@@ -42,12 +45,61 @@ from ..types import (
 )
 
 from ..data_map import DataMap
-from ..utils import _get_json_schema_obj, get_valid_name, import_flow_model, _get_tool_request_body, _get_tool_response_body
+from ..utils import (
+    _get_json_schema_obj, get_valid_name, import_flow_model, _get_tool_request_body, _get_tool_response_body,
+    compute_flow_model_hash, FLOW_CONTENT_HASH_KEY
+)
 
-from .events import StreamConsumer
+from .events import StreamConsumer, StreamDispatcher
+from .telemetry import FlowRunRecorder, FlowRunTimeline
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_REF_PREFIX = "#/schemas/"
+DEFAULT_INVOKE_MAX_CONCURRENCY = 16
+
+
+def _schema_fingerprint(schema: JsonSchemaObject) -> str:
+    '''Structural hash of a schema, ignoring its own title.'''
+    # properties may hold raw dicts (e.g. user field schemas), which serialize fine but would warn
+    dumped = schema.model_dump(exclude_none=True, exclude_unset=True, warnings=False)
+    dumped.pop("title", None)
+    return hashlib.sha256(json.dumps(dumped, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class _JsonObjectStream:
+    '''Lazily produced (key, value) pairs, written as a JSON object by _iter_json.'''
+    def __init__(self, items: Iterable[Tuple[str, Any]]):
+        self.items = items
+
+
+def _iter_json(value: Any, indent: int | None = None, level: int = 0) -> Iterator[str]:
+    '''
+    Yields the JSON encoding of value chunk by chunk. The output is identical to json.dumps(value, indent=indent),
+    but _JsonObjectStream values are encoded one member at a time so the whole document is never held in memory.
+    '''
+    if not isinstance(value, _JsonObjectStream):
+        encoded = json.dumps(value, indent=indent)
+        if indent is not None and level:
+            encoded = encoded.replace("\n", "\n" + " " * (indent * level))
+        yield encoded
+        return
+
+    if indent is None:
+        item_separator, newline, closing_newline = ", ", "", ""
+    else:
+        item_separator = ","
+        newline = "\n" + " " * (indent * (level + 1))
+        closing_newline = "\n" + " " * (indent * level)
+
+    yield "{"
+    first = True
+    for key, item in value.items:
+        yield ("" if first else item_separator) + newline + json.dumps(key) + ": "
+        yield from _iter_json(item, indent, level + 1)
+        first = False
+    yield ("" if first else closing_newline) + "}"
+
 # Mapping each event to its type
 EVENT_TYPE_MAP = {
     FlowEventType.ON_FLOW_START: "informational",
@@ -77,6 +129,9 @@ class Flow(Node):
     parent: Any = None
     _sequence_id: int = 0 # internal-id
     _tool_client: ToolClient = None
+    _schema_index: dict[tuple[str | None, str], str] = PrivateAttr(default_factory=dict) # (title, structural hash) -> schema title
+    _unhashed_schemas: dict[str, tuple[JsonSchemaObject, str]] = PrivateAttr(default_factory=dict) # title -> (schema as added, schema title), hashed on the first collision
+    _json_cache: dict[tuple[int, str], Any] | None = PrivateAttr(default=None) # (id of flow, section) -> serialized JSON fragment, set on the top most flow while reusing JSON
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -107,6 +162,39 @@ class Flow(Node):
             return self.parent._find_topmost_flow()
         return self
     
+    @contextmanager
+    def _reusing_json(self) -> Iterator[None]:
+        '''
+        Serializes the nodes, edges and schemas of this flow and its sub flows at most once within the block, so a spec
+        that is dumped several times in a row, e.g. hashed and then deployed, is not rebuilt each time. The flow must not
+        be edited within the block. Outside of it every call serializes the current flow.
+        '''
+        top_flow = self._find_topmost_flow()
+        if top_flow._json_cache is not None:
+            yield
+            return
+
+        top_flow._json_cache = {}
+        try:
+            yield
+        finally:
+            top_flow._json_cache = None
+
+    def _cached_json(self, section: str, serialize: Callable[[], Any]) -> Any:
+        '''Returns the JSON fragment of a section, serializing it only if it is not cached by _reusing_json.'''
+        json_cache = self._find_topmost_flow()._json_cache
+        if json_cache is None:
+            return serialize()
+
+        key = (id(self), section)
+        if key not in json_cache:
+            json_cache[key] = serialize()
+        return json_cache[key]
+
+    def _get_cached_json(self, section: str) -> Any | None:
+        json_cache = self._find_topmost_flow()._json_cache
+        return json_cache.get((id(self), section)) if json_cache is not None else None
+
     def _next_sequence_id(self) -> int: 
         self._sequence_id += 1
         return self._sequence_id
@@ -115,6 +203,10 @@ class Flow(Node):
         '''
         Adds a schema to the dictionary of schemas. If a schema with the same name already exists, it returns the existing schema. Otherwise, it creates a deep copy of the schema, adds it to the dictionary, and returns the new schema.
 
+        When a title collides, schemas are interned on the top most flow by (title, structural hash), so a shape that has
+        already been added is returned without another deep copy or deep compare, and does not produce a new `*_N` schema.
+        The structural hash is not computed for titles seen for the first time.
+
         Parameters:
         schema (JsonSchemaObject): The schema to be added.
         title (str, optional): The title of the schema. If not provided, it will be generated based on the schema's title or aliasName.
@@ -126,52 +218,55 @@ class Flow(Node):
         # find the top most flow and add the schema to that scope
         top_flow = self._find_topmost_flow()
 
-        # if there is already a schema with the same name, return it
-        if title:
-            if title in top_flow.schemas:
-                existing_schema = top_flow.schemas[title]
-                # we need a deep compare if the incoming schema and existing_schema is the same
-                # pydantic suppport nested comparison by default
+        if not schema:
+            return None
 
-                if isinstance(schema, dict):
-                    # recast schema to support direct access
-                    schema = JsonSchemaObject.model_validate(schema)
+        if isinstance(schema, dict):
+            # recast schema to support direct access
+            schema = JsonSchemaObject.model_validate(schema)
 
-                schema.title = title
-
-                if schema == existing_schema:
-                    return existing_schema
-                # we need to do a deep compare
-                incoming_model = schema.model_dump(exclude_none=True, exclude_unset=True)
-                existing_model = existing_schema.model_dump(exclude_none=True, exclude_unset=True)
+        # we should only add schema when it is a complex object
+        if schema.type != "object" and schema.type != "array":
+            return schema
 
-                # log the model
-                # logger.info(f"incoming_model: {incoming_model}")
-                # logger.info(f"existing_model: {existing_model}")
-
-                if incoming_model == existing_model:
+        if title:
+            base_title = title
+        elif schema.title:
+            base_title = get_valid_name(schema.title)
+        elif schema.aliasName:
+            base_title = get_valid_name(schema.aliasName)
+        else:
+            base_title = None
+
+        # the structural hash is only needed when the title collides with a schema that was already added
+        intern_key = None
+        if base_title is not None and base_title in top_flow.schemas:
+            first_added = top_flow._unhashed_schemas.pop(base_title, None)
+            if first_added is not None:
+                source, source_title = first_added
+                top_flow._schema_index[(base_title, _schema_fingerprint(source))] = source_title
+            fingerprint = _schema_fingerprint(schema)
+            intern_key = (base_title, fingerprint)
+            interned_title = top_flow._schema_index.get(intern_key)
+            if interned_title in top_flow.schemas:
+                if title:
+                    schema.title = title
+                return top_flow.schemas[interned_title]
+
+            # if there is already a schema with the same name but a different shape, we need a new name
+            if title:
+                existing_schema = top_flow.schemas[title]
+                schema.title = title
+                if schema == existing_schema or fingerprint == _schema_fingerprint(existing_schema):
+                    top_flow._schema_index[intern_key] = title
                     return existing_schema
-                
-                # else we need a new name, and create a new schema
                 title = title + "_" + str(self._next_sequence_id())
 
         # otherwise, create a deep copy of the schema, add it to the dictionary and return it
         if schema:
-            if isinstance(schema, dict):
-                # recast schema to support direct access
-                schema = JsonSchemaObject.model_validate(schema)
-            # we should only add schema when it is a complex object
-            if schema.type != "object" and schema.type != "array":
-                return schema
-
             new_schema = copy.deepcopy(schema)
             if not title:
-                if schema.title:
-                    title = get_valid_name(schema.title)
-                elif schema.aliasName:
-                    title = get_valid_name(schema.aliasName)
-                else:
-                    title = "bo_" + str(self._next_sequence_id())
+                title = base_title or "bo_" + str(self._next_sequence_id())
             
             if new_schema.type == "object":
             # iterate the properties and add schema recursively
@@ -206,6 +301,13 @@ class Flow(Node):
             # set the title
             new_schema.title = title
             top_flow.schemas[title] = new_schema
+            if intern_key is not None:
+                # a schema replaced under the same title must not be returned for its previous shape
+                for key in [key for key, value in top_flow._schema_index.items() if value == title]:
+                    del top_flow._schema_index[key]
+                top_flow._schema_index[intern_key] = title
+            elif base_title is not None:
+                top_flow._unhashed_schemas[base_title] = (schema, title)
 
             return new_schema
         return None
@@ -987,8 +1089,12 @@ class Flow(Node):
         validator = FlowValidator(flow=self)
         messages = validator.validate_model()
         if validator.no_error(messages):
+            for message in messages:
+                if message.kind == FlowValidationKind.WARNING:
+                    logger.warning(message.message)
             return True
-        raise ValueError(f"Invalid flow: {messages}")
+        errors = [message.message for message in messages if message.kind == FlowValidationKind.ERROR]
+        raise ValueError(f"Invalid flow: {errors}")
 
     def _check_compiled(self) -> None:
         if self.compiled:
@@ -1017,14 +1123,16 @@ class Flow(Node):
         self.compiled = True
         self.metadata["source_kind"] = "adk/python"
         self.metadata["compiled_on"] = datetime.now(pytz.utc).isoformat()
+        self.metadata[FLOW_CONTENT_HASH_KEY] = compute_flow_model_hash(self.to_json())
         return CompiledFlow(flow=self, **kwargs)
     
-    async def compile_deploy(self, **kwargs) -> "CompiledFlow":
+    async def compile_deploy(self, force: bool = False, **kwargs) -> "CompiledFlow":
         """
         Compile the current Flow model into a CompiledFlow object.
 
         This method validates the flow model (if not already validated), 
-        deploys it to the engine, and marks it as compiled. 
+        deploys it to the engine, and marks it as compiled. The deploy is skipped when the
+        content hash of the deployed model matches, unless force is set.
 
         You can use the compiled flow to start a flow run.
 
@@ -1036,41 +1144,38 @@ class Flow(Node):
             ValidationError: If the flow model is invalid and fails validation.
         """
         
-        compiled_flow = self.compile(**kwargs)
-        
-        # Deploy flow to the engine
-        model = self.to_json()
-        tool_id = await import_flow_model(model)
+        # the spec is serialized once for the content hash of compile and the deployed model
+        with self._reusing_json():
+            compiled_flow = self.compile(**kwargs)
+
+            # Deploy flow to the engine
+            model = self.to_json()
+        tool_id = await import_flow_model(model, force=force)
 
         compiled_flow.flow_id = tool_id
         compiled_flow.deployed = True
 
         return compiled_flow
 
-    def to_json(self) -> dict[str, Any]:
-        flow_dict = super().to_json()
-
-        # serialize nodes
-        nodes_dict = {}
-        for key, value in self.nodes.items():
-            nodes_dict[key] = value.to_json()
-        flow_dict["nodes"] = nodes_dict
+    def _nodes_to_json(self) -> dict[str, Any]:
+        return {key: value.to_json() for key, value in self.nodes.items()}
 
-        # serialize edges
-        flow_dict["edges"] = []
-        for edge in self.edges:
-            flow_dict["edges"].append(
-                edge.model_dump(mode="json", exclude_unset=True, exclude_none=True, by_alias=True))
+    def _edges_to_json(self) -> list[dict[str, Any]]:
+        return [edge.model_dump(mode="json", exclude_unset=True, exclude_none=True, by_alias=True) for edge in self.edges]
 
-        schema_dict = {}
-        for key, value in self.schemas.items():
-            schema_dict[key] = _to_json_from_json_schema(value)
-        flow_dict["schemas"] = schema_dict
+    def _schemas_to_json(self) -> dict[str, Any]:
+        return {key: _to_json_from_json_schema(value) for key, value in self.schemas.items()}
 
-        metadata_dict = {}
-        for key, value in self.metadata.items():
-            metadata_dict[key] = value
-        flow_dict["metadata"] = metadata_dict
+    def to_json(self) -> dict[str, Any]:
+        '''
+        Serializes the flow. Every call returns a new spec of the current flow, except within _reusing_json where the
+        nodes, edges and schemas fragments are shared between calls.
+        '''
+        flow_dict = super().to_json()
+        flow_dict["nodes"] = self._cached_json("nodes", self._nodes_to_json)
+        flow_dict["edges"] = self._cached_json("edges", self._edges_to_json)
+        flow_dict["schemas"] = self._cached_json("schemas", self._schemas_to_json)
+        flow_dict["metadata"] = dict(self.metadata)
 
         if self.output_map and "spec" in self.output_map:
             flow_dict["output_map"] = {
@@ -1078,6 +1183,47 @@ class Flow(Node):
             }
         return flow_dict
 
+    def _to_json_stream(self) -> _JsonObjectStream:
+        '''The same members as to_json(), with nodes and schemas that are not cached serialized one at a time.'''
+        def items() -> Iterator[Tuple[str, Any]]:
+            yield from Node.to_json(self).items()
+
+            cached_nodes = self._get_cached_json("nodes")
+            if cached_nodes is not None:
+                yield "nodes", cached_nodes
+            else:
+                yield "nodes", _JsonObjectStream(
+                    (key, value._to_json_stream() if isinstance(value, Flow) else value.to_json())
+                    for key, value in self.nodes.items())
+
+            yield "edges", self._cached_json("edges", self._edges_to_json)
+
+            cached_schemas = self._get_cached_json("schemas")
+            if cached_schemas is not None:
+                yield "schemas", cached_schemas
+            else:
+                yield "schemas", _JsonObjectStream(
+                    (key, _to_json_from_json_schema(value)) for key, value in self.schemas.items())
+
+            yield "metadata", dict(self.metadata)
+
+            if self.output_map and "spec" in self.output_map:
+                yield "output_map", {"spec": self.output_map["spec"].to_json()}
+
+        return _JsonObjectStream(items())
+
+    def write_json(self, fp: IO[str], indent: int | None = None) -> None:
+        '''
+        Writes the flow spec to a file object as JSON, one node at a time, without building the whole spec first.
+        The output is identical to json.dump(self.to_json(), fp, indent=indent).
+
+        Parameters:
+        fp (IO[str]): The text file object to write to.
+        indent (int, optional): The indentation passed on to json.
+        '''
+        for chunk in _iter_json(self._to_json_stream(), indent):
+            fp.write(chunk)
+
     def _get_node_id(self, node: Union[str, Node]) -> str:
         if isinstance(node, Node):
             node_id = node.spec.name
@@ -1121,6 +1267,9 @@ class FlowRun(BaseModel):
     debug: bool = False
     on_flow_end_handler: Callable = None
     on_flow_error_handler: Callable = None
+    client: TempusClient | None = Field(default=None, exclude=True, description="Shared client used to launch the run, created on demand if not set.")
+    dispatcher: StreamDispatcher | None = Field(default=None, exclude=True, description="Shared dispatcher to receive events from, a dedicated StreamConsumer is used if not set.")
+    recorder: FlowRunRecorder | None = Field(default=None, exclude=True, description="Opt-in recorder of the run timeline.")
 
     model_config = {
         "arbitrary_types_allowed": True
@@ -1132,32 +1281,48 @@ class FlowRun(BaseModel):
             raise ValueError("Flow has already been started")
 
         # Start the flow
-        client:TempusClient = instantiate_client(client=TempusClient)
+        client:TempusClient = self.client or instantiate_client(client=TempusClient)
         logger.info(f"Launching flow instance...")
-        ack = client.arun_flow(self.deployed_flow_id,input_data)
+        if self.recorder:
+            self.recorder.on_launch(self.flow.spec.name)
+        # the launch is a blocking http call, keep it off the event loop so concurrent runs are not serialized
+        ack = await asyncio.to_thread(client.arun_flow, self.deployed_flow_id, input_data)
         self.id=ack["instance_id"]
         self.name = f"{self.flow.spec.name}:{self.id}"
         self.status = FlowRunStatus.IN_PROGRESS
+        if self.recorder:
+            self.recorder.on_started(self.id)
         logger.info(f"Flow instance `{self.name}` started.")
 
         # Listen for events
-        consumer = StreamConsumer(self.id)
-
-        async for event in consumer.consume():
-            if not event or (filters and event.kind not in filters):
-                continue
-            if self.debug:
-                logger.debug(f"Flow instance `{self.name}` event: `{event.kind}`")
-            
-            self._update_status(event)
+        consumer = self.dispatcher.subscribe(self.id) if self.dispatcher else StreamConsumer(self.id)
+
+        try:
+            async for event in consumer.consume():
+                if event and self.recorder:
+                    # every event is timed, filters only apply to what is yielded
+                    self.recorder.record(event)
+                if not event or (filters and event.kind not in filters):
+                    continue
+                if self.debug:
+                    logger.debug(f"Flow instance `{self.name}` event: `{event.kind}`")
+                
+                self._update_status(event)
 
-            if event.kind == FlowEventType.ON_FLOW_END:
-                logger.info(f"Flow instance `{self.name}` completed.")
-            elif event.kind == FlowEventType.ON_FLOW_ERROR:
-                logger.error(f"Flow instance `{self.name}` failed with error: {event.error}")
+                if event.kind == FlowEventType.ON_FLOW_END:
+                    logger.info(f"Flow instance `{self.name}` completed.")
+                elif event.kind == FlowEventType.ON_FLOW_ERROR:
+                    logger.error(f"Flow instance `{self.name}` failed with error: {event.error}")
 
-            yield event
+                yield event
+        finally:
+            await consumer.aclose()
     
+    @property
+    def timeline(self) -> FlowRunTimeline | None:
+        '''The recorded timeline of the run, if it was started with a recorder.'''
+        return self.recorder.timeline if self.recorder else None
+
     def _update_status(self, event:FlowEvent):
         
         if event.kind == FlowEventType.ON_FLOW_END:
@@ -1176,18 +1341,23 @@ class FlowRun(BaseModel):
         if self.status is not FlowRunStatus.NOT_STARTED:
             raise ValueError("Flow has already been started")
         
-        async for event in self._arun_events(input_data):
-            if not event:
-                continue
-            
-            if event.kind == FlowEventType.ON_FLOW_END:
-                # result should come back on the event
-                self._on_flow_end(event)
-                break
-            elif event.kind == FlowEventType.ON_FLOW_ERROR:
-                # error should come back on the event
-                self._on_flow_error(event)
-                break   
+        events = self._arun_events(input_data)
+        try:
+            async for event in events:
+                if not event:
+                    continue
+                
+                if event.kind == FlowEventType.ON_FLOW_END:
+                    # result should come back on the event
+                    self._on_flow_end(event)
+                    break
+                elif event.kind == FlowEventType.ON_FLOW_ERROR:
+                    # error should come back on the event
+                    self._on_flow_error(event)
+                    break   
+        finally:
+            # release the event subscription as soon as the run ends rather than when the generator is collected
+            await events.aclose()
 
     def update_state(self, task_id: str, data: dict) -> Self:
         '''Not Implemented Yet'''
@@ -1218,13 +1388,24 @@ class FlowRun(BaseModel):
             self.on_flow_error_handler(self.error)
        
 
+class FlowRunResult(BaseModel):
+    '''Outcome of a single run launched by CompiledFlow.invoke_many.'''
+    index: int = Field(description="Position of the input in the inputs passed to invoke_many")
+    instance_id: str | None = None
+    status: FlowRunStatus
+    output: Any = None
+    error: Any = None
+    duration: float = Field(description="Wall time of the run in seconds")
+    timeline: FlowRunTimeline | None = None
+
+
 class CompiledFlow(BaseModel):
     '''A compiled version of the flow'''
     flow: Flow
     flow_id: str | None = None
     deployed: bool = False
     
-    async def invoke(self, input_data:dict=None, on_flow_end_handler: Callable=None, on_flow_error_handler: Callable=None, debug:bool=False, **kwargs) -> FlowRun:
+    async def invoke(self, input_data:dict=None, on_flow_end_handler: Callable=None, on_flow_error_handler: Callable=None, debug:bool=False, record_timeline: bool=False, **kwargs) -> FlowRun:
         """
         Sets up and initializes a FlowInstance for the current flow. This only works for CompiledFlow instances that have been deployed.
 
@@ -1235,6 +1416,7 @@ class CompiledFlow(BaseModel):
             on_flow_error_handler (callable, optional): A callback function to be executed 
                 when an error occurs during the flow execution. Defaults to None.
             debug (bool, optional): If True, enables debug mode for the flow run. Defaults to False.
+            record_timeline (bool, optional): If True, records per node timings, available on FlowRun.timeline. Defaults to False.
 
         Returns:
             FlowInstance: An instance of the flow initialized with the provided handlers 
@@ -1244,11 +1426,12 @@ class CompiledFlow(BaseModel):
         if self.deployed is False:
             raise ValueError("Flow has not been deployed yet. Please deploy the flow before invoking it by using the Flow.compile_deploy() function.")
 
-        flow_run = FlowRun(flow=self.flow,  deployed_flow_id=self.flow_id, on_flow_end_handler=on_flow_end_handler, on_flow_error_handler=on_flow_error_handler, debug=debug, **kwargs)
+        recorder = FlowRunRecorder() if record_timeline else None
+        flow_run = FlowRun(flow=self.flow,  deployed_flow_id=self.flow_id, on_flow_end_handler=on_flow_end_handler, on_flow_error_handler=on_flow_error_handler, debug=debug, recorder=recorder, **kwargs)
         asyncio.create_task(flow_run._arun(input_data=input_data, **kwargs))
         return flow_run
     
-    async def invoke_events(self, input_data:dict=None, filters: Sequence[Union[FlowEventType, TaskEventType]]=None, debug:bool=False) -> AsyncIterator[Tuple[FlowEvent,FlowRun]]:
+    async def invoke_events(self, input_data:dict=None, filters: Sequence[Union[FlowEventType, TaskEventType]]=None, debug:bool=False, record_timeline: bool=False) -> AsyncIterator[Tuple[FlowEvent,FlowRun]]:
         """
         Asynchronously runs the flow and yields events received from the flow for the client to handle. This only works for CompiledFlow instances that have been deployed.
 
@@ -1258,6 +1441,8 @@ class CompiledFlow(BaseModel):
                 A sequence of event types to filter the events. Only events matching these types 
                 will be yielded. Defaults to None.
             debug (bool, optional): If True, enables debug mode for the flow run. Defaults to False.
+            record_timeline (bool, optional): If True, records per node timings of every event, including filtered ones,
+                available on FlowRun.timeline. Defaults to False.
 
         Yields:
             FlowEvent: Events received from the flow that match the specified filters.
@@ -1266,17 +1451,87 @@ class CompiledFlow(BaseModel):
         if self.deployed is False:
             raise ValueError("Flow has not been deployed yet. Please deploy the flow before invoking it by using the Flow.compile_deploy() function.")
         
-        flow_run = FlowRun(flow=self.flow, deployed_flow_id=self.flow_id, debug=debug)
+        recorder = FlowRunRecorder() if record_timeline else None
+        flow_run = FlowRun(flow=self.flow, deployed_flow_id=self.flow_id, debug=debug, recorder=recorder)
         async for event in flow_run._arun_events(input_data=input_data, filters=filters):
             yield (event, flow_run)
     
+    async def invoke_many(self, inputs: Iterable[dict], max_concurrency: int = DEFAULT_INVOKE_MAX_CONCURRENCY, debug: bool = False, record_timeline: bool = False) -> AsyncIterator[FlowRunResult]:
+        """
+        Runs the flow once for each input and yields the results as the runs complete, which is not necessarily the
+        order of the inputs. This only works for CompiledFlow instances that have been deployed.
+
+        All runs share one Tempus client, and their events are read by one StreamDispatcher on a single connection.
+        At most max_concurrency runs are in flight at a time and inputs are only pulled from the iterable when a slot frees up, so a large or lazy
+        iterable is never materialized. A failing run is reported in its result and does not stop the other runs.
+
+        Args:
+            inputs (Iterable[dict]): Input data for each run.
+            max_concurrency (int, optional): The maximum number of runs in flight. Defaults to 16.
+            debug (bool, optional): If True, enables debug mode for the flow runs. Defaults to False.
+            record_timeline (bool, optional): If True, each result carries the timeline of its run. Defaults to False.
+
+        Yields:
+            FlowRunResult: The status, output or error and wall time of each run.
+        """
+
+        if self.deployed is False:
+            raise ValueError("Flow has not been deployed yet. Please deploy the flow before invoking it by using the Flow.compile_deploy() function.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        client: TempusClient = instantiate_client(client=TempusClient)
+        dispatcher = StreamDispatcher()
+
+        async def run(index: int, input_data: dict) -> FlowRunResult:
+            start = time.monotonic()
+            recorder = FlowRunRecorder() if record_timeline else None
+            flow_run = FlowRun(flow=self.flow, deployed_flow_id=self.flow_id, client=client, dispatcher=dispatcher, debug=debug, recorder=recorder)
+            try:
+                await flow_run._arun(input_data=input_data)
+            except Exception as e:
+                logger.error(f"Flow run {index} of `{self.flow.spec.name}` failed: {e}")
+                flow_run.status = FlowRunStatus.FAILED
+                flow_run.error = str(e)
+            return FlowRunResult(
+                index=index,
+                instance_id=flow_run.id,
+                status=flow_run.status,
+                output=flow_run.output,
+                error=flow_run.error,
+                duration=time.monotonic() - start,
+                timeline=flow_run.timeline
+            )
+
+        pending_inputs = enumerate(inputs)
+        in_flight: set[asyncio.Task] = set()
+        try:
+            while True:
+                while len(in_flight) < max_concurrency:
+                    next_input = next(pending_inputs, None)
+                    if next_input is None:
+                        break
+                    in_flight.add(asyncio.create_task(run(*next_input)))
+
+                if not in_flight:
+                    break
+
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            await dispatcher.aclose()
+
     def dump_spec(self, file: str) -> None:
-        dumped = self.flow.to_json()
         with open(file, 'w') as f:
             if file.endswith(".yaml") or file.endswith(".yml"):
-                yaml.dump(dumped, f, allow_unicode=True)
+                yaml.dump(self.flow.to_json(), f, allow_unicode=True)
             elif file.endswith(".json"):
-                json.dump(dumped, f, indent=2)
+                self.flow.write_json(f, indent=2)
             else:
                 raise ValueError('file must end in .json, .yaml, or .yml')
 
@@ -1580,10 +1835,202 @@ class FlowValidator(BaseModel):
     def validate_model(self) -> List[FlowValidationMessage]:
         '''Check the model for possible errors.
 
+        Every flow and nested flow (Loop, Foreach, UserFlow) is checked for missing START/END nodes, dangling edges
+        and branch targets, unreachable nodes, cycles outside of Loop/Foreach, schema references that do not resolve
+        in the top level flow's schemas and data map targets. Each check visits a node or edge a constant number of
+        times, so validation is linear in the size of the flow.
+
         Returns:
             List[FlowValidationMessage]: A list of validation messages.
         '''
-        return []
+        messages: List[FlowValidationMessage] = []
+        schemas = self.flow._find_topmost_flow().schemas
+        self._validate_schemas(self.flow, schemas, messages)
+        self._validate_flow(self.flow, schemas, messages)
+        return messages
+
+    def _message(self, messages: List[FlowValidationMessage], kind: FlowValidationKind, message: str, node: Node) -> None:
+        messages.append(FlowValidationMessage(kind=kind, message=message, node=node))
+
+    def _validate_flow(self, flow: Flow, schemas: dict[str, JsonSchemaObject], messages: List[FlowValidationMessage]) -> None:
+        flow_name = flow.spec.name
+        if not flow.nodes and not flow.edges:
+            return
+
+        if START not in flow.nodes:
+            self._message(messages, FlowValidationKind.ERROR, f"Flow `{flow_name}` has no START node.", flow)
+        if END not in flow.nodes:
+            self._message(messages, FlowValidationKind.ERROR, f"Flow `{flow_name}` has no END node.", flow)
+
+        # build the adjacency lists, dropping edges that point outside of this flow
+        successors: dict[str, List[str]] = {node_id: [] for node_id in flow.nodes}
+        predecessors: dict[str, List[str]] = {node_id: [] for node_id in flow.nodes}
+        for edge in flow.edges:
+            missing = [node_id for node_id in (edge.start, edge.end) if node_id not in flow.nodes]
+            if missing:
+                self._message(messages, FlowValidationKind.ERROR,
+                              f"Edge `{edge.start}` -> `{edge.end}` in flow `{flow_name}` references unknown node(s): {', '.join(missing)}.",
+                              flow.nodes.get(edge.start, flow))
+                continue
+            successors[edge.start].append(edge.end)
+            predecessors[edge.end].append(edge.start)
+
+        for node_id, node in flow.nodes.items():
+            if isinstance(node, Branch):
+                self._validate_branch(flow, node, messages)
+            if isinstance(node, Flow):
+                self._validate_flow(node, schemas, messages)
+            self._validate_node_schemas(node, schemas, messages)
+            self._validate_input_map(node, schemas, messages)
+
+        self._validate_output_map(flow, schemas, messages)
+
+        # reachability from START and towards END
+        reachable = self._traverse(START, successors) if START in flow.nodes else set()
+        can_finish = self._traverse(END, predecessors) if END in flow.nodes else set()
+        for node_id, node in flow.nodes.items():
+            if START in flow.nodes and node_id not in reachable:
+                self._message(messages, FlowValidationKind.WARNING, f"Node `{node_id}` in flow `{flow_name}` is not reachable from START.", node)
+            elif END in flow.nodes and node_id not in can_finish:
+                self._message(messages, FlowValidationKind.WARNING, f"Node `{node_id}` in flow `{flow_name}` has no path to END.", node)
+
+        self._validate_cycles(flow, successors, messages)
+
+    @staticmethod
+    def _traverse(origin: str, adjacency: dict[str, List[str]]) -> set[str]:
+        visited = {origin}
+        stack = [origin]
+        while stack:
+            for next_id in adjacency[stack.pop()]:
+                if next_id not in visited:
+                    visited.add(next_id)
+                    stack.append(next_id)
+        return visited
+
+    def _validate_cycles(self, flow: Flow, successors: dict[str, List[str]], messages: List[FlowValidationMessage]) -> None:
+        '''Iterative three-colour DFS. A cycle is an error unless a Branch on it can route execution out of it.'''
+        WHITE, GREY, BLACK = 0, 1, 2
+        colour = {node_id: WHITE for node_id in successors}
+        for root in successors:
+            if colour[root] != WHITE:
+                continue
+            colour[root] = GREY
+            path = [root]
+            iterators = [iter(successors[root])]
+            while iterators:
+                next_id = next(iterators[-1], None)
+                if next_id is None:
+                    colour[path.pop()] = BLACK
+                    iterators.pop()
+                elif colour[next_id] == WHITE:
+                    colour[next_id] = GREY
+                    path.append(next_id)
+                    iterators.append(iter(successors[next_id]))
+                elif colour[next_id] == GREY:
+                    cycle = path[path.index(next_id):]
+                    description = " -> ".join(cycle + [next_id])
+                    if any(isinstance(flow.nodes[node_id], Branch) for node_id in cycle):
+                        self._message(messages, FlowValidationKind.WARNING,
+                                      f"Flow `{flow.spec.name}` contains a conditional cycle: {description}. Use a Loop or Foreach for iteration.",
+                                      flow.nodes[next_id])
+                    else:
+                        self._message(messages, FlowValidationKind.ERROR,
+                                      f"Flow `{flow.spec.name}` contains a cycle with no exit: {description}.",
+                                      flow.nodes[next_id])
+
+    def _validate_branch(self, flow: Flow, branch: "Branch", messages: List[FlowValidationMessage]) -> None:
+        spec = branch.spec
+        targets = []
+        has_default = False
+        if isinstance(spec.evaluator, Conditions):
+            for condition in spec.evaluator.conditions:
+                condition = NodeIdCondition.model_validate(condition) if isinstance(condition, dict) else condition
+                targets.append(getattr(condition, "node_id", None))
+                has_default = has_default or condition.default
+        else:
+            for label, case in spec.cases.items():
+                targets.append(case.get("node") if isinstance(case, dict) else case)
+            # boolean cases are exhaustive on their own
+            has_default = "__default__" in spec.cases or {True, False} <= set(spec.cases)
+
+        if not targets:
+            self._message(messages, FlowValidationKind.ERROR, f"Branch `{spec.name}` in flow `{flow.spec.name}` has no cases.", branch)
+        for target in targets:
+            if target is not None and target not in flow.nodes:
+                self._message(messages, FlowValidationKind.ERROR,
+                              f"Branch `{spec.name}` in flow `{flow.spec.name}` routes to unknown node `{target}`.", branch)
+        if targets and not has_default:
+            self._message(messages, FlowValidationKind.WARNING,
+                          f"Branch `{spec.name}` in flow `{flow.spec.name}` has no default case.", branch)
+
+    @staticmethod
+    def _iter_schema_refs(schema: Any) -> Iterator[str]:
+        stack = [schema]
+        while stack:
+            current = stack.pop()
+            if current is None:
+                continue
+            if isinstance(current, (SchemaRef, JsonSchemaObjectRef)):
+                yield current.ref
+            if isinstance(current, dict):
+                stack.extend(current.values())
+                continue
+            properties = getattr(current, "properties", None)
+            if isinstance(properties, dict):
+                stack.extend(properties.values())
+            for attr in ("items", "anyOf"):
+                value = getattr(current, attr, None)
+                if isinstance(value, list):
+                    stack.extend(value)
+                elif value is not None:
+                    stack.append(value)
+
+    def _check_refs(self, schema: Any, schemas: dict[str, JsonSchemaObject], owner: str, node: Node, messages: List[FlowValidationMessage]) -> None:
+        for ref in self._iter_schema_refs(schema):
+            if ref.startswith(SCHEMA_REF_PREFIX) and ref[len(SCHEMA_REF_PREFIX):] not in schemas:
+                self._message(messages, FlowValidationKind.ERROR, f"Schema reference `{ref}` in {owner} does not resolve to a flow schema.", node)
+
+    def _validate_schemas(self, flow: Flow, schemas: dict[str, JsonSchemaObject], messages: List[FlowValidationMessage]) -> None:
+        for name, schema in schemas.items():
+            self._check_refs(schema, schemas, f"schema `{name}`", flow, messages)
+
+    def _validate_node_schemas(self, node: Node, schemas: dict[str, JsonSchemaObject], messages: List[FlowValidationMessage]) -> None:
+        spec = node.spec
+        for attr in ("input_schema", "output_schema", "output_schema_object", "item_schema"):
+            value = getattr(spec, attr, None)
+            if value is not None:
+                self._check_refs(value, schemas, f"`{spec.name}.{attr}`", node, messages)
+
+    @staticmethod
+    def _schema_properties(schema: Any, schemas: dict[str, JsonSchemaObject]) -> dict | None:
+        if isinstance(schema, SchemaRef) and schema.ref.startswith(SCHEMA_REF_PREFIX):
+            schema = schemas.get(schema.ref[len(SCHEMA_REF_PREFIX):])
+        properties = getattr(schema, "properties", None)
+        return properties if isinstance(properties, dict) else None
+
+    def _validate_targets(self, data_map: DataMap | None, prefix: str, schema: Any, schemas: dict[str, JsonSchemaObject],
+                          owner: str, node: Node, messages: List[FlowValidationMessage]) -> None:
+        if not data_map or not data_map.maps:
+            return
+        properties = self._schema_properties(schema, schemas)
+        for assignment in data_map.maps:
+            target = assignment.target_variable
+            if not target.startswith(prefix):
+                self._message(messages, FlowValidationKind.WARNING, f"Data map target `{target}` of {owner} should start with `{prefix}`.", node)
+                continue
+            field = target[len(prefix):].split(".", 1)[0]
+            if properties is not None and field not in properties:
+                self._message(messages, FlowValidationKind.WARNING, f"Data map target `{target}` of {owner} is not a field of its schema.", node)
+
+    def _validate_input_map(self, node: Node, schemas: dict[str, JsonSchemaObject], messages: List[FlowValidationMessage]) -> None:
+        if node.input_map and "spec" in node.input_map:
+            self._validate_targets(node.input_map["spec"], "self.input.", node.spec.input_schema, schemas,
+                                   f"node `{node.spec.name}`", node, messages)
+
+    def _validate_output_map(self, flow: Flow, schemas: dict[str, JsonSchemaObject], messages: List[FlowValidationMessage]) -> None:
+        if flow.output_map and "spec" in flow.output_map:
+            self._validate_targets(flow.output_map["spec"], "flow.output.", flow.spec.output_schema, schemas,
+                                   f"flow `{flow.spec.name}`", flow, messages)
 
     def any_errors(self, messages: List[FlowValidationMessage]) -> bool:
         '''
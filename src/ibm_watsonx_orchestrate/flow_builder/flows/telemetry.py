@@ -0,0 +1,278 @@
+"""
+Opt-in timing of flow runs.  A FlowRunRecorder attached to a FlowRun timestamps the launch and every event received
+for the run, and derives a FlowRunTimeline with a span per executed node that can be exported as JSON or as
+OpenTelemetry-style spans, and aggregated across runs with summarize_timelines.
+
+The flow engine does not timestamp its events, so times are taken when the events are received by the client.
+"""
+
+import math
+import time
+import uuid
+from enum import Enum
+from typing import Any, Iterable, Union
+
+from pydantic import BaseModel, Field
+
+from ..types import FlowEvent, FlowEventType, TaskEventType
+
+
+class SpanStatus(str, Enum):
+    WAITING = "waiting"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    def __str__(self):
+        return str(self.value)
+
+
+class TimelineEvent(BaseModel):
+    kind: str
+    name: str | None = None
+    task_id: str | None = None
+    timestamp: float = Field(description="Unix time in seconds when the event was received")
+
+
+class NodeSpan(BaseModel):
+    '''The execution of one node within a flow run.'''
+    span_id: str = Field(default_factory=lambda: uuid.uuid4().hex[:16])
+    name: str | None = None
+    task_id: str | None = None
+    status: SpanStatus = SpanStatus.IN_PROGRESS
+    queued_at: float = Field(description="Unix time the node was first seen, waiting for input or starting")
+    started_at: float | None = None
+    ended_at: float | None = None
+    error: Any = None
+
+    @property
+    def queue_latency(self) -> float | None:
+        '''Seconds between the node being queued and starting.'''
+        if self.started_at is None:
+            return None
+        return self.started_at - self.queued_at
+
+    @property
+    def duration(self) -> float | None:
+        '''Seconds between the node starting and ending.'''
+        if self.started_at is None or self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+
+class FlowRunTimeline(BaseModel):
+    '''Timeline of a single flow run.'''
+    trace_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    flow_name: str | None = None
+    instance_id: str | None = None
+    launched_at: float | None = None
+    started_at: float | None = None
+    ended_at: float | None = None
+    status: SpanStatus = SpanStatus.IN_PROGRESS
+    spans: list[NodeSpan] = Field(default_factory=list)
+    events: list[TimelineEvent] = Field(default_factory=list)
+
+    @property
+    def queue_latency(self) -> float | None:
+        '''Seconds between the launch request and the flow start event.'''
+        if self.launched_at is None or self.started_at is None:
+            return None
+        return self.started_at - self.launched_at
+
+    @property
+    def wall_time(self) -> float | None:
+        '''Seconds between the launch request and the end of the run.'''
+        if self.launched_at is None or self.ended_at is None:
+            return None
+        return self.ended_at - self.launched_at
+
+    def to_json(self) -> dict[str, Any]:
+        timeline = self.model_dump(mode="json")
+        timeline["queue_latency"] = self.queue_latency
+        timeline["wall_time"] = self.wall_time
+        for span, span_json in zip(self.spans, timeline["spans"]):
+            span_json["queue_latency"] = span.queue_latency
+            span_json["duration"] = span.duration
+        return timeline
+
+    def to_otel_spans(self) -> list[dict[str, Any]]:
+        '''
+        Exports the run as OpenTelemetry-style spans: a root span for the run and a child span per node. Spans that have
+        not ended yet are exported without an end time.
+        '''
+        root_span_id = uuid.uuid5(uuid.NAMESPACE_OID, self.trace_id).hex[:16]
+        spans = [_otel_span(
+            trace_id=self.trace_id,
+            span_id=root_span_id,
+            parent_span_id=None,
+            name=self.flow_name or "flow",
+            start=self.launched_at,
+            end=self.ended_at,
+            status=self.status,
+            attributes={
+                "flow.name": self.flow_name,
+                "flow.instance_id": self.instance_id,
+                "flow.queue_latency": self.queue_latency,
+            },
+        )]
+        for span in self.spans:
+            spans.append(_otel_span(
+                trace_id=self.trace_id,
+                span_id=span.span_id,
+                parent_span_id=root_span_id,
+                name=span.name or span.task_id or "task",
+                start=span.started_at if span.started_at is not None else span.queued_at,
+                end=span.ended_at,
+                status=span.status,
+                attributes={
+                    "flow.task_id": span.task_id,
+                    "flow.task.queue_latency": span.queue_latency,
+                    "flow.task.error": str(span.error) if span.error is not None else None,
+                },
+            ))
+        return spans
+
+
+def _to_unix_nano(timestamp: float | None) -> int | None:
+    return int(timestamp * 1_000_000_000) if timestamp is not None else None
+
+
+def _otel_span(trace_id: str, span_id: str, parent_span_id: str | None, name: str, start: float | None,
+               end: float | None, status: SpanStatus, attributes: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "trace_id": trace_id,
+        "span_id": span_id,
+        "parent_span_id": parent_span_id,
+        "name": name,
+        "start_time_unix_nano": _to_unix_nano(start),
+        "end_time_unix_nano": _to_unix_nano(end),
+        "status": {"code": "ERROR" if status == SpanStatus.FAILED else "OK" if status == SpanStatus.COMPLETED else "UNSET"},
+        "attributes": {key: value for key, value in attributes.items() if value is not None},
+    }
+
+
+class FlowRunRecorder:
+    '''
+    Records the timeline of a flow run. FlowRun calls on_launch when it requests the run and record for every event
+    received for it.
+    '''
+
+    def __init__(self):
+        self.timeline = FlowRunTimeline()
+        # spans that have not ended yet, by task
+        self._open_spans: dict[str, list[NodeSpan]] = {}
+
+    def on_launch(self, flow_name: str | None = None) -> None:
+        self.timeline.flow_name = flow_name
+        self.timeline.launched_at = time.time()
+
+    def on_started(self, instance_id: str) -> None:
+        self.timeline.instance_id = instance_id
+
+    def record(self, event: FlowEvent) -> None:
+        now = time.time()
+        context = event.context
+        name = context.name if context else None
+        task_id = context.task_id if context else None
+        self.timeline.events.append(TimelineEvent(kind=event.kind.value, name=name, task_id=task_id, timestamp=now))
+
+        if event.kind == FlowEventType.ON_FLOW_START:
+            if self.timeline.started_at is None:
+                self.timeline.started_at = now
+        elif event.kind in (FlowEventType.ON_FLOW_END, FlowEventType.ON_FLOW_ERROR):
+            self.timeline.ended_at = now
+            self.timeline.status = SpanStatus.COMPLETED if event.kind == FlowEventType.ON_FLOW_END else SpanStatus.FAILED
+        elif isinstance(event.kind, TaskEventType):
+            self._record_task_event(event, name, task_id, now)
+
+    def _record_task_event(self, event: FlowEvent, name: str | None, task_id: str | None, now: float) -> None:
+        key = task_id or name or ""
+        open_spans = self._open_spans.setdefault(key, [])
+        span = open_spans[-1] if open_spans else None
+
+        if event.kind == TaskEventType.ON_TASK_WAIT:
+            if span is None or span.started_at is not None:
+                span = self._open_span(key, name, task_id, now)
+            span.status = SpanStatus.WAITING
+        elif event.kind in (TaskEventType.ON_TASK_START, TaskEventType.ON_TASK_RESUME):
+            if span is None or (event.kind == TaskEventType.ON_TASK_START and span.started_at is not None):
+                span = self._open_span(key, name, task_id, now)
+            if span.started_at is None:
+                span.started_at = now
+            span.status = SpanStatus.IN_PROGRESS
+        elif event.kind in (TaskEventType.ON_TASK_END, TaskEventType.ON_TASK_ERROR):
+            if span is None:
+                # the start was not observed, e.g. events filtered upstream
+                span = self._open_span(key, name, task_id, now)
+                span.started_at = now
+            span.ended_at = now
+            if event.kind == TaskEventType.ON_TASK_END:
+                span.status = SpanStatus.COMPLETED
+            else:
+                span.status = SpanStatus.FAILED
+                span.error = event.error
+            open_spans.pop()
+
+    def _open_span(self, key: str, name: str | None, task_id: str | None, now: float) -> NodeSpan:
+        span = NodeSpan(name=name, task_id=task_id, queued_at=now)
+        self.timeline.spans.append(span)
+        self._open_spans[key].append(span)
+        return span
+
+
+class NodeLatencySummary(BaseModel):
+    '''Latency of a node across runs, in seconds.'''
+    name: str
+    count: int
+    failed: int
+    mean: float | None = None
+    p50: float | None = None
+    p95: float | None = None
+    max: float | None = None
+    mean_queue_latency: float | None = None
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float | None:
+    if not sorted_values:
+        return None
+    index = max(0, math.ceil(percentile / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize_timelines(timelines: Iterable[Union[FlowRunTimeline, dict]]) -> list[NodeLatencySummary]:
+    '''
+    Aggregates node latencies across runs, by node name. Timelines can be given as models or as their to_json() output.
+    '''
+    durations: dict[str, list[float]] = {}
+    queue_latencies: dict[str, list[float]] = {}
+    counts: dict[str, int] = {}
+    failures: dict[str, int] = {}
+
+    for timeline in timelines:
+        if isinstance(timeline, dict):
+            timeline = FlowRunTimeline.model_validate(timeline)
+        for span in timeline.spans:
+            name = span.name or span.task_id or "task"
+            counts[name] = counts.get(name, 0) + 1
+            if span.status == SpanStatus.FAILED:
+                failures[name] = failures.get(name, 0) + 1
+            if span.duration is not None:
+                durations.setdefault(name, []).append(span.duration)
+            if span.queue_latency is not None:
+                queue_latencies.setdefault(name, []).append(span.queue_latency)
+
+    summaries = []
+    for name, count in counts.items():
+        values = sorted(durations.get(name, []))
+        waits = queue_latencies.get(name, [])
+        summaries.append(NodeLatencySummary(
+            name=name,
+            count=count,
+            failed=failures.get(name, 0),
+            mean=sum(values) / len(values) if values else None,
+            p50=_percentile(values, 50),
+            p95=_percentile(values, 95),
+            max=values[-1] if values else None,
+            mean_queue_latency=sum(waits) / len(waits) if waits else None,
+        ))
+    return summaries
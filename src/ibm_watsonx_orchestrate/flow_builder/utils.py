@@ -1,7 +1,10 @@
+import hashlib
 import importlib
 import inspect
+import json
 import re
 import logging
+from typing import Any
 
 from pydantic import BaseModel, TypeAdapter
 
@@ -12,12 +15,17 @@ from ibm_watsonx_orchestrate.agent_builder.tools.base_tool import BaseTool
 from ibm_watsonx_orchestrate.agent_builder.tools.flow_tool import create_flow_json_tool
 from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import OpenAPITool, create_openapi_json_tools_from_content
 from ibm_watsonx_orchestrate.agent_builder.tools.types import JsonSchemaObject, OpenApiToolBinding, ToolBinding, ToolRequestBody, ToolResponseBody, ToolSpec
+from ibm_watsonx_orchestrate.client.base_api_client import ClientAPIException
 from ibm_watsonx_orchestrate.client.tools.tempus_client import TempusClient
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
 from ibm_watsonx_orchestrate.client.utils import instantiate_client, is_local_dev
 
 logger = logging.getLogger(__name__)
 
+FLOW_CONTENT_HASH_KEY = "content_hash"
+# metadata that changes on every compile without changing the flow itself
+_VOLATILE_FLOW_METADATA_KEYS = ("compiled_on", FLOW_CONTENT_HASH_KEY)
+
 def get_valid_name(name: str) -> str:
  
     return re.sub('\\W|^(?=\\d)','_', name)
@@ -132,7 +140,36 @@ def _get_tool_response_body(schema_obj: JsonSchemaObject) -> ToolResponseBody:
     raise ValueError(f"Invalid schema object: {schema_obj}")
 
 
-async def import_flow_model(model):
+def _strip_volatile_fields(value: Any) -> Any:
+    # document classifier classes get a new random class_id every time they are serialized
+    if isinstance(value, dict):
+        return {
+            key: _strip_volatile_fields(item) for key, item in value.items()
+            if not (key == "class_id" and "class_name" in value)
+        }
+    if isinstance(value, list):
+        return [_strip_volatile_fields(item) for item in value]
+    return value
+
+def compute_flow_model_hash(model: dict) -> str:
+    '''Content hash of a flow model, ignoring metadata and generated ids that change on every compile.'''
+    metadata = {key: value for key, value in (model.get("metadata") or {}).items() if key not in _VOLATILE_FLOW_METADATA_KEYS}
+    content = _strip_volatile_fields({**model, "metadata": metadata})
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def _get_deployed_flow_hash(tool_id: str) -> str | None:
+    try:
+        deployed_model = instantiate_client(TempusClient).get_flow_model(tool_id)
+    except ClientAPIException as e:
+        logger.debug(f"Unable to retrieve deployed flow model for tool '{tool_id}': {e}")
+        return None
+
+    if not isinstance(deployed_model, dict):
+        return None
+    deployed_model = deployed_model.get("data", deployed_model)
+    return (deployed_model.get("metadata") or {}).get(FLOW_CONTENT_HASH_KEY)
+
+async def import_flow_model(model, force: bool = False):
 
     if not is_local_dev():
         raise typer.BadParameter(f"Flow tools are only supported in local environment.")
@@ -140,6 +177,10 @@ async def import_flow_model(model):
     if model is None:
         raise typer.BadParameter(f"No model provided.")
 
+    # always recompute, a stored hash is stale if the model was edited after compiling
+    metadata = model.setdefault("metadata", {})
+    metadata[FLOW_CONTENT_HASH_KEY] = compute_flow_model_hash(model)
+
     tool = create_flow_json_tool(name=model["spec"]["name"],
                                 description=model["spec"]["description"], 
                                 permission="read_only", 
@@ -161,6 +202,9 @@ async def import_flow_model(model):
     tool_spec = tool.__tool_spec__.model_dump(mode='json', exclude_unset=True, exclude_none=True, by_alias=True)
     name = tool_spec['name']
     if exist:
+        if not force and _get_deployed_flow_hash(tool_id) == metadata[FLOW_CONTENT_HASH_KEY]:
+            logger.info(f"Flow '{name}' is unchanged, skipping deploy")
+            return tool_id
         logger.info(f"Updating flow '{name}'")
         client.update(tool_id, tool_spec)
     else:
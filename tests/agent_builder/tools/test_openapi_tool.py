@@ -11,7 +11,8 @@ try:
     from mocks.mock_httpx import get_mock_async_client, MockResponse
 except:
     from tests.mocks.mock_httpx import get_mock_async_client, MockResponse
-from ibm_watsonx_orchestrate.agent_builder.tools import create_openapi_json_tool
+from ibm_watsonx_orchestrate.agent_builder.tools import create_openapi_json_tool, ResolvedOpenAPISpec, OpenAPIOperationFilter, openapi_tool
+from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_openapi_json_tools_from_content, iter_openapi_json_tools
 
 
 @pytest.fixture(scope='module')
@@ -847,3 +848,100 @@ async def test_async_spec_with_callback(mocker, snapshot, openapi_async_callback
         assert False, 'should have thrown'
     except RuntimeError as e:
         assert 'only available when deployed' in str(e), 'should show runtime message if called'
+
+
+############################################################
+## Resolved specs and operation filters
+############################################################
+@pytest.fixture()
+def openapi_shared_refs_spec():
+    def operation(operation_id, parameter_name, tags):
+        return {
+            'operationId': operation_id,
+            'description': f'{operation_id} description',
+            'tags': tags,
+            'parameters': [{'name': parameter_name, 'in': 'query', 'schema': {'$ref': '#/components/schemas/Id'}}],
+            'responses': {'200': {'description': 'ok', 'content': {'application/json': {'schema': {'$ref': '#/components/schemas/Pet'}}}}}
+        }
+
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': 'Pets', 'version': '1.0.0'},
+        'servers': [{'url': 'https://pets.example.com'}],
+        'paths': {
+            '/pets': {'get': operation('listPets', 'owner_id', ['pets'])},
+            '/pets/{pet_id}': {
+                'get': operation('getPet', 'pet_id', ['pets']),
+                'delete': operation('deletePet', 'pet_id', ['admin'])
+            },
+            '/owners': {'get': operation('listOwners', 'owner_id', ['owners'])},
+        },
+        'components': {
+            'schemas': {
+                'Id': {'type': 'string'},
+                'Pet': {'type': 'object', 'properties': {'name': {'type': 'string'}}}
+            }
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_tools_from_content_resolve_refs_once(mocker, openapi_shared_refs_spec):
+    replace_refs = mocker.spy(openapi_tool.jsonref, 'replace_refs')
+
+    tools = await create_openapi_json_tools_from_content(openapi_shared_refs_spec)
+
+    assert [tool.__tool_spec__.name for tool in tools] == ['listPets', 'getPet', 'deletePet', 'listOwners']
+    assert replace_refs.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_tools_from_content_do_not_share_ref_mutations(openapi_shared_refs_spec):
+    tools = await create_openapi_json_tools_from_content(openapi_shared_refs_spec)
+
+    assert tools[0].__tool_spec__.input_schema.properties['query_owner_id'].title == 'owner_id'
+    assert tools[1].__tool_spec__.input_schema.properties['query_pet_id'].title == 'pet_id'
+    assert 'title' not in openapi_shared_refs_spec['components']['schemas']['Id']
+
+
+def test_resolved_spec_matches_per_tool_resolution(openapi_shared_refs_spec):
+    resolved_spec = ResolvedOpenAPISpec(openapi_shared_refs_spec)
+    for path, method, _ in resolved_spec.iter_operations():
+        from_resolved = create_openapi_json_tool(resolved_spec, http_path=path, http_method=method.upper())
+        from_dict = create_openapi_json_tool(openapi_shared_refs_spec, http_path=path, http_method=method.upper())
+        assert from_resolved.dumps_spec() == from_dict.dumps_spec()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('operation_filter', 'expected_names'),
+    [
+        ({'tags': ['pets']}, ['listPets', 'getPet']),
+        ({'paths': ['/pets/*']}, ['getPet', 'deletePet']),
+        ({'operation_ids': ['listOwners', 'deletePet']}, ['deletePet', 'listOwners']),
+        ({'tags': ['pets'], 'paths': ['/pets/*']}, ['getPet']),
+        ({'tags': ['unknown']}, []),
+    ]
+)
+async def test_tools_from_content_operation_filter(openapi_shared_refs_spec, operation_filter, expected_names):
+    tools = await create_openapi_json_tools_from_content(openapi_shared_refs_spec, operation_filter=OpenAPIOperationFilter(**operation_filter))
+
+    assert [tool.__tool_spec__.name for tool in tools] == expected_names
+
+
+def test_iter_tools_builds_lazily(mocker, openapi_shared_refs_spec):
+    create_tool = mocker.spy(openapi_tool, 'create_openapi_json_tool')
+
+    tools = iter_openapi_json_tools(openapi_shared_refs_spec)
+    first_tool = next(tools)
+
+    assert first_tool.__tool_spec__.name == 'listPets'
+    assert create_tool.call_count == 1
+    assert [tool.__tool_spec__.name for tool in tools] == ['getPet', 'deletePet', 'listOwners']
+
+
+def test_iter_tools_across_processes_matches_serial(openapi_shared_refs_spec):
+    serial = [tool.dumps_spec() for tool in iter_openapi_json_tools(openapi_shared_refs_spec, connection_id='connection')]
+    parallel = [tool.dumps_spec() for tool in iter_openapi_json_tools(openapi_shared_refs_spec, connection_id='connection', max_workers=2, chunk_size=1)]
+
+    assert parallel == serial
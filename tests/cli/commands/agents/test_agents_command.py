@@ -1,4 +1,5 @@
 from ibm_watsonx_orchestrate.cli.commands.agents import agents_command
+from ibm_watsonx_orchestrate.cli.commands.agents.export_session import DEFAULT_EXPORT_MAX_WORKERS
 from ibm_watsonx_orchestrate.agent_builder.agents import AgentKind, AgentStyle, ExternalAgentAuthScheme, AgentProvider
 from unittest.mock import patch
 
@@ -192,7 +193,8 @@ class TestAgentExport:
                 name="test_native_agent",
                 kind=AgentKind.NATIVE,
                 output_path="test_output.zip",
-                agent_only_flag=False
+                agent_only_flag=False,
+                concurrency=DEFAULT_EXPORT_MAX_WORKERS
             )
 
 class TestAgentDeploy:
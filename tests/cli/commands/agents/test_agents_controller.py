@@ -1,4 +1,5 @@
 import json
+import zipfile
 from unittest.mock import patch, mock_open, MagicMock
 import pytest
 import uuid
@@ -992,6 +993,155 @@ class TestAgentsControllerPublishOrUpdateAgents:
             sys_exit_mock.assert_not_called()
 
 
+class MockBulkLookupClient:
+    def __init__(self, drafts=None):
+        self.drafts = drafts or []
+        self.lookups = []
+        self.created = []
+        self.updated = []
+
+    def get_drafts_by_names(self, names):
+        self.lookups.append(list(names))
+        return [d for d in self.drafts if d["name"] in names]
+
+    def get_by_names(self, names):
+        return self.get_drafts_by_names(names)
+
+    def create(self, payload):
+        self.created.append(payload)
+        self.drafts.append({"name": payload["name"], "id": f"{payload['name']}_id", "description": "test"})
+        return AgentUpsertResponse(id=f"{payload['name']}_id")
+
+    def update(self, agent_id, payload):
+        self.updated.append((agent_id, payload))
+        return AgentUpsertResponse(id=agent_id)
+
+
+class TestAgentsControllerBulkPublishOrUpdateAgents:
+    def _patch_clients(self, native_client, tool_client, kb_client):
+        return patch.multiple(
+            "ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController",
+            get_native_client=MagicMock(return_value=native_client),
+            get_external_client=MagicMock(return_value=MockBulkLookupClient()),
+            get_assistant_client=MagicMock(return_value=MockBulkLookupClient()),
+            get_tool_client=MagicMock(return_value=tool_client),
+            get_knowledge_base_client=MagicMock(return_value=kb_client),
+        )
+
+    def test_bulk_import_resolves_dependencies_once(self):
+        native_client = MockBulkLookupClient([{"name": "agent_0", "id": "agent_0_id", "description": "test"}])
+        tool_client = MockBulkLookupClient([{"name": f"tool_{i}", "id": f"tool_{i}_id"} for i in range(3)])
+        kb_client = MockBulkLookupClient([{"name": "kb", "id": "kb_id"}])
+        agents = [
+            Agent(name=f"agent_{i}", kind=AgentKind.NATIVE, description="test", llm="test_llm", tools=[f"tool_{i % 3}"], knowledge_base=["kb"])
+            for i in range(10)
+        ]
+
+        with self._patch_clients(native_client, tool_client, kb_client):
+            results = AgentsController().publish_or_update_agents(agents, concurrency=4)
+
+        assert len(tool_client.lookups) == 1
+        assert len(native_client.lookups) == 1
+        assert [r.status.value for r in results] == ["updated"] + ["created"] * 9
+        assert native_client.updated[0][0] == "agent_0_id"
+        assert sorted(c["name"] for c in native_client.created) == [f"agent_{i}" for i in range(1, 10)]
+        assert all(c["tools"] == [f"tool_{int(c['name'][-1]) % 3}_id"] and c["knowledge_base"] == ["kb_id"] for c in native_client.created)
+
+    def test_bulk_import_orders_collaborators_within_batch(self):
+        native_client = MockBulkLookupClient()
+        agents = [
+            Agent(name="supervisor", kind=AgentKind.NATIVE, description="test", llm="test_llm", collaborators=["worker"]),
+            Agent(name="worker", kind=AgentKind.NATIVE, description="test", llm="test_llm"),
+        ]
+
+        with self._patch_clients(native_client, MockBulkLookupClient(), MockBulkLookupClient()):
+            results = AgentsController().publish_or_update_agents(agents, concurrency=2)
+
+        assert [r.name for r in results] == ["worker", "supervisor"]
+        assert native_client.created[1]["collaborators"] == ["worker_id"]
+
+    def test_bulk_import_captures_failures(self):
+        native_client = MockBulkLookupClient()
+        native_client.create = MagicMock(side_effect=Exception("boom"))
+        agents = [Agent(name="agent", kind=AgentKind.NATIVE, description="test", llm="test_llm")]
+
+        with self._patch_clients(native_client, MockBulkLookupClient(), MockBulkLookupClient()):
+            results = AgentsController().bulk_publish_or_update_agents(agents, max_workers=2)
+
+        assert results[0].status.value == "failed"
+        assert results[0].error == "boom"
+
+    def test_bulk_import_failed_collaborator_fails_dependents(self, caplog):
+        native_client = MockBulkLookupClient()
+        create = native_client.create
+
+        def create_or_fail(payload):
+            if payload["name"] == "worker":
+                raise Exception("boom")
+            return create(payload)
+
+        native_client.create = create_or_fail
+        agents = [
+            Agent(name="manager", kind=AgentKind.NATIVE, description="test", llm="test_llm", collaborators=["supervisor"]),
+            Agent(name="supervisor", kind=AgentKind.NATIVE, description="test", llm="test_llm", collaborators=["worker"]),
+            Agent(name="worker", kind=AgentKind.NATIVE, description="test", llm="test_llm"),
+            Agent(name="other", kind=AgentKind.NATIVE, description="test", llm="test_llm"),
+        ]
+
+        with self._patch_clients(native_client, MockBulkLookupClient(), MockBulkLookupClient()), \
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.print_import_summary") as print_summary:
+            results = AgentsController().bulk_publish_or_update_agents(agents, max_workers=2)
+
+        assert [(r.name, r.status.value, r.error) for r in results] == [
+            ("worker", "failed", "boom"),
+            ("other", "created", None),
+            ("supervisor", "failed", "collaborator 'worker' failed to import"),
+            ("manager", "failed", "collaborator 'supervisor' failed to import"),
+        ]
+        print_summary.assert_called_once_with(results, title="Agent import summary", resource_name="agents")
+        assert "cycle" not in caplog.text
+
+    def test_concurrent_import_exits_non_zero_on_failure(self):
+        native_client = MockBulkLookupClient()
+        native_client.create = MagicMock(side_effect=Exception("boom"))
+        agents = [Agent(name="a", kind=AgentKind.NATIVE, description="test", llm="test_llm")]
+
+        with self._patch_clients(native_client, MockBulkLookupClient(), MockBulkLookupClient()), \
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.print_import_summary") as print_summary:
+            with pytest.raises(SystemExit) as e:
+                AgentsController().publish_or_update_agents(agents, concurrency=2)
+
+        assert e.value.code == 1
+        print_summary.assert_called_once()
+
+    def test_bulk_import_collaborator_cycle_exits(self):
+        agents = [
+            Agent(name="a", kind=AgentKind.NATIVE, description="test", llm="test_llm", collaborators=["b"]),
+            Agent(name="b", kind=AgentKind.NATIVE, description="test", llm="test_llm", collaborators=["a"]),
+        ]
+
+        with self._patch_clients(MockBulkLookupClient(), MockBulkLookupClient(), MockBulkLookupClient()), \
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.print_import_summary") as print_summary:
+            with pytest.raises(SystemExit):
+                AgentsController().publish_or_update_agents(agents, concurrency=2)
+
+        summary = print_summary.call_args.args[0]
+        assert [(r.name, r.status.value) for r in summary] == [("a", "failed"), ("b", "failed")]
+
+    def test_bulk_import_looks_up_only_agents_created_in_wave(self):
+        native_client = MockBulkLookupClient()
+        agents = [
+            Agent(name="c", kind=AgentKind.NATIVE, description="test", llm="test_llm", collaborators=["b"]),
+            Agent(name="b", kind=AgentKind.NATIVE, description="test", llm="test_llm", collaborators=["a"]),
+            Agent(name="a", kind=AgentKind.NATIVE, description="test", llm="test_llm"),
+        ]
+
+        with self._patch_clients(native_client, MockBulkLookupClient(), MockBulkLookupClient()):
+            AgentsController().publish_or_update_agents(agents, concurrency=2)
+
+        assert native_client.lookups[1:] == [["a"], ["b"]]
+
+
 class TestAgentsControllerPublishAgent:
     def test_publish_native_agent(self, native_agent_content, caplog):
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_native_client") as native_client_mock:
@@ -1376,7 +1526,7 @@ class TestAgentsControllerExportAgent:
                 )
             
             mock_kb_controller.return_value = MagicMock(
-                knowledge_base_export=MagicMock()
+                get_knowledge_base_export_spec=MagicMock(return_value={"name": self.mock_kb_name})
             )
 
             mock_zipfile().__enter__().infolist.return_value = [MagicMock()]
@@ -1443,7 +1593,7 @@ class TestAgentsControllerExportAgent:
 
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ToolsController") as mock_tools_controller, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.zipfile.ZipFile") as mock_zipfile, \
-            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.check_file_in_zip") as mock_zip_check, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ExportSession.contains") as mock_zip_check, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
             
             mock_get_connection_client.return_value = mock_connection_client
@@ -1476,11 +1626,11 @@ class TestAgentsControllerExportAgent:
 
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ToolsController") as mock_tools_controller, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.zipfile.ZipFile") as mock_zipfile, \
-            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.check_file_in_zip") as mock_zip_check, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ExportSession.contains") as mock_zip_check, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
             
             mock_get_connection_client.return_value = mock_connection_client
-            mock_zip_check.side_effect = lambda file_path, zip_file : True if "tools" in file_path else False
+            mock_zip_check.side_effect = lambda file_path : True if "tools" in file_path else False
             mock_tools_controller.return_value = MagicMock(
                 download_tool=MagicMock(return_value=b"abc")
                 )
@@ -1557,7 +1707,7 @@ class TestAgentsControllerExportAgent:
                 )
             
             mock_kb_controller.return_value = MagicMock(
-                knowledge_base_export=MagicMock()
+                get_knowledge_base_export_spec=MagicMock(return_value={"name": self.mock_kb_name})
             )
 
             mock_zipfile().__enter__().infolist.return_value = [MagicMock()]
@@ -1575,6 +1725,37 @@ class TestAgentsControllerExportAgent:
         assert f"Skipping {self.mock_kb_name}, knowledge_bases are currently unsupported by export"
         assert f"Skipping {native_agent_content.get('collaborators')[0]}, no agent with id {native_agent_content.get('collaborators')[0]} found" in captured
 
+    def test_export_agent_cyclic_collaborators_share_session(self, caplog, tmp_path, native_agent_content, external_agent_content, assistant_agent_content):
+        ac = AgentsController()
+        ac.native_client = MockAgent(get_draft_by_name_response=[native_agent_content], return_get_drafts_by_ids=False)
+        ac.external_client = MockAgent(get_draft_by_name_response=[external_agent_content], return_get_drafts_by_ids=False)
+        ac.assistant_client = MockAgent(get_draft_by_name_response=[assistant_agent_content], fake_agent=assistant_agent_content)
+        ac.tool_client = MockAgent()
+        output_path = str(tmp_path / "export.zip")
+
+        with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ToolsController") as mock_tools_controller, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.KnowledgeBaseController") as mock_kb_controller, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_agent_by_id") as mock_get_agent, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
+
+            mock_get_connection_client.return_value = MockConnectionClient(get_draft_by_id_response="testing")
+            # the agent is its own collaborator
+            mock_get_agent.return_value = MagicMock(name=self.mock_agent_name, kind=AgentKind.NATIVE)
+            mock_get_agent.return_value.name = self.mock_agent_name
+            mock_tools_controller.return_value = MagicMock(download_tool=MagicMock(return_value=None))
+
+            ac.export_agent(
+                name = self.mock_agent_name,
+                kind = AgentKind.NATIVE,
+                output_path = output_path
+            )
+
+        mock_tools_controller.assert_called_once()
+        mock_kb_controller.assert_called_once()
+        assert "agent with that name already exists in the output folder" in caplog.text
+        with zipfile.ZipFile(output_path) as zip_file:
+            assert len(zip_file.namelist()) == 1
+
     def test_export_agent_bad_file_type(self, caplog):
         ac = AgentsController()
 
@@ -1738,3 +1919,4 @@ class TestAgentDeploy:
             assert "Error undeploying agent" in caplog.text
 
 
+
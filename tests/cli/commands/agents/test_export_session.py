@@ -0,0 +1,67 @@
+import threading
+import time
+import zipfile
+import pytest
+from unittest.mock import MagicMock
+
+from ibm_watsonx_orchestrate.cli.commands.agents.export_session import ExportSession
+
+
+def _session(zip_file: zipfile.ZipFile) -> ExportSession:
+    return ExportSession(zip_file, tools_controller=MagicMock(), knowledge_base_controller=MagicMock())
+
+
+class TestExportSession:
+    def test_contains_files_and_folders(self, tmp_path):
+        with zipfile.ZipFile(tmp_path / "export.zip", "w") as zip_file:
+            session = _session(zip_file)
+            session.writestr("export/agents/native/agent.yaml", "spec")
+            session.writestr("export/tools/tool_1/tool.py", "code")
+
+            assert session.contains("export/agents/native/agent.yaml")
+            assert session.contains("export/tools/tool_1/")
+            assert session.contains("export/tools/tool_1")
+            assert session.contains("export/tools")
+            assert not session.contains("export/tools/tool")
+            assert not session.contains("export/agents/native/other.yaml")
+
+    def test_indexes_existing_entries(self, tmp_path):
+        with zipfile.ZipFile(tmp_path / "export.zip", "w") as zip_file:
+            zip_file.writestr("export/knowledge-bases/kb_1.yaml", "kb")
+            session = _session(zip_file)
+
+            assert session.contains("export/knowledge-bases/kb_1.yaml")
+            assert session.contains("export/knowledge-bases")
+
+    def test_fetch_bounds_in_flight_calls(self, tmp_path):
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fetch(item):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return item * 2
+
+        with zipfile.ZipFile(tmp_path / "export.zip", "w") as zip_file:
+            session = ExportSession(zip_file, tools_controller=MagicMock(), knowledge_base_controller=MagicMock(), max_workers=3)
+            results = dict(session.fetch(fetch, range(10)))
+            session.close()
+
+        assert results == {i: i * 2 for i in range(10)}
+        assert peak <= 3
+
+    def test_fetch_propagates_errors(self, tmp_path):
+        def fetch(item):
+            raise ValueError(item)
+
+        with zipfile.ZipFile(tmp_path / "export.zip", "w") as zip_file:
+            session = ExportSession(zip_file, tools_controller=MagicMock(), knowledge_base_controller=MagicMock(), max_workers=2)
+            with pytest.raises(ValueError):
+                list(session.fetch(fetch, range(4)))
+            session.close()
@@ -2,6 +2,9 @@ from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_contro
 from ibm_watsonx_orchestrate.agent_builder.agents import SpecVersion
 from ibm_watsonx_orchestrate.agent_builder.knowledge_bases.knowledge_base import KnowledgeBase
 import json
+import yaml
+from io import BytesIO
+from zipfile import ZipFile
 from unittest.mock import patch, mock_open, Mock
 import pytest
 import uuid
@@ -470,6 +473,49 @@ class TestKnowledgeBaseControllerKnowledgeBaseStatus:
             mock_instance.add_row.assert_called_once_with("Knowledge Base Name")
 
 
+class TestKnowledgeBaseControllerExport:
+    spec = {"spec_version": "v1", "kind": "knowledge_base", "name": "my_kb", "description": "My knowledge base"}
+
+    def test_export_knowledge_base_to_file(self, caplog, tmp_path):
+        output_path = str(tmp_path / "my_kb.yaml")
+        with patch("ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller.KnowledgeBaseController.get_knowledge_base_export_spec") as spec_mock:
+            spec_mock.return_value = self.spec
+
+            knowledge_base_controller.knowledge_base_export(output_path, name="my_kb")
+
+            spec_mock.assert_called_once_with(id=None, name="my_kb")
+        with open(output_path) as f:
+            assert yaml.safe_load(f) == self.spec
+        assert f"Successfully exported for knowledge base 'my_kb' to '{output_path}'" in caplog.text
+
+    def test_export_knowledge_base_to_zip(self, caplog):
+        id = uuid.uuid4()
+        buffer = BytesIO()
+        with patch("ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller.KnowledgeBaseController.get_knowledge_base_export_spec") as spec_mock, \
+             ZipFile(buffer, "w") as zip_file:
+            spec_mock.return_value = self.spec
+
+            knowledge_base_controller.knowledge_base_export("knowledge_bases/my_kb.yaml", id=id, zip_file_out=zip_file)
+
+        with ZipFile(buffer) as zip_file:
+            assert yaml.safe_load(zip_file.read("knowledge_bases/my_kb.yaml")) == self.spec
+        assert f"Successfully exported for knowledge base with ID '{id}'" in caplog.text
+
+    def test_export_knowledge_base_not_found(self, caplog, tmp_path):
+        output_path = tmp_path / "my_kb.yaml"
+        with patch("ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller.KnowledgeBaseController.get_knowledge_base_export_spec") as spec_mock:
+            spec_mock.return_value = None
+
+            knowledge_base_controller.knowledge_base_export(str(output_path), name="my_kb")
+
+        assert not output_path.exists()
+        assert "Successfully exported" not in caplog.text
+
+    def test_export_knowledge_base_invalid_extension(self):
+        with pytest.raises(SystemExit):
+            knowledge_base_controller.knowledge_base_export("my_kb.json", name="my_kb")
+
+
 class TestRelativeFilePath:
 
     def test_relative_file_path(self):
@@ -12,7 +12,12 @@ def test_tool_import_call_no_params():
             file=None,
             app_id=None,
             requirements_file=None,
-            package_root=None
+            package_root=None,
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
 
@@ -24,7 +29,12 @@ def test_tool_import_call_python():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root=None
+            package_root=None,
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
 def test_tool_import_call_openapi():
@@ -35,9 +45,69 @@ def test_tool_import_call_openapi():
             file="test_file",
             app_id=None,
             requirements_file=None,
-            package_root=None
+            package_root=None,
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
+def test_tool_import_call_openapi_with_operation_filter():
+    with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tool") as mock:
+        tools_command.tool_import(kind="openapi", file="test_file", tags=["pets"], paths=["/pets/*"], operation_ids=["getPet"])
+        mock.assert_called_once_with(
+            kind="openapi",
+            file="test_file",
+            app_id=None,
+            requirements_file=None,
+            package_root=None,
+            tags=["pets"],
+            paths=["/pets/*"],
+            operation_ids=["getPet"],
+            build_processes=1,
+            use_schema_cache=True
+        )
+
+def test_tool_import_call_openapi_with_build_processes():
+    with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tool") as mock:
+        tools_command.tool_import(kind="openapi", file="test_file", build_processes=4)
+        mock.assert_called_once_with(
+            kind="openapi",
+            file="test_file",
+            app_id=None,
+            requirements_file=None,
+            package_root=None,
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=4,
+            use_schema_cache=True
+        )
+
+def test_tool_import_call_no_cache():
+    with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tool") as mock:
+        tools_command.tool_import(kind="python", file="test_file", no_cache=True)
+        mock.assert_called_once_with(
+            kind="python",
+            file="test_file",
+            app_id=None,
+            requirements_file=None,
+            package_root=None,
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=False
+        )
+
+def test_tool_import_skip_unchanged_artifacts():
+    with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController") as mock_controller:
+        tools_command.tool_import(kind="python", file="test_file")
+        tools_command.tool_import(kind="python", file="test_file", skip_unchanged_artifacts=True)
+
+        assert [call.kwargs["use_artifact_cache"] for call in mock_controller.call_args_list] == [False, True]
+
 def test_tool_import_call_flow():
     with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tool") as mock:
         tools_command.tool_import(kind="flow", file="test_file")
@@ -46,7 +116,12 @@ def test_tool_import_call_flow():
             file="test_file",
             app_id=None,
             requirements_file=None,
-            package_root=None
+            package_root=None,
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
 # def test_tool_import_call_skill():
@@ -75,7 +150,12 @@ def test_tool_import_call_langflow():
             file="test_file.json",
             app_id=None,
             requirements_file="tests/cli/resources/langflow_samples/requirements.txt",
-            package_root=None
+            package_root=None,
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
 def test_tool_remove():
@@ -121,7 +201,12 @@ def test_tool_import_call_python_with_package_root():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="tests/cli/resources/python_samples"
+            package_root="tests/cli/resources/python_samples",
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
 def test_tool_import_call_python_with_package_root_as_empty_string():
@@ -135,7 +220,12 @@ def test_tool_import_call_python_with_package_root_as_empty_string():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root=""
+            package_root="",
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
 def test_tool_import_call_python_with_package_root_as_whitespace():
@@ -149,7 +239,12 @@ def test_tool_import_call_python_with_package_root_as_whitespace():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="    "
+            package_root="    ",
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
 def test_tool_import_call_python_with_package_root_includes_whitespace_at_start_and_end():
@@ -163,7 +258,12 @@ def test_tool_import_call_python_with_package_root_includes_whitespace_at_start_
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="  tests/cli/resources/python_samples  "
+            package_root="  tests/cli/resources/python_samples  ",
+            tags=None,
+            paths=None,
+            operation_ids=None,
+            build_processes=1,
+            use_schema_cache=True
         )
 
 def test_tool_export_call():
@@ -1,14 +1,19 @@
 import re
-from typing import Literal
+from typing import List, Literal
 from unittest import mock
 from unittest.mock import call
 
 from ibm_watsonx_orchestrate.agent_builder.tools.langflow_tool import LangflowTool
 from ibm_watsonx_orchestrate.agent_builder.tools.python_tool import PythonTool
-from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController, ToolKind, _get_kind_from_spec
+from ibm_watsonx_orchestrate.cli.commands.tools import tools_controller as tools_controller_module
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController, ToolKind, _get_kind_from_spec, get_whl_in_registry
 from ibm_watsonx_orchestrate.agent_builder.tools.types import ToolPermission, ToolSpec
 from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import OpenAPITool
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
+from ibm_watsonx_orchestrate.cli.common import ImportStatus
+from ibm_watsonx_orchestrate.cli.common import ListFormats
+from ibm_watsonx_orchestrate.cli.commands.tools.artifact_cache import ToolArtifactCache, compute_artifact_digest
+from ibm_watsonx_orchestrate.cli.commands.tools.schema_cache import ToolSchemaCache
 from ibm_watsonx_orchestrate.cli.config import DEFAULT_CONFIG_FILE_CONTENT, PYTHON_REGISTRY_HEADER, \
     PYTHON_REGISTRY_TYPE_OPT
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
@@ -173,14 +178,30 @@ def run_around_tests():
     yield
     os.chdir(original_path)
 
+@pytest.fixture(autouse=True)
+def isolate_artifact_cache(tmp_path):
+    with mock.patch(
+        "ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.ToolArtifactCache",
+        side_effect=lambda: ToolArtifactCache(cache_folder=str(tmp_path))
+    ):
+        yield
+
+@pytest.fixture(autouse=True)
+def isolate_schema_cache(tmp_path):
+    with mock.patch(
+        "ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.ToolSchemaCache",
+        side_effect=lambda: ToolSchemaCache(cache_folder=str(tmp_path / "tool_schemas"))
+    ):
+        yield
+
 
 
 def test_openapi_params_valid():
     calls = []
 
-    async def create_openapi_json_tools_from_uri(*args, **kwargs):
+    async def iter_openapi_json_tools_from_uri(*args, **kwargs):
         calls.append((args, kwargs))
-        return []
+        return iter([])
 
     client = MockConnectionClient(
         get_by_id_response=MockListConnectionResponse(connection_id='connectionId'),
@@ -189,8 +210,8 @@ def test_openapi_params_valid():
     
     with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.is_local_dev", return_value=True),\
          mock.patch(
-            'ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.create_openapi_json_tools_from_uri',
-            create_openapi_json_tools_from_uri
+            'ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.iter_openapi_json_tools_from_uri',
+            iter_openapi_json_tools_from_uri
          ), \
          mock.patch('ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.get_connections_client') as client_mock:
         client_mock.return_value = client
@@ -205,7 +226,7 @@ def test_openapi_params_valid():
         assert calls == [
             (
                 ('../resources/yaml_samples/tool.yaml', 'connectionId'),
-                {}
+                {'operation_filter': None, 'max_workers': 1}
             )
         ]
 
@@ -261,14 +282,14 @@ def test_openapi_params_valid():
 def test_openapi_no_app_id():
     calls = []
 
-    async def create_openapi_json_tools_from_uri(*args, **kwargs):
+    async def iter_openapi_json_tools_from_uri(*args, **kwargs):
         calls.append((args, kwargs))
-        return []
+        return iter([])
 
     with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.is_local_dev", return_value=True),\
          mock.patch(
-            'ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.create_openapi_json_tools_from_uri',
-            create_openapi_json_tools_from_uri
+            'ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.iter_openapi_json_tools_from_uri',
+            iter_openapi_json_tools_from_uri
          ), \
          mock.patch(
             'ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.get_connections_client'
@@ -283,7 +304,7 @@ def test_openapi_no_app_id():
         assert calls == [
             (
                 ('tests/cli/resources/yaml_samples/tool.yaml', None),
-                {}
+                {'operation_filter': None, 'max_workers': 1}
             )
         ]
 
@@ -1039,6 +1060,39 @@ def test_tool_list(mock_get_client):
 
 
 
+class MockToolKitLookupClient:
+    def __init__(self, toolkits):
+        self.toolkits = toolkits
+        self.requests = []
+
+    def get_drafts_by_ids(self, toolkit_ids):
+        self.requests.append(list(toolkit_ids))
+        return [t for t in self.toolkits if t["id"] in toolkit_ids]
+
+
+def test_tool_list_resolves_toolkits_in_single_request():
+    tool_specs = [
+        {
+            "name": f"test_tool_{i}",
+            "description": "testing_tool",
+            "permission": "read_only",
+            "toolkit_id": "toolkit_1" if i % 2 else "toolkit_2",
+            "binding": {"python": {"function": "test_function"}}
+        } for i in range(6)
+    ]
+    toolkit_client = MockToolKitLookupClient([{"id": "toolkit_1", "name": "first"}, {"id": "toolkit_2", "name": "second"}])
+
+    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.ToolsController.get_client", return_value=MockToolClient(get_response=tool_specs)), \
+         mock.patch('ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.instantiate_client', return_value=toolkit_client), \
+         mock.patch('ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.get_connections_client', return_value=MockConnectionClient()):
+        tools_controller = ToolsController()
+        entries = tools_controller.list_tools(format=ListFormats.JSON)
+
+    assert len(toolkit_client.requests) == 1
+    assert sorted(toolkit_client.requests[0]) == ["toolkit_1", "toolkit_2"]
+    assert [entry.toolkit for entry in entries] == ["second", "first"] * 3
+
+
 @mock.patch(
     "ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.ToolsController.get_client",
     return_value=MockToolClient(get_response=[
@@ -1841,3 +1895,408 @@ def test_langflow_tool_update():
 
         mock_update.assert_called_once_with(tool_id=tool_id,tool=tools[0],tool_artifact=None)
     
+
+
+class MockBulkToolClient:
+    def __init__(self, existing_tools=None, fail_on=None):
+        self.existing_tools = existing_tools or []
+        self.fail_on = fail_on
+        self.lookups = []
+        self.created = []
+        self.updated = []
+
+    def get_drafts_by_names(self, names):
+        self.lookups.append(list(names))
+        return [tool for tool in self.existing_tools if tool["name"] in names]
+
+    def get_draft_by_name(self, tool_name):
+        raise AssertionError("bulk publishing should not look up tools one at a time")
+
+    def create(self, spec):
+        if spec["name"] == self.fail_on:
+            raise Exception("create failed")
+        self.created.append(spec["name"])
+        return {"id": str(uuid.uuid4())}
+
+    def update(self, tool_id, spec):
+        self.updated.append((tool_id, spec["name"]))
+
+
+def _openapi_tool(name: str) -> OpenAPITool:
+    return OpenAPITool(spec=ToolSpec(
+        name=name,
+        description=name,
+        permission=ToolPermission.READ_ONLY,
+        binding={"openapi": {
+            "http_method": "GET",
+            "http_path": f"/{name}",
+            "servers": ["test"],
+        }}
+    ))
+
+
+def test_bulk_publish_resolves_existing_tools_in_one_lookup():
+    tools = [_openapi_tool(f"tool_{i}") for i in range(5)]
+    client = MockBulkToolClient(existing_tools=[{"name": "tool_1", "id": "id_1"}, {"name": "tool_3", "id": "id_3"}])
+
+    tools_controller = ToolsController()
+    tools_controller.client = client
+
+    results = tools_controller.bulk_publish_or_update_tools(tools, max_workers=3)
+
+    assert client.lookups == [[f"tool_{i}" for i in range(5)]]
+    assert sorted(client.created) == ["tool_0", "tool_2", "tool_4"]
+    assert sorted(client.updated) == [("id_1", "tool_1"), ("id_3", "tool_3")]
+    assert [result.name for result in results] == [f"tool_{i}" for i in range(5)]
+    assert [result.status for result in results] == [
+        ImportStatus.CREATED,
+        ImportStatus.UPDATED,
+        ImportStatus.CREATED,
+        ImportStatus.UPDATED,
+        ImportStatus.CREATED,
+    ]
+
+
+def test_bulk_publish_lookup_is_chunked():
+    client = MockBulkToolClient()
+    tools_controller = ToolsController()
+    tools_controller.client = client
+
+    tools_controller._get_existing_tool_ids([f"tool_{i}" for i in range(5)], chunk_size=2)
+
+    assert client.lookups == [["tool_0", "tool_1"], ["tool_2", "tool_3"], ["tool_4"]]
+
+
+def test_bulk_publish_streams_tools_in_chunks():
+    produced = []
+
+    def produce_tools():
+        for i in range(60):
+            produced.append(i)
+            yield _openapi_tool(f"tool_{i}")
+
+    client = MockBulkToolClient(existing_tools=[{"name": "tool_55", "id": "id_55"}])
+    tools_controller = ToolsController()
+    tools_controller.client = client
+    lookups_seen = []
+    get_existing_tool_ids = tools_controller._get_existing_tool_ids
+
+    def record_lookup(tool_names):
+        lookups_seen.append(len(produced))
+        return get_existing_tool_ids(tool_names)
+
+    tools_controller._get_existing_tool_ids = record_lookup
+
+    results = tools_controller.bulk_publish_or_update_tools(produce_tools(), max_workers=4)
+
+    assert lookups_seen == [50, 60]
+    assert [len(lookup) for lookup in client.lookups] == [50, 10]
+    assert [result.name for result in results] == [f"tool_{i}" for i in range(60)]
+    assert results[55].status == ImportStatus.UPDATED
+    assert len(client.created) == 59
+
+
+def test_bulk_publish_no_tools():
+    client = MockBulkToolClient()
+    tools_controller = ToolsController()
+    tools_controller.client = client
+
+    assert tools_controller.bulk_publish_or_update_tools(iter([])) == []
+    assert client.lookups == []
+
+
+def test_bulk_publish_captures_per_tool_failures(caplog):
+    tools = [_openapi_tool("ok_tool"), _openapi_tool("bad_tool")]
+    client = MockBulkToolClient(fail_on="bad_tool")
+    tools_controller = ToolsController()
+    tools_controller.client = client
+
+    results = tools_controller.bulk_publish_or_update_tools(tools, max_workers=2)
+
+    assert results[0].status == ImportStatus.CREATED
+    assert results[1].status == ImportStatus.FAILED
+    assert results[1].error == "create failed"
+    assert "1 of 2 tools failed to import" in caplog.text
+
+
+def test_concurrent_import_exits_non_zero_on_failure(caplog):
+    tools = [_openapi_tool("ok_tool"), _openapi_tool("bad_tool")]
+    client = MockBulkToolClient(fail_on="bad_tool")
+    tools_controller = ToolsController()
+    tools_controller.client = client
+
+    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.print_import_summary") as mock_summary, pytest.raises(SystemExit) as e:
+        tools_controller.publish_or_update_tools(tools, concurrency=2)
+
+    assert e.value.code == 1
+    mock_summary.assert_called_once()
+    assert client.created == ["ok_tool"]
+
+
+def test_bulk_publish_captures_exits_while_building_artifacts(caplog):
+    tools = [_openapi_tool("ok_tool"), _openapi_tool("bad_tool")]
+    client = MockBulkToolClient()
+    tools_controller = ToolsController()
+    tools_controller.client = client
+    build_tool_artifact = tools_controller._build_tool_artifact
+
+    def build_or_exit(tool, **kwargs):
+        if tool.__tool_spec__.name == "bad_tool":
+            sys.exit(1)
+        return build_tool_artifact(tool=tool, **kwargs)
+
+    with mock.patch.object(tools_controller, "_build_tool_artifact", side_effect=build_or_exit):
+        results = tools_controller.bulk_publish_or_update_tools(tools, max_workers=2)
+
+    assert [result.status for result in results] == [ImportStatus.CREATED, ImportStatus.FAILED]
+    assert results[1].error == "Exited with code 1"
+    assert client.created == ["ok_tool"]
+
+
+def test_bulk_publish_multiple_existing_tools(caplog):
+    client = MockBulkToolClient(existing_tools=[{"name": "dup", "id": "1"}, {"name": "dup", "id": "2"}])
+    tools_controller = ToolsController()
+    tools_controller.client = client
+
+    with pytest.raises(SystemExit):
+        tools_controller.bulk_publish_or_update_tools([_openapi_tool("dup")])
+
+    assert "Multiple existing tools found with name 'dup'" in caplog.text
+
+
+class MockArtifactToolClient:
+    def __init__(self, tool_id):
+        self.tool_id = tool_id
+        self.uploads = 0
+
+    def get_draft_by_name(self, tool_name):
+        return [{"name": tool_name, "id": self.tool_id}]
+
+    def update(self, tool_id, spec):
+        pass
+
+    def upload_tools_artifact(self, tool_id, file_path):
+        self.uploads += 1
+
+
+def _publish_python_tool(tmp_path, tool_file, client, use_artifact_cache=True, description="cached tool"):
+    spec = ToolSpec(
+        name="cached_tool",
+        description=description,
+        permission=ToolPermission.READ_ONLY,
+        binding={"python": {"function": "cached_tool:my_tool"}}
+    )
+    tools_controller = ToolsController(ToolKind.python, str(tool_file), use_artifact_cache=use_artifact_cache)
+    tools_controller.client = client
+    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.Config") as mock_cfg:
+        cfg = MockConfig2()
+        cfg.save(DEFAULT_CONFIG_FILE_CONTENT)
+        cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, RegistryType.LOCAL)
+        mock_cfg.return_value = cfg
+        tools_controller.publish_or_update_tools([PythonTool(fn="cached_tool:my_tool", spec=spec)])
+
+
+def test_unchanged_python_tool_skips_upload(tmp_path):
+    tool_file = tmp_path / "cached_tool.py"
+    tool_file.write_text("def my_tool():\n    pass\n")
+    client = MockArtifactToolClient(tool_id="cached-tool-id")
+
+    _publish_python_tool(tmp_path, tool_file, client)
+    _publish_python_tool(tmp_path, tool_file, client)
+
+    assert client.uploads == 1
+
+
+def test_changed_python_tool_is_uploaded(tmp_path):
+    tool_file = tmp_path / "cached_tool.py"
+    tool_file.write_text("def my_tool():\n    pass\n")
+    client = MockArtifactToolClient(tool_id="cached-tool-id")
+
+    _publish_python_tool(tmp_path, tool_file, client)
+    tool_file.write_text("def my_tool():\n    return 1\n")
+    _publish_python_tool(tmp_path, tool_file, client)
+
+    assert client.uploads == 2
+
+
+def test_python_tool_with_changed_spec_is_uploaded(tmp_path):
+    tool_file = tmp_path / "cached_tool.py"
+    tool_file.write_text("def my_tool():\n    pass\n")
+    client = MockArtifactToolClient(tool_id="cached-tool-id")
+
+    _publish_python_tool(tmp_path, tool_file, client)
+    _publish_python_tool(tmp_path, tool_file, client, description="changed description")
+
+    assert client.uploads == 2
+
+
+def test_artifact_cache_is_opt_in(tmp_path):
+    tool_file = tmp_path / "cached_tool.py"
+    tool_file.write_text("def my_tool():\n    pass\n")
+    client = MockArtifactToolClient(tool_id="cached-tool-id")
+
+    _publish_python_tool(tmp_path, tool_file, client, use_artifact_cache=False)
+    _publish_python_tool(tmp_path, tool_file, client, use_artifact_cache=False)
+
+    assert ToolsController().artifact_cache is None
+    assert client.uploads == 2
+
+
+def test_artifact_cache_reads_and_writes_once(tmp_path):
+    cache = ToolArtifactCache(cache_folder=str(tmp_path))
+    with mock.patch.object(cache, "_config", wraps=cache._config) as mock_config:
+        assert cache.get("tool_1") is None
+        for i in range(5):
+            cache.set(f"tool_{i}", f"digest_{i}")
+        assert cache.matches("tool_3", "digest_3")
+        cache.flush()
+        cache.flush()
+
+    assert mock_config.call_count == 2
+    assert ToolArtifactCache(cache_folder=str(tmp_path)).get("tool_4") == "digest_4"
+
+
+def test_compute_artifact_digest(tmp_path):
+    tool_file = tmp_path / "tool.py"
+    tool_file.write_text("print('a')")
+    files = [(str(tool_file), "tool.py")]
+
+    digest = compute_artifact_digest(files, ["requests\n"], "{}")
+
+    assert digest == compute_artifact_digest(files, ["requests\n"], "{}")
+    assert digest != compute_artifact_digest(files, ["requests==2.0\n"], "{}")
+    assert digest != compute_artifact_digest(files, ["requests\n"], '{"name": "tool"}')
+
+
+class TestGetWhlInRegistry:
+    registry_url = "https://pypi.org/simple/ibm-watsonx-orchestrate"
+    index = '<a href="https://files/ibm_watsonx_orchestrate-1.0.0-py3-none-any.whl#sha256=abc">whl</a>'
+
+    @pytest.fixture(autouse=True)
+    def registry_cache(self, tmp_path):
+        with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.REGISTRY_CACHE_FOLDER", str(tmp_path)), \
+             mock.patch.dict("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller._REGISTRY_CACHE", clear=True):
+            yield tmp_path
+
+    def test_lookup_is_memoized(self):
+        with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.requests.get") as mock_get:
+            mock_get.return_value.text = self.index
+            first = get_whl_in_registry(registry_url=self.registry_url, version="1.0.0")
+            second = get_whl_in_registry(registry_url=self.registry_url, version="1.0.0")
+
+        assert first == second == "https://files/ibm_watsonx_orchestrate-1.0.0-py3-none-any.whl"
+        mock_get.assert_called_once_with(self.registry_url)
+
+    def test_lookup_is_persisted(self):
+        with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.requests.get") as mock_get:
+            mock_get.return_value.text = self.index
+            get_whl_in_registry(registry_url=self.registry_url, version="1.0.0")
+            tools_controller_module._REGISTRY_CACHE.clear()
+            wheel_file = get_whl_in_registry(registry_url=self.registry_url, version="1.0.0")
+
+        assert wheel_file == "https://files/ibm_watsonx_orchestrate-1.0.0-py3-none-any.whl"
+        mock_get.assert_called_once()
+
+    def test_expired_entry_is_refetched(self):
+        with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.requests.get") as mock_get:
+            mock_get.return_value.text = self.index
+            get_whl_in_registry(registry_url=self.registry_url, version="1.0.0")
+            tools_controller_module._REGISTRY_CACHE.clear()
+            get_whl_in_registry(registry_url=self.registry_url, version="1.0.0", ttl=-1)
+
+        assert mock_get.call_count == 2
+
+    def test_missing_version_is_not_cached(self):
+        with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.requests.get") as mock_get:
+            mock_get.return_value.text = self.index
+            assert get_whl_in_registry(registry_url=self.registry_url, version="2.0.0") is None
+            assert get_whl_in_registry(registry_url=self.registry_url, version="2.0.0") is None
+
+        assert mock_get.call_count == 2
+
+
+def _write_python_tools(folder: Path, module_name: str, count: int, description: str = "Looks up items") -> str:
+    tools = [
+        "from typing import List, Optional",
+        "from pydantic import BaseModel",
+        "from ibm_watsonx_orchestrate.agent_builder.tools import tool",
+        "",
+        "class Item(BaseModel):",
+        "    name: str",
+        "    tags: List[str] = []",
+    ]
+    for i in range(count):
+        tools.append(f"""
+@tool
+def {module_name}_{i}(query: str, limit: Optional[int] = None, item: Optional[Item] = None) -> List[Item]:
+    \"\"\"
+    {description} {i}.
+
+    Args:
+        query: the query to search for
+        limit: the maximum number of items to return
+        item: an item to compare against
+
+    Returns:
+        The matching items
+    \"\"\"
+    return []
+""")
+    file = folder / f"{module_name}.py"
+    file.write_text("\n".join(tools))
+    return str(file)
+
+
+def _import_python_tools(file: str, use_schema_cache: bool = True) -> List[PythonTool]:
+    sys.modules.pop(Path(file).stem, None)
+    try:
+        return tools_controller_module.import_python_tool(file, use_schema_cache=use_schema_cache)
+    finally:
+        sys.modules.pop(Path(file).stem, None)
+
+
+def _record_schema_cache_hits(hits: List[bool]):
+    load_spec = ToolSchemaCache.load_spec
+
+    def record(cache, tool):
+        hit = load_spec(cache, tool)
+        hits.append(hit)
+        return hit
+
+    return mock.patch.object(ToolSchemaCache, "load_spec", record)
+
+
+def test_python_tool_schema_cache_reuses_specs(tmp_path):
+    file = _write_python_tools(tmp_path, "schema_cache_tools", 3)
+    hits = []
+
+    with _record_schema_cache_hits(hits):
+        first = [tool.dumps_spec() for tool in _import_python_tools(file)]
+        second = [tool.dumps_spec() for tool in _import_python_tools(file)]
+    uncached = [tool.dumps_spec() for tool in _import_python_tools(file, use_schema_cache=False)]
+
+    assert hits == [False] * 3 + [True] * 3
+    assert second == first == uncached
+    assert len(os.listdir(tmp_path / "tool_schemas")) == 3
+
+
+def test_python_tool_schema_cache_invalidated_by_changes(tmp_path):
+    file = _write_python_tools(tmp_path, "schema_cache_changed_tools", 1)
+    _import_python_tools(file)
+    _write_python_tools(tmp_path, "schema_cache_changed_tools", 1, description="Finds items")
+    hits = []
+
+    with _record_schema_cache_hits(hits):
+        tools = _import_python_tools(file)
+
+    assert hits == [False]
+    assert tools[0].__tool_spec__.description.strip() == "Finds items 0."
+
+
+def test_python_tool_schema_cache_disabled(tmp_path):
+    file = _write_python_tools(tmp_path, "schema_cache_disabled_tools", 1)
+
+    _import_python_tools(file, use_schema_cache=False)
+
+    assert not (tmp_path / "tool_schemas").exists()
+
@@ -0,0 +1,258 @@
+import json
+import zipfile
+from types import SimpleNamespace
+import pytest
+from unittest.mock import MagicMock, patch
+
+from ibm_watsonx_orchestrate.agent_builder.models.types import ListVirtualModel
+from ibm_watsonx_orchestrate.cli.common import ImportResult, ImportStatus
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController
+from ibm_watsonx_orchestrate.cli.commands.workspace.workspace_controller import WorkspaceController
+from ibm_watsonx_orchestrate.cli.commands.workspace.types import (
+    WORKSPACE_MANIFEST_FILE,
+    WorkspaceManifest,
+    WorkspaceResourceKind,
+)
+from ibm_watsonx_orchestrate.client.connections.connections_client import ListConfigsResponse
+
+MODULE = "ibm_watsonx_orchestrate.cli.commands.workspace.workspace_controller"
+
+PYTHON_TOOL = {
+    "id": "tool-1",
+    "name": "python_tool",
+    "description": "A python tool",
+    "permission": "read_only",
+    "binding": {"python": {"function": "tool:python_tool", "connections": {"my_app": "source-conn"}}},
+}
+OPENAPI_TOOL = {
+    "id": "tool-2",
+    "name": "openapi_tool",
+    "description": "An openapi tool",
+    "permission": "read_only",
+    "binding": {"openapi": {"http_method": "GET", "http_path": "/items", "servers": ["https://example.com"], "connection_id": "source-conn"}},
+}
+TOOLKIT_TOOL = {
+    "id": "tool-3",
+    "name": "toolkit_tool",
+    "description": "A toolkit tool",
+    "permission": "read_only",
+    "toolkit_id": "toolkit-1",
+    "binding": {"mcp": {"source": "files", "connections": {}}},
+}
+AGENT = {
+    "id": "agent-1",
+    "name": "agent_1",
+    "kind": "native",
+    "description": "An agent",
+    "llm": "watsonx/ibm/granite-3-8b-instruct",
+    "style": "default",
+    "tools": ["tool-1"],
+}
+
+
+def _client(**methods) -> MagicMock:
+    client = MagicMock()
+    for name, return_value in methods.items():
+        setattr(client, name, MagicMock(return_value=return_value))
+    return client
+
+
+def _controller() -> WorkspaceController:
+    controller = WorkspaceController()
+    controller.agents_controller = MagicMock()
+    controller.tools_controller = MagicMock()
+    controller.knowledge_base_controller = MagicMock()
+    controller.models_controller = MagicMock()
+    controller.toolkit_controller = MagicMock()
+    return controller
+
+
+def _export_controller() -> WorkspaceController:
+    controller = _controller()
+    controller.models_controller.get_models_client.return_value = _client(list=[
+        ListVirtualModel(id="model-1", name="virtual-model/openai/gpt-4o", display_name="gpt-4o", connection_id="source-conn"),
+        ListVirtualModel(id="model-2", name="watsonx/ibm/granite"),
+    ])
+    controller.models_controller.get_model_policies_client.return_value = _client(list=[])
+    controller.knowledge_base_controller.get_client.return_value = _client(get=[{"id": "kb-1", "name": "kb_1"}])
+    controller.knowledge_base_controller.get_knowledge_base_export_spec.return_value = {"name": "kb_1", "kind": "knowledge_base"}
+    controller.toolkit_controller.get_client.return_value = _client(get=[{"id": "toolkit-1", "name": "toolkit_1"}])
+    controller.tools_controller.get_client.return_value = _client(get=[PYTHON_TOOL, OPENAPI_TOOL, TOOLKIT_TOOL])
+    controller.tools_controller.download_tool_artifact.return_value = b"artifact"
+    controller.agents_controller.get_native_client.return_value = _client(get=[AGENT])
+    controller.agents_controller.get_external_client.return_value = _client(get=[])
+    controller.agents_controller.get_assistant_client.return_value = _client(get=[])
+    controller.agents_controller.get_spec_file_content.side_effect = lambda agent: {**AGENT, "tools": ["python_tool"], "hidden": False}
+    return controller
+
+
+def _export(tmp_path) -> str:
+    output_path = str(tmp_path / "workspace.zip")
+    connections_client = _client(list=[ListConfigsResponse(connection_id="source-conn", app_id="my_app")])
+    with patch(f"{MODULE}.get_connections_client", return_value=connections_client), \
+        patch(f"{MODULE}.get_connection_configs", return_value=[MagicMock()]), \
+        patch(f"{MODULE}._combine_connection_configs", return_value={"app_id": "my_app", "kind": "connection"}):
+        _export_controller().export_workspace(output_path, concurrency=2)
+    return output_path
+
+
+class TestWorkspaceExport:
+    def test_export_writes_resources_and_manifest(self, tmp_path):
+        output_path = _export(tmp_path)
+
+        with zipfile.ZipFile(output_path) as zip_file:
+            names = set(zip_file.namelist())
+            manifest = WorkspaceManifest.model_validate_json(zip_file.read(WORKSPACE_MANIFEST_FILE))
+            python_tool_spec = json.loads(zip_file.read("tools/python_tool/spec.json"))
+            assert zip_file.namelist()[-1] == WORKSPACE_MANIFEST_FILE
+
+        assert manifest.connections == {"source-conn": "my_app"}
+        assert {(entry.kind, entry.name) for entry in manifest.resources} == {
+            (WorkspaceResourceKind.CONNECTION, "my_app"),
+            (WorkspaceResourceKind.MODEL, "virtual-model/openai/gpt-4o"),
+            (WorkspaceResourceKind.KNOWLEDGE_BASE, "kb_1"),
+            (WorkspaceResourceKind.TOOLKIT, "toolkit_1"),
+            (WorkspaceResourceKind.TOOL, "python_tool"),
+            (WorkspaceResourceKind.TOOL, "openapi_tool"),
+            (WorkspaceResourceKind.AGENT, "agent_1"),
+        }
+        for entry in manifest.resources:
+            assert entry.path in names
+        assert "tools/python_tool/artifact.zip" in names
+        assert "tools/openapi_tool/artifact.zip" not in names
+        assert "id" not in python_tool_spec
+        assert "agents/native/agent_1.yaml" in names
+
+    def test_export_rejects_non_zip_output(self, tmp_path):
+        with pytest.raises(SystemExit):
+            _controller().export_workspace(str(tmp_path / "workspace.yaml"))
+
+
+class TestWorkspaceImport:
+    def _import(self, bundle_path: str, controller: WorkspaceController):
+        connections_client = _client(list=[ListConfigsResponse(connection_id="target-conn", app_id="my_app")])
+        with patch(f"{MODULE}.get_connections_client", return_value=connections_client), \
+            patch(f"{MODULE}.import_connection") as mock_import_connection:
+            results = controller.import_workspace(bundle_path, concurrency=2)
+        return results, mock_import_connection
+
+    def _import_failing(self, bundle_path: str, controller: WorkspaceController):
+        with patch(f"{MODULE}.print_import_summary") as mock_print_summary:
+            with pytest.raises(SystemExit) as e:
+                self._import(bundle_path, controller)
+        assert e.value.code == 1
+        return mock_print_summary.call_args.args[0]
+
+    def _import_controller(self) -> WorkspaceController:
+        controller = _controller()
+        # tools are imported through the real bulk path of the tools controller
+        controller.tools_controller = ToolsController()
+        controller.tools_controller.client = _client(
+            get_drafts_by_names=[{"name": "openapi_tool", "id": "existing-tool"}],
+            create={"id": "new-tool"},
+        )
+        controller.agents_controller.bulk_publish_or_update_agents.return_value = [
+            ImportResult(name="agent_1", kind="native", status=ImportStatus.CREATED, duration=0.1)
+        ]
+        return controller
+
+    def test_import_applies_resources_and_rebinds_connections(self, tmp_path):
+        bundle_path = _export(tmp_path)
+        controller = self._import_controller()
+
+        with patch(f"{MODULE}.AgentsController.import_agent", return_value=["agent"]) as mock_import_agent:
+            results, mock_import_connection = self._import(bundle_path, controller)
+
+        statuses = {(result.kind, result.name): result.status for result in results}
+        assert statuses[(WorkspaceResourceKind.TOOL.value, "python_tool")] == ImportStatus.CREATED
+        assert statuses[(WorkspaceResourceKind.TOOL.value, "openapi_tool")] == ImportStatus.UPDATED
+        assert statuses[(WorkspaceResourceKind.TOOLKIT.value, "toolkit_1")] == ImportStatus.SKIPPED
+        assert statuses[(WorkspaceResourceKind.AGENT.value, "agent_1")] == ImportStatus.CREATED
+        assert [result.kind for result in results] == sorted([result.kind for result in results], key=[
+            WorkspaceResourceKind.CONNECTION, WorkspaceResourceKind.MODEL, WorkspaceResourceKind.KNOWLEDGE_BASE,
+            WorkspaceResourceKind.TOOLKIT, WorkspaceResourceKind.TOOL, WorkspaceResourceKind.AGENT
+        ].index)
+
+        mock_import_connection.assert_called_once()
+        model = controller.models_controller.publish_or_update_models.call_args.args[0]
+        assert model.connection_id == "target-conn"
+
+        tool_client = controller.tools_controller.client
+        created_spec = tool_client.create.call_args.args[0]
+        assert created_spec["binding"]["python"]["connections"] == {"my_app": "target-conn"}
+        updated_id, updated_spec = tool_client.update.call_args.args
+        assert updated_id == "existing-tool"
+        assert updated_spec["binding"]["openapi"]["connection_id"] == "target-conn"
+        tool_client.upload_tools_artifact.assert_called_once()
+        assert tool_client.upload_tools_artifact.call_args.kwargs["tool_id"] == "new-tool"
+        assert tool_client.upload_tools_artifact.call_args.kwargs["file_path"].endswith("tools/python_tool/artifact.zip")
+
+        mock_import_agent.assert_called_once()
+        # the workspace summary reports the agents, so the agents import must not print its own
+        controller.agents_controller.bulk_publish_or_update_agents.assert_called_once_with(["agent"], max_workers=2, print_summary=False)
+
+    def test_import_reports_tools_once(self, tmp_path):
+        bundle_path = _export(tmp_path)
+        controller = self._import_controller()
+
+        with patch(f"{MODULE}.AgentsController.import_agent", return_value=["agent"]), \
+            patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.print_import_summary") as mock_tools_summary:
+            self._import(bundle_path, controller)
+
+        mock_tools_summary.assert_not_called()
+
+    def test_import_failure_is_isolated_to_resource(self, tmp_path):
+        bundle_path = _export(tmp_path)
+        controller = self._import_controller()
+        controller.models_controller.publish_or_update_models.side_effect = SystemExit(1)
+
+        with patch(f"{MODULE}.AgentsController.import_agent", return_value=["agent"]):
+            results = self._import_failing(bundle_path, controller)
+
+        statuses = {(result.kind, result.name): result.status for result in results}
+        assert statuses[(WorkspaceResourceKind.MODEL.value, "virtual-model/openai/gpt-4o")] == ImportStatus.FAILED
+        assert statuses[(WorkspaceResourceKind.TOOL.value, "python_tool")] == ImportStatus.CREATED
+
+    def test_import_invalid_agent_file_is_isolated(self, tmp_path):
+        bundle_path = _export(tmp_path)
+        controller = self._import_controller()
+
+        with patch(f"{MODULE}.AgentsController.import_agent", side_effect=SystemExit(1)):
+            results = self._import_failing(bundle_path, controller)
+
+        agent_result = next(result for result in results if result.kind == WorkspaceResourceKind.AGENT)
+        assert (agent_result.name, agent_result.status, agent_result.error) == ("agent_1", ImportStatus.FAILED, "Exited with code 1")
+        controller.agents_controller.bulk_publish_or_update_agents.assert_not_called()
+
+    def test_import_agents_bulk_failure_is_isolated(self, tmp_path):
+        bundle_path = _export(tmp_path)
+        controller = self._import_controller()
+        controller.agents_controller.bulk_publish_or_update_agents.side_effect = SystemExit(1)
+
+        with patch(f"{MODULE}.AgentsController.import_agent", return_value=[SimpleNamespace(name="agent_1")]):
+            results = self._import_failing(bundle_path, controller)
+
+        statuses = {(result.kind, result.name): result.status for result in results}
+        assert statuses[(WorkspaceResourceKind.AGENT.value, "agent_1")] == ImportStatus.FAILED
+        assert statuses[(WorkspaceResourceKind.TOOL.value, "python_tool")] == ImportStatus.CREATED
+
+    def test_import_tool_failure_is_isolated_to_tool(self, tmp_path):
+        bundle_path = _export(tmp_path)
+        controller = self._import_controller()
+        controller.tools_controller.client.update.side_effect = Exception("boom")
+
+        with patch(f"{MODULE}.AgentsController.import_agent", return_value=["agent"]):
+            results = self._import_failing(bundle_path, controller)
+
+        statuses = {(result.kind, result.name): result.status for result in results}
+        assert statuses[(WorkspaceResourceKind.TOOL.value, "openapi_tool")] == ImportStatus.FAILED
+        assert statuses[(WorkspaceResourceKind.TOOL.value, "python_tool")] == ImportStatus.CREATED
+        assert statuses[(WorkspaceResourceKind.AGENT.value, "agent_1")] == ImportStatus.CREATED
+
+    def test_import_requires_manifest(self, tmp_path):
+        bundle_path = tmp_path / "agents.zip"
+        with zipfile.ZipFile(bundle_path, "w") as zip_file:
+            zip_file.writestr("agents/native/agent_1.yaml", "name: agent_1")
+
+        with pytest.raises(SystemExit):
+            _controller().import_workspace(str(bundle_path))
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import requests
+from pydantic import BaseModel
+
+from ibm_watsonx_orchestrate.cli.common import (
+    get_all_unique_resources,
+    construct_lookup_table,
+    lookup_resource_value,
+    batch_request_resource,
+    ImportResult,
+    ImportStatus,
+    describe_import_error,
+    import_failed,
+    print_import_summary,
+)
+
+
+class MockResource(BaseModel):
+    id: str
+    name: str
+    tools: list[str] | None = None
+
+
+class TestBulkResolution:
+    def test_get_all_unique_resources(self):
+        items = [MockResource(id="1", name="a", tools=["t1", "t2"]), MockResource(id="2", name="b", tools=["t2", "t3"])]
+        assert sorted(get_all_unique_resources(items, "tools")) == ["t1", "t2", "t3"]
+        assert sorted(get_all_unique_resources(items, "id")) == ["1", "2"]
+
+    def test_construct_lookup_table(self):
+        resources = [{"id": "1", "name": "a"}, MockResource(id="2", name="b")]
+        assert construct_lookup_table(resources, "id", "name") == {"1": "a", "2": "b"}
+
+    def test_lookup_resource_value_falls_back_to_id(self, caplog):
+        item = MockResource(id="1", name="a", tools=["t1", "missing"])
+        assert lookup_resource_value(item, {"t1": "tool_one"}, "tools", "Tool") == ["tool_one", "missing"]
+        assert "Tool with ID 'missing' not found" in caplog.text
+
+    def test_batch_request_resource(self):
+        calls = []
+
+        def client_fn(ids):
+            calls.append(ids)
+            return [{"id": i} for i in ids]
+
+        result = batch_request_resource(client_fn, [str(i) for i in range(5)], batch_size=2)
+        assert calls == [["0", "1"], ["2", "3"], ["4"]]
+        assert len(result) == 5
+
+
+class TestImportSummary:
+    def test_describe_import_error(self):
+        response = requests.Response()
+        response._content = b"bad request"
+
+        assert describe_import_error(requests.HTTPError(response=response)) == "bad request"
+        assert describe_import_error(SystemExit(1)) == "Exited with code 1"
+        assert describe_import_error(ValueError("invalid")) == "invalid"
+
+    def test_import_failed(self):
+        ok = ImportResult(name="a", status=ImportStatus.CREATED, duration=0)
+        failed = ImportResult(name="b", status=ImportStatus.FAILED, duration=0, error="boom")
+
+        assert not import_failed([ok])
+        assert import_failed([ok, failed])
+
+    def test_print_import_summary(self, caplog):
+        results = [
+            ImportResult(name="a", kind="native", status=ImportStatus.UPDATED, duration=0.5),
+            ImportResult(name="b", status=ImportStatus.FAILED, duration=0, error="boom"),
+        ]
+
+        with patch("ibm_watsonx_orchestrate.cli.common.rich.print") as mock_print:
+            print_import_summary(results, title="Agent import summary", resource_name="agents")
+
+        table = mock_print.call_args.args[0]
+        assert table.title == "Agent import summary"
+        assert [column.header for column in table.columns] == ["Name", "Kind", "Status", "Duration (s)", "Error"]
+        assert list(table.columns[2].cells) == ["updated", "failed"]
+        assert "1 of 2 agents failed to import" in caplog.text
+
+    def test_print_import_summary_without_kinds(self):
+        results = [ImportResult(name="a", status=ImportStatus.CREATED, duration=0)]
+
+        with patch("ibm_watsonx_orchestrate.cli.common.rich.print") as mock_print:
+            print_import_summary(results, title="Tool import summary", resource_name="tools")
+
+        assert [column.header for column in mock_print.call_args.args[0].columns] == ["Name", "Status", "Duration (s)", "Error"]
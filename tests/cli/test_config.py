@@ -1,7 +1,10 @@
+from ibm_watsonx_orchestrate.cli import config
 from ibm_watsonx_orchestrate.cli.config import Config
+from concurrent.futures import ThreadPoolExecutor
 import os
 import shutil
 import pytest
+import yaml
 
 TEST_CONFIG_FILE_FOLDER = os.path.join(os.path.dirname(__file__), "./resources/configs/temp")
 TEST_CONFIG_FILE_NAME = "test_config.yaml"
@@ -170,3 +173,72 @@ def test_config_save_existing_section(get_test_config):
     ]
     assert cfg.read("test_save_section2", "test_save_option_dict") == {"key": "value"}
     assert cfg.read("test_save_section2", "test_save_option_bool") == False
+
+
+def test_config_exists(get_test_config):
+    cfg = get_test_config
+
+    cfg.save({"test_section": {"test_option": {"nested": None}}})
+
+    assert cfg.exists("test_section")
+    assert cfg.exists("test_section", "test_option", "nested")
+    assert not cfg.exists("test_section", "fake")
+    assert not cfg.exists("test_section", "test_option", "nested", "deeper")
+    assert not cfg.exists("test_section']['test_option")
+
+
+def test_config_reads_are_cached(get_test_config, mocker):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", "test_value")
+    yaml_safe_load = mocker.spy(config, "yaml_safe_load")
+
+    for _ in range(5):
+        assert Config(config_file_folder=TEST_CONFIG_FILE_FOLDER, config_file=TEST_CONFIG_FILE_NAME).read("test_section", "test_option") == "test_value"
+        assert cfg.exists("test_section", "test_option")
+        assert cfg.get("test_section") == {"test_option": "test_value"}
+
+    assert yaml_safe_load.call_count == 0
+
+
+def test_config_returned_values_are_copies(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", {"key": "value"})
+
+    cfg.read("test_section", "test_option")["key"] = "changed"
+    cfg.get("test_section")["test_option"]["key"] = "changed"
+
+    assert cfg.read("test_section", "test_option") == {"key": "value"}
+
+
+def test_config_detects_external_changes(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", "test_value")
+
+    with open(TEST_FILE_PATH, "w") as f:
+        yaml.dump({"test_section": {"test_option": "changed_value"}}, f)
+
+    assert cfg.read("test_section", "test_option") == "changed_value"
+
+
+def test_config_concurrent_writes(get_test_config):
+    cfg = get_test_config
+
+    def write(i):
+        Config(config_file_folder=TEST_CONFIG_FILE_FOLDER, config_file=TEST_CONFIG_FILE_NAME).write("test_section", f"test_option_{i}", i)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, range(32)))
+
+    with open(TEST_FILE_PATH, "r") as f:
+        assert yaml.safe_load(f)["test_section"] == {f"test_option_{i}": i for i in range(32)}
+    assert not [name for name in os.listdir(TEST_CONFIG_FILE_FOLDER) if name.endswith(".tmp")]
+
+
+def test_config_delete(get_test_config):
+    cfg = get_test_config
+    cfg.save({"test_section": {"test_option": "test_value", "test_option2": "test_value2"}})
+
+    cfg.delete("test_section", "test_option")
+
+    assert not cfg.exists("test_section", "test_option")
+    assert cfg.read("test_section", "test_option2") == "test_value2"
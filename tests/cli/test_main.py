@@ -0,0 +1,65 @@
+import json
+import subprocess
+import sys
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from ibm_watsonx_orchestrate.cli.lazy_group import LazySubcommand, LazyTyperGroup
+from ibm_watsonx_orchestrate.cli.main import COMMANDS, app
+
+# imported by the lazy group of test_lazy_group_imports_only_invoked_command
+lazy_sub_app = typer.Typer()
+
+
+@lazy_sub_app.command(name="hello")
+def hello():
+    print("hello")
+
+
+@lazy_sub_app.command(name="bye")
+def bye():
+    print("bye")
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+def test_main_does_not_import_command_groups():
+    result = _run_python(
+        "import json, sys; import ibm_watsonx_orchestrate.cli.main; "
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('ibm_watsonx_orchestrate.cli.commands.') and m.endswith('_command'))))"
+    )
+
+    assert json.loads(result.stdout) == []
+
+
+@pytest.mark.parametrize("name", list(COMMANDS))
+def test_commands_resolve(name):
+    group = typer.main.get_command(app)
+    ctx = typer.Context(group)
+
+    command = group.get_command(ctx, name)
+
+    assert command is not None
+    assert command.name == name
+    if COMMANDS[name].help is not None:
+        assert command.help == COMMANDS[name].help
+
+
+def test_lazy_group_imports_only_invoked_command():
+    class Group(LazyTyperGroup):
+        lazy_subcommands = {
+            "greet": LazySubcommand(f"{__name__}:lazy_sub_app", help="Greetings"),
+            "missing": LazySubcommand("module_that_does_not_exist:app"),
+        }
+
+    lazy_app = typer.Typer(cls=Group, callback=lambda: None)
+    runner = CliRunner()
+    result = runner.invoke(lazy_app, ["greet", "hello"])
+
+    assert result.exit_code == 0
+    assert result.output == "hello\n"
+    assert typer.main.get_command(lazy_app).list_commands(None) == ["greet", "missing"]
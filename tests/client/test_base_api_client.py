@@ -0,0 +1,183 @@
+import httpx
+import pytest
+from unittest.mock import patch, MagicMock
+
+from ibm_watsonx_orchestrate.client import base_api_client
+from ibm_watsonx_orchestrate.client.base_api_client import get_session, close_sessions, configure_sessions, ClientAPIException
+from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient, AsyncToolClient
+from ibm_watsonx_orchestrate.client.threads.threads_client import ThreadsClient, AsyncThreadsClient
+from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient
+
+
+@pytest.fixture(autouse=True)
+def reset_sessions():
+    close_sessions()
+    yield
+    configure_sessions(
+        pool_connections=base_api_client.DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=base_api_client.DEFAULT_POOL_MAXSIZE,
+        max_retries=base_api_client.DEFAULT_MAX_RETRIES,
+        backoff_factor=base_api_client.DEFAULT_BACKOFF_FACTOR,
+        status_forcelist=base_api_client.DEFAULT_RETRY_STATUS_CODES,
+    )
+
+
+class TestGetSession:
+    def test_same_host_shares_session(self):
+        assert get_session("https://api.example.com/v1/orchestrate") is get_session("https://API.example.com/other")
+
+    def test_different_hosts_get_different_sessions(self):
+        assert get_session("https://a.example.com") is not get_session("https://b.example.com")
+
+    def test_clients_share_session(self):
+        tool_client = ToolClient(base_url="https://api.example.com")
+        agent_client = AgentClient(base_url="https://api.example.com")
+        assert tool_client.session is agent_client.session
+
+    def test_close_sessions_creates_new_session(self):
+        session = get_session("https://api.example.com")
+        close_sessions()
+        assert get_session("https://api.example.com") is not session
+
+    def test_configure_sessions(self):
+        configure_sessions(pool_maxsize=5, max_retries=1)
+        adapter = get_session("https://api.example.com").get_adapter("https://api.example.com")
+        assert adapter._pool_maxsize == 5
+        assert adapter.max_retries.total == 1
+
+
+class TestRequests:
+    def test_get_uses_shared_session(self):
+        client = ToolClient(base_url="https://api.example.com", api_key="token")
+        response = MagicMock()
+        response.json.return_value = {"ok": True}
+        with patch.object(client.session, "get", return_value=response) as mock_get:
+            result = client.get()
+
+        assert result == {"ok": True}
+        mock_get.assert_called_once_with(
+            "https://api.example.com/v1/orchestrate/tools",
+            headers={"Authorization": "Bearer token"},
+            params=None,
+            data=None,
+            verify=None,
+        )
+
+
+class TestThreadsClient:
+    def test_threads_messages_preserve_order_and_capture_errors(self):
+        def get_thread_messages(thread_id, page_size=None):
+            if thread_id == "b":
+                raise ClientAPIException(response=MagicMock(status_code=500, text="boom"))
+            return [{"thread_id": thread_id}]
+
+        client = ThreadsClient(base_url="https://api.example.com")
+        with patch.object(client, "get_thread_messages", side_effect=get_thread_messages):
+            result = client.get_threads_messages(["a", "b", "c"], max_concurrency=3, return_exceptions=True)
+
+        assert result[0] == [{"thread_id": "a"}]
+        assert isinstance(result[1], ClientAPIException)
+        assert result[2] == [{"thread_id": "c"}]
+
+    def test_threads_messages_raise_by_default(self):
+        client = ThreadsClient(base_url="https://api.example.com")
+        with patch.object(client, "get_thread_messages", side_effect=ClientAPIException(response=MagicMock(status_code=500, text="boom"))):
+            with pytest.raises(ClientAPIException):
+                client.get_threads_messages(["a", "b"], max_concurrency=2)
+
+    def test_thread_messages_paginates(self):
+        client = ThreadsClient(base_url="https://api.example.com")
+        pages = [[1, 2], [3, 4], [5]]
+        with patch.object(client, "_get", side_effect=pages) as mock_get:
+            result = client.get_thread_messages("a", page_size=2)
+
+        assert result == [1, 2, 3, 4, 5]
+        assert [c.kwargs["params"] for c in mock_get.call_args_list] == [
+            {"limit": 2, "offset": 0},
+            {"limit": 2, "offset": 2},
+            {"limit": 2, "offset": 4},
+        ]
+
+    @pytest.mark.parametrize("pages, expected", [
+        # empty last page
+        ([[{"id": 1}, {"id": 2}], []], [{"id": 1}, {"id": 2}]),
+        # limit is ignored
+        ([[{"id": 1}, {"id": 2}, {"id": 3}]], [{"id": 1}, {"id": 2}, {"id": 3}]),
+        # offset is ignored
+        ([[{"id": 1}, {"id": 2}], [{"id": 1}, {"id": 2}]], [{"id": 1}, {"id": 2}]),
+    ])
+    def test_thread_messages_pagination_stops_on_unexpected_pages(self, pages, expected):
+        client = ThreadsClient(base_url="https://api.example.com")
+        with patch.object(client, "_get", side_effect=pages) as mock_get:
+            result = client.get_thread_messages("a", page_size=2)
+
+        assert result == expected
+        assert mock_get.call_count == len(pages)
+
+    def test_thread_messages_pagination_is_capped(self, caplog):
+        client = ThreadsClient(base_url="https://api.example.com")
+        with patch.object(client, "_get", side_effect=lambda *args, params: [{"id": params["offset"]}, {"id": params["offset"] + 1}]) as mock_get:
+            result = client.get_thread_messages("a", page_size=2, max_pages=3)
+
+        assert len(result) == 6
+        assert mock_get.call_count == 3
+        assert "after 3 pages" in caplog.text
+
+
+class TestAsyncBaseAPIClient:
+    @pytest.mark.asyncio
+    async def test_get_returns_json(self):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json=[{"name": "tool"}])
+
+        async with AsyncToolClient(base_url="https://api.example.com", api_key="token", transport=httpx.MockTransport(handler)) as client:
+            result = await client.get_draft_by_name("tool")
+
+        assert result == [{"name": "tool"}]
+        assert str(requests_seen[0].url) == "https://api.example.com/v1/orchestrate/tools?names=tool"
+        assert requests_seen[0].headers["Authorization"] == "Bearer token"
+
+    @pytest.mark.asyncio
+    async def test_error_raises_client_api_exception(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(500, text="boom"))
+
+        async with AsyncToolClient(base_url="https://api.example.com", transport=transport) as client:
+            with pytest.raises(ClientAPIException) as e:
+                await client.get()
+
+        assert e.value.response.status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_not_found_draft_returns_empty(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(404, text="Tool not found with the given name"))
+
+        async with AsyncToolClient(base_url="https://api.example.com", transport=transport) as client:
+            assert await client.get_draft_by_id("123") == ""
+
+    @pytest.mark.asyncio
+    async def test_threads_messages_preserve_order(self):
+        def handler(request):
+            thread_id = request.url.path.split("/")[-2]
+            return httpx.Response(200, json={"thread_id": thread_id})
+
+        async with AsyncThreadsClient(base_url="https://api.example.com", transport=httpx.MockTransport(handler)) as client:
+            result = await client.get_threads_messages(["a", "b", "c"], max_concurrency=2)
+
+        assert result == [{"thread_id": "a"}, {"thread_id": "b"}, {"thread_id": "c"}]
+
+    @pytest.mark.asyncio
+    async def test_thread_messages_pagination_stops_when_offset_is_ignored(self):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json=[{"id": 1}, {"id": 2}])
+
+        async with AsyncThreadsClient(base_url="https://api.example.com", transport=httpx.MockTransport(handler)) as client:
+            result = await client.get_thread_messages("a", page_size=2)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        assert len(requests_seen) == 2
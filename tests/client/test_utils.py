@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch
+from ibm_watsonx_orchestrate.cli.config import Config
 from ibm_watsonx_orchestrate.client import utils
 from ibm_watsonx_orchestrate.client.utils import is_local_dev, check_token_validity, instantiate_client
 from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient
@@ -63,6 +64,12 @@ class TestCheckTokenValidity:
 
 class TestInstantiateClient:
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        utils.clear_client_cache()
+        yield
+        utils.clear_client_cache()
+
     def mock_yaml_safe_loader_no_active_env(self, file):
         return {}
     
@@ -135,7 +142,7 @@ class TestInstantiateClient:
         ],
     )
     def test_no_active_environment(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_no_active_env
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -156,7 +163,7 @@ class TestInstantiateClient:
         ],
     )
     def test_no_url_in_environment(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_no_url
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -178,7 +185,7 @@ class TestInstantiateClient:
         ],
     )
     def test_missing_token(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_missing_token
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -199,7 +206,7 @@ class TestInstantiateClient:
         ],
     )
     def test_invalid_token(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_invalid_token
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -208,3 +215,50 @@ class TestInstantiateClient:
 
             captured = caplog.text
             assert "The token found for environment 'testing' is missing or expired" in captured
+
+
+class TestInstantiateClientCache:
+
+    @pytest.fixture(autouse=True)
+    def config_files(self, tmp_path):
+        utils.clear_client_cache()
+        original = (utils.DEFAULT_CONFIG_FILE_FOLDER, utils.DEFAULT_CONFIG_FILE, utils.AUTH_CONFIG_FILE_FOLDER, utils.AUTH_CONFIG_FILE)
+        for name in ("config.yaml", "credentials.yaml"):
+            (tmp_path / name).write_text(open(f"tests/client/resources/{name}").read())
+        utils.DEFAULT_CONFIG_FILE_FOLDER = str(tmp_path)
+        utils.AUTH_CONFIG_FILE_FOLDER = str(tmp_path)
+        utils.DEFAULT_CONFIG_FILE = "config.yaml"
+        utils.AUTH_CONFIG_FILE = "credentials.yaml"
+        yield tmp_path
+        utils.DEFAULT_CONFIG_FILE_FOLDER, utils.DEFAULT_CONFIG_FILE, utils.AUTH_CONFIG_FILE_FOLDER, utils.AUTH_CONFIG_FILE = original
+        utils.clear_client_cache()
+
+    def test_warm_call_reuses_client_without_parsing(self):
+        client = instantiate_client(ToolClient)
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
+            assert instantiate_client(ToolClient) is client
+            mock.assert_not_called()
+
+    def test_different_client_classes_are_cached_separately(self):
+        assert instantiate_client(ToolClient) is not instantiate_client(AgentClient)
+
+    def test_modified_config_invalidates_cache(self, config_files):
+        client = instantiate_client(ToolClient)
+        config_path = config_files / "config.yaml"
+        config_path.write_text(config_path.read_text().replace("http://localhost:1234/testing", "http://localhost:4321/testing"))
+        new_client = instantiate_client(ToolClient)
+        assert new_client is not client
+        assert new_client.base_url.startswith("http://localhost:4321/testing")
+
+    def test_config_saved_through_config_invalidates_cache(self, config_files):
+        client = instantiate_client(ToolClient)
+        config = Config(config_file_folder=str(config_files), config_file="config.yaml")
+        config.save({"environments": {"testing": {"wxo_url": "http://localhost:4321/testing"}}})
+
+        new_client = instantiate_client(ToolClient)
+        assert new_client is not client
+        assert new_client.base_url.startswith("http://localhost:4321/testing")
+
+    def test_explicit_url_is_part_of_key(self):
+        client = instantiate_client(ToolClient)
+        assert instantiate_client(ToolClient, url="https://other.example.com") is not client
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+
+from ibm_watsonx_orchestrate.client.tools.tempus_client import TempusClient
+from ibm_watsonx_orchestrate.flow_builder.flows import FlowFactory, CompiledFlow, FlowRun, START, END
+from ibm_watsonx_orchestrate.flow_builder.flows.flow import FlowRunStatus
+
+
+@pytest.fixture(autouse=True)
+def mock_clients():
+    with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.instantiate_client", return_value=MagicMock(spec=TempusClient)) as mock_instantiate_client:
+        yield mock_instantiate_client
+
+
+def _compiled_flow() -> CompiledFlow:
+    flow = FlowFactory.create_flow(name="test_flow")
+    flow.sequence(START, END)
+    compiled_flow = flow.compile()
+    compiled_flow.flow_id = "flow-id"
+    compiled_flow.deployed = True
+    return compiled_flow
+
+
+class TestInvokeMany:
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_and_reports_each_run(self, mock_clients):
+        in_flight = 0
+        peak = 0
+        clients = set()
+
+        async def arun(self, input_data=None, **kwargs):
+            nonlocal in_flight, peak
+            clients.add(id(self.client))
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * input_data["delay"])
+            in_flight -= 1
+            if input_data["delay"] == 0:
+                raise RuntimeError("launch failed")
+            self.id = f"run-{input_data['delay']}"
+            self.status = FlowRunStatus.COMPLETED
+            self.output = input_data
+
+        inputs = [{"delay": delay} for delay in (3, 1, 0, 2, 1)]
+        with patch.object(FlowRun, "_arun", arun):
+            results = [result async for result in _compiled_flow().invoke_many(inputs, max_concurrency=2)]
+
+        assert peak == 2
+        assert len(clients) == 1
+        assert sorted(result.index for result in results) == [0, 1, 2, 3, 4]
+        failed = [result for result in results if result.status == FlowRunStatus.FAILED]
+        assert [result.index for result in failed] == [2]
+        assert failed[0].error == "launch failed"
+        assert all(result.duration >= 0 for result in results)
+        assert results[0].index == 1
+
+    @pytest.mark.asyncio
+    async def test_pulls_inputs_lazily(self):
+        pulled = []
+
+        def inputs():
+            for i in range(10):
+                pulled.append(i)
+                yield {"i": i}
+
+        async def arun(self, input_data=None, **kwargs):
+            self.status = FlowRunStatus.COMPLETED
+
+        with patch.object(FlowRun, "_arun", arun):
+            results = _compiled_flow().invoke_many(inputs(), max_concurrency=3)
+            await results.__anext__()
+            assert len(pulled) == 3
+            await results.aclose()
+
+    @pytest.mark.asyncio
+    async def test_requires_deployed_flow(self):
+        compiled_flow = _compiled_flow()
+        compiled_flow.deployed = False
+
+        with pytest.raises(ValueError):
+            await compiled_flow.invoke_many([{}]).__anext__()
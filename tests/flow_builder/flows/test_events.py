@@ -0,0 +1,265 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+
+from ibm_watsonx_orchestrate.flow_builder.flows import events
+from ibm_watsonx_orchestrate.flow_builder.flows.events import StreamConsumer, StreamDispatcher, get_connection_pool
+from ibm_watsonx_orchestrate.flow_builder.types import FlowEventType
+
+
+def _event(kind: FlowEventType) -> dict:
+    return {b"data": json.dumps({"kind": kind.value}).encode("utf-8")}
+
+
+class FakeRedis:
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.calls = []
+        self.read_args = []
+
+    async def xread(self, streams, block=None, count=None):
+        self.calls.append(dict(streams))
+        self.read_args.append({"block": block, "count": count})
+        if self.batches:
+            batch = self.batches.pop(0)
+            if isinstance(batch, BaseException):
+                raise batch
+            return batch
+        await asyncio.sleep(block / 1000)
+        return []
+
+    async def aclose(self, close_connection_pool=True):
+        pass
+
+
+async def _next_event(subscription):
+    return await asyncio.wait_for(subscription.consume().__anext__(), timeout=1)
+
+
+async def _take_events(consumer, count):
+    taken = []
+    async for event in consumer.consume():
+        taken.append(event)
+        if len(taken) == count:
+            return taken
+
+
+class TestStreamConsumer:
+    @pytest.mark.asyncio
+    async def test_retries_with_capped_exponential_backoff_reset_after_read(self):
+        redis = FakeRedis([
+            RedisConnectionError("down"),
+            RedisTimeoutError("slow"),
+            RedisConnectionError("down"),
+            RedisConnectionError("down"),
+            [(b"tempus:a", [(b"1-0", _event(FlowEventType.ON_FLOW_START))])],
+            RedisConnectionError("down"),
+            [(b"tempus:a", [(b"2-0", _event(FlowEventType.ON_FLOW_END))])],
+        ])
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        consumer = StreamConsumer("a", max_backoff=0.3)
+        with patch.object(consumer, "_get_redis", return_value=redis), patch.object(events.asyncio, "sleep", fake_sleep):
+            taken = await _take_events(consumer, 2)
+
+        assert [event.kind for event in taken] == [FlowEventType.ON_FLOW_START, FlowEventType.ON_FLOW_END]
+        assert delays == pytest.approx([0.1, 0.2, 0.3, 0.3, 0.1])
+        assert consumer.last_processed_id == b"2-0"
+
+    @pytest.mark.asyncio
+    async def test_malformed_events_are_logged_and_skipped(self, caplog):
+        redis = FakeRedis([
+            [(b"tempus:a", [(b"1-0", {b"data": b"not json"}), (b"2-0", {})])],
+            [(b"tempus:a", [(b"3-0", _event(FlowEventType.ON_FLOW_END))])],
+        ])
+        consumer = StreamConsumer("a")
+        with patch.object(consumer, "_get_redis", return_value=redis):
+            taken = await asyncio.wait_for(_take_events(consumer, 1), timeout=1)
+
+        assert taken[0].kind == FlowEventType.ON_FLOW_END
+        assert [call["tempus:a"] for call in redis.calls] == [0, b"2-0"]
+        assert consumer.last_processed_id == b"3-0"
+        assert "Skipping malformed event `b'1-0'`" in caplog.text
+        assert "Skipping malformed event `b'2-0'`" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_events_of_unexpected_shape_are_skipped(self, caplog):
+        redis = FakeRedis([
+            [(b"tempus:a", [
+                (b"1-0", {b"data": b"[1, 2]"}),
+                (b"2-0", {b"data": json.dumps({"kind": FlowEventType.ON_FLOW_START.value, "context": "not a dict"}).encode("utf-8")}),
+                (b"3-0", _event(FlowEventType.ON_FLOW_END)),
+            ])],
+        ])
+        consumer = StreamConsumer("a")
+        with patch.object(consumer, "_get_redis", return_value=redis):
+            taken = await asyncio.wait_for(_take_events(consumer, 1), timeout=1)
+
+        assert taken[0].kind == FlowEventType.ON_FLOW_END
+        assert "Skipping malformed event `b'1-0'`" in caplog.text
+        assert "Skipping malformed event `b'2-0'`" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_passes_count_and_block_to_xread(self):
+        redis = FakeRedis([[(b"tempus:a", [(b"1-0", _event(FlowEventType.ON_FLOW_START))])]])
+        consumer = StreamConsumer("a", batch_count=7, block_ms=250)
+        with patch.object(consumer, "_get_redis", return_value=redis):
+            await _take_events(consumer, 1)
+
+        assert redis.read_args == [{"block": 250, "count": 7}]
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_client_but_not_shared_pool(self):
+        consumer = StreamConsumer("a")
+        client = consumer._get_redis()
+        assert consumer._get_redis() is client
+        assert client.connection_pool is get_connection_pool(consumer.redis_host, consumer.redis_port, consumer.redis_db)
+
+        with patch.object(client, "aclose", AsyncMock()) as aclose:
+            await consumer.aclose()
+
+        aclose.assert_awaited_once_with(close_connection_pool=False)
+        assert consumer.redis is None
+        assert consumer._get_redis() is not client
+
+
+class TestGetConnectionPool:
+    @pytest.mark.asyncio
+    async def test_pool_is_shared_on_the_same_loop(self):
+        pool = get_connection_pool("localhost", "6379", "0")
+
+        assert get_connection_pool("localhost", 6379, 0) is pool
+        assert get_connection_pool("localhost", 6379, 1) is not pool
+        assert StreamConsumer("a")._get_redis().connection_pool is StreamConsumer("b")._get_redis().connection_pool
+
+    def test_pool_is_not_shared_across_loops(self):
+        async def get_pool():
+            return get_connection_pool("localhost", 6379, 0)
+
+        pools = []
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                pools.append(loop.run_until_complete(get_pool()))
+            finally:
+                loop.close()
+
+        assert pools[0] is not pools[1]
+
+
+class TestStreamDispatcher:
+    @pytest.mark.asyncio
+    async def test_reads_all_streams_in_one_call_and_routes_events(self):
+        redis = FakeRedis([
+            [
+                (b"tempus:a", [(b"1-0", _event(FlowEventType.ON_FLOW_START))]),
+                (b"tempus:b", [(b"2-0", {b"data": b"not json"}), (b"3-0", _event(FlowEventType.ON_FLOW_END))]),
+            ],
+        ])
+        async with StreamDispatcher(block_ms=10) as dispatcher:
+            with patch.object(dispatcher, "_get_redis", return_value=redis):
+                subscription_a = dispatcher.subscribe("a")
+                subscription_b = dispatcher.subscribe("b")
+
+                assert (await _next_event(subscription_a)).kind == FlowEventType.ON_FLOW_START
+                assert (await _next_event(subscription_b)).kind == FlowEventType.ON_FLOW_END
+
+                assert redis.calls[0] == {"tempus:a": 0, "tempus:b": 0}
+                assert dispatcher.last_processed_ids == {"tempus:a": b"1-0", "tempus:b": b"3-0"}
+
+    @pytest.mark.asyncio
+    async def test_events_of_unexpected_shape_do_not_stop_dispatch(self):
+        redis = FakeRedis([
+            [(b"tempus:a", [(b"1-0", {b"data": b"\"text\""}), (b"2-0", _event(FlowEventType.ON_FLOW_START))])],
+        ])
+        async with StreamDispatcher(block_ms=10) as dispatcher:
+            with patch.object(dispatcher, "_get_redis", return_value=redis):
+                subscription = dispatcher.subscribe("a")
+
+                assert (await _next_event(subscription)).kind == FlowEventType.ON_FLOW_START
+                assert not dispatcher._task.done()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_streams_are_no_longer_read(self):
+        redis = FakeRedis([])
+        async with StreamDispatcher(block_ms=10) as dispatcher:
+            with patch.object(dispatcher, "_get_redis", return_value=redis):
+                subscription_a = dispatcher.subscribe("a")
+                dispatcher.subscribe("b")
+                await asyncio.sleep(0.02)
+                await subscription_a.aclose()
+                redis.calls.clear()
+                await asyncio.sleep(0.03)
+
+        assert redis.calls and all(call == {"tempus:b": 0} for call in redis.calls)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_subscription_is_rejected(self):
+        async with StreamDispatcher(block_ms=10) as dispatcher:
+            with patch.object(dispatcher, "_get_redis", return_value=FakeRedis([])):
+                dispatcher.subscribe("a")
+                with pytest.raises(ValueError):
+                    dispatcher.subscribe("a")
+
+    @pytest.mark.asyncio
+    async def test_subscribe_restarts_blocked_read(self):
+        class StreamBRedis(FakeRedis):
+            async def xread(self, streams, block=None, count=None):
+                if "tempus:b" in streams and not self.batches:
+                    self.calls.append(dict(streams))
+                    self.batches.append([])
+                    return [(b"tempus:b", [(b"1-0", _event(FlowEventType.ON_FLOW_START))])]
+                return await super().xread(streams, block=block, count=count)
+
+        redis = StreamBRedis([])
+        async with StreamDispatcher(block_ms=60_000) as dispatcher:
+            with patch.object(dispatcher, "_get_redis", return_value=redis):
+                dispatcher.subscribe("a")
+                await asyncio.sleep(0.01)
+                subscription_b = dispatcher.subscribe("b")
+
+                assert (await _next_event(subscription_b)).kind == FlowEventType.ON_FLOW_START
+                assert redis.calls[:2] == [{"tempus:a": 0}, {"tempus:a": 0, "tempus:b": 0}]
+
+    @pytest.mark.asyncio
+    async def test_full_subscription_pauses_its_stream(self):
+        redis = FakeRedis([
+            [(b"tempus:a", [(b"1-0", _event(FlowEventType.ON_FLOW_START)), (b"2-0", _event(FlowEventType.ON_FLOW_START)), (b"3-0", _event(FlowEventType.ON_FLOW_END))])],
+            [(b"tempus:a", [(b"3-0", _event(FlowEventType.ON_FLOW_END))])],
+        ])
+        async with StreamDispatcher(block_ms=10, max_events=2) as dispatcher:
+            with patch.object(dispatcher, "_get_redis", return_value=redis):
+                subscription = dispatcher.subscribe("a")
+                await asyncio.sleep(0.03)
+
+                assert subscription.queue.qsize() == 2
+                assert dispatcher.last_processed_ids == {"tempus:a": b"2-0"}
+                assert redis.calls == [{"tempus:a": 0}]
+
+                taken = await asyncio.wait_for(_take_events(subscription, 3), timeout=1)
+
+        assert [event.kind for event in taken] == [FlowEventType.ON_FLOW_START, FlowEventType.ON_FLOW_START, FlowEventType.ON_FLOW_END]
+        assert redis.calls[1] == {"tempus:a": b"2-0"}
+
+    @pytest.mark.asyncio
+    async def test_error_is_raised_after_full_queue_is_drained(self):
+        redis = FakeRedis([
+            [(b"tempus:a", [(b"1-0", _event(FlowEventType.ON_FLOW_START))])],
+            RuntimeError("boom"),
+        ])
+        dispatcher = StreamDispatcher(block_ms=10, max_events=1)
+        with patch.object(dispatcher, "_get_redis", return_value=redis):
+            subscription = dispatcher.subscribe("a")
+            await asyncio.sleep(0.01)
+            # the queue is full when the read fails, so the error is raised once the queued event is consumed
+            consume = subscription.consume()
+            assert (await asyncio.wait_for(consume.__anext__(), timeout=1)).kind == FlowEventType.ON_FLOW_START
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(consume.__anext__(), timeout=1)
+            await dispatcher.aclose()
@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from pydantic import BaseModel
+
+from ibm_watsonx_orchestrate.flow_builder.flows import FlowFactory, START, END
+from ibm_watsonx_orchestrate.flow_builder.types import JsonSchemaObject, UserFieldKind
+
+
+@pytest.fixture(autouse=True)
+def mock_tool_client():
+    with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.instantiate_client", return_value=MagicMock()):
+        yield
+
+
+def _customer_schema(extra_field: str | None = None) -> JsonSchemaObject:
+    properties = {
+        "name": JsonSchemaObject(type="string"),
+        "address": JsonSchemaObject(type="object", title="Address", properties={"city": JsonSchemaObject(type="string")}),
+    }
+    if extra_field:
+        properties[extra_field] = JsonSchemaObject(type="string")
+    return JsonSchemaObject(type="object", title="Customer", properties=properties)
+
+
+class Item(BaseModel):
+    value: str
+
+
+class TestAddSchema:
+    def test_identical_schemas_are_interned(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+
+        first = flow._add_schema(_customer_schema(), "Customer")
+        with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.copy.deepcopy") as mock_deepcopy:
+            second = flow._add_schema(_customer_schema(), "Customer")
+
+        assert second is first
+        mock_deepcopy.assert_not_called()
+        assert sorted(flow.schemas) == ["Address", "Customer"]
+
+    def test_different_shape_gets_new_title_once(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+
+        flow._add_schema(_customer_schema(), "Customer")
+        variant = flow._add_schema(_customer_schema("email"), "Customer")
+        again = flow._add_schema(_customer_schema("email"), "Customer")
+
+        assert variant.title.startswith("Customer_")
+        assert again is variant
+        assert len([title for title in flow.schemas if title.startswith("Customer")]) == 2
+
+    def test_nested_flow_interns_on_top_flow(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        foreach = flow.foreach(item_schema=Item)
+
+        first = flow._add_schema(_customer_schema(), "Customer")
+        assert foreach._add_schema(_customer_schema(), "Customer") is first
+
+    def test_first_add_of_a_title_does_not_hash(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+
+        with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow._schema_fingerprint") as mock_fingerprint:
+            flow._add_schema(_customer_schema(), "Customer")
+            flow._add_schema(JsonSchemaObject(type="object", properties={"id": JsonSchemaObject(type="string")}), "Order")
+
+        mock_fingerprint.assert_not_called()
+
+    def test_replaced_schema_is_not_returned_for_previous_shape(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+
+        flow._add_schema(_customer_schema())
+        replacement = flow._add_schema(_customer_schema("email"))
+        again = flow._add_schema(_customer_schema())
+
+        assert replacement is not again
+        assert "email" not in again.properties
+        assert flow.schemas["Customer"] is again
+
+    @pytest.mark.filterwarnings("error")
+    def test_user_field_schemas_do_not_warn(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        user_flow = flow.userflow()
+        upload = user_flow.field(direction="input", name="upload", display_name="File upload", kind=UserFieldKind.File)
+        download = user_flow.field(direction="output", name="download", display_name="Download file", kind=UserFieldKind.File)
+        age = user_flow.field(direction="input", name="age", display_name="Age", kind=UserFieldKind.Number, text="Enter Age")
+        user_flow.sequence(START, upload, download, age, END)
+        flow.sequence(START, user_flow, END)
+
+        flow.compile()
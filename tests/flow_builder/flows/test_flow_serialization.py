@@ -0,0 +1,95 @@
+import io
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from pydantic import BaseModel
+
+from ibm_watsonx_orchestrate.flow_builder.flows import FlowFactory, START, END
+from ibm_watsonx_orchestrate.flow_builder.flows.flow import Flow
+from ibm_watsonx_orchestrate.flow_builder.types import ForeachPolicy
+
+
+@pytest.fixture(autouse=True)
+def mock_tool_client():
+    with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.instantiate_client", return_value=MagicMock()):
+        yield
+
+
+class Item(BaseModel):
+    value: str
+
+
+def _build_flow():
+    flow = FlowFactory.create_flow(name="test_flow")
+    foreach = flow.foreach(item_schema=Item)
+    foreach.sequence(START, END)
+    flow.sequence(START, foreach, END)
+    return flow, foreach
+
+
+class TestFlowToJson:
+    def test_every_call_returns_new_fragments(self):
+        flow, _ = _build_flow()
+        flow.compile()
+
+        first = flow.to_json()
+        second = flow.to_json()
+
+        assert first == second
+        assert first["nodes"] is not second["nodes"]
+        assert first["schemas"] is not second["schemas"]
+
+    def test_edit_after_compile_is_serialized(self):
+        flow, foreach = _build_flow()
+        flow.compile()
+        flow.to_json()
+
+        foreach.spec.display_name = "renamed"
+
+        assert flow.to_json()["nodes"][foreach.spec.name]["spec"]["display_name"] == "renamed"
+
+    def test_nested_change_is_serialized(self):
+        flow, foreach = _build_flow()
+        flow.to_json()
+
+        foreach.policy(ForeachPolicy.PARALLEL)
+
+        assert flow.to_json()["nodes"][foreach.spec.name]["spec"]["foreach_policy"] == ForeachPolicy.PARALLEL.name
+
+    def test_reusing_json_serializes_once(self):
+        flow, foreach = _build_flow()
+
+        with flow._reusing_json():
+            first = flow.to_json()
+            with patch.object(Flow, "_nodes_to_json", side_effect=AssertionError("nodes serialized again")), \
+                 patch.object(Flow, "_schemas_to_json", side_effect=AssertionError("schemas serialized again")):
+                second = flow.to_json()
+                # a sub flow shares the cache of its top most flow
+                foreach.to_json()
+
+        assert second == first
+        assert second["nodes"] is first["nodes"]
+        assert flow.to_json()["nodes"] is not first["nodes"]
+
+    @pytest.mark.asyncio
+    async def test_compile_deploy_serializes_once(self):
+        flow, _ = _build_flow()
+
+        with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.import_flow_model", return_value="tool-id") as mock_import, \
+             patch.object(Flow, "_nodes_to_json", autospec=True, side_effect=Flow._nodes_to_json) as mock_nodes_to_json:
+            compiled_flow = await flow.compile_deploy()
+
+        assert compiled_flow.flow_id == "tool-id"
+        assert sum(1 for call in mock_nodes_to_json.call_args_list if call.args[0] is flow) == 1
+        assert mock_import.call_args.args[0]["nodes"] == flow.to_json()["nodes"]
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_write_json_matches_to_json(self, indent):
+        flow, _ = _build_flow()
+        flow.compile()
+        flow.map_output("result", "flow.input.value")
+
+        buffer = io.StringIO()
+        flow.write_json(buffer, indent=indent)
+
+        assert buffer.getvalue() == json.dumps(flow.to_json(), indent=indent)
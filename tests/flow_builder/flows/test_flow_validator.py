@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from ibm_watsonx_orchestrate.flow_builder.flows import FlowFactory, START, END
+from ibm_watsonx_orchestrate.flow_builder.flows.flow import FlowEdge, FlowValidator, FlowValidationKind
+from ibm_watsonx_orchestrate.flow_builder.node import ToolNode
+from ibm_watsonx_orchestrate.flow_builder.types import ToolNodeSpec, SchemaRef, Assignment
+from ibm_watsonx_orchestrate.flow_builder.data_map import DataMap
+
+
+@pytest.fixture(autouse=True)
+def mock_tool_client():
+    with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.instantiate_client", return_value=MagicMock()):
+        yield
+
+
+def _tool_node(flow, name):
+    return flow._add_node(ToolNode(spec=ToolNodeSpec(name=name, tool=name)))
+
+
+def _messages(flow, kind):
+    return [m.message for m in FlowValidator(flow=flow).validate_model() if m.kind == kind]
+
+
+class TestFlowValidator:
+    def test_valid_sequence(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        flow.sequence(START, _tool_node(flow, "a"), _tool_node(flow, "b"), END)
+
+        assert FlowValidator(flow=flow).validate_model() == []
+        assert flow.validate_model()
+
+    def test_missing_end(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        flow.edge(START, _tool_node(flow, "a"))
+
+        assert _messages(flow, FlowValidationKind.ERROR) == ["Flow `test_flow` has no END node."]
+
+    def test_dangling_edge(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        flow.sequence(START, _tool_node(flow, "a"), END)
+        flow.edges.append(FlowEdge(start="a", end="missing"))
+
+        errors = _messages(flow, FlowValidationKind.ERROR)
+        assert errors == ["Edge `a` -> `missing` in flow `test_flow` references unknown node(s): missing."]
+        with pytest.raises(ValueError):
+            flow.validate_model()
+
+    def test_unreachable_node(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        flow.sequence(START, _tool_node(flow, "a"), END)
+        _tool_node(flow, "orphan")
+
+        assert _messages(flow, FlowValidationKind.WARNING) == ["Node `orphan` in flow `test_flow` is not reachable from START."]
+
+    def test_unconditional_cycle(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        a, b = _tool_node(flow, "a"), _tool_node(flow, "b")
+        flow.sequence(START, a, b, END)
+        flow.edge(b, a)
+
+        assert _messages(flow, FlowValidationKind.ERROR) == ["Flow `test_flow` contains a cycle with no exit: a -> b -> a."]
+
+    def test_branch_cycle_and_default(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        a = _tool_node(flow, "a")
+        flow.edge(START, a)
+        branch = flow.branch(evaluator="flow.input.retry")
+        flow.edge(a, branch)
+        branch.case("retry", a).case("done", END)
+
+        assert _messages(flow, FlowValidationKind.ERROR) == []
+        warnings = _messages(flow, FlowValidationKind.WARNING)
+        assert any("has no default case" in w for w in warnings)
+        assert any("conditional cycle" in w for w in warnings)
+
+    def test_unresolved_schema_ref(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        a = _tool_node(flow, "a")
+        a.spec.input_schema = SchemaRef(ref="#/schemas/missing")
+        flow.sequence(START, a, END)
+
+        assert _messages(flow, FlowValidationKind.ERROR) == [
+            "Schema reference `#/schemas/missing` in `a.input_schema` does not resolve to a flow schema."
+        ]
+
+    def test_data_map_target_prefix(self):
+        flow = FlowFactory.create_flow(name="test_flow")
+        a = _tool_node(flow, "a")
+        a.input_map = {"spec": DataMap(maps=[Assignment(target_variable="input.value", value_expression="flow.input.value")])}
+        flow.sequence(START, a, END)
+
+        assert _messages(flow, FlowValidationKind.WARNING) == ["Data map target `input.value` of node `a` should start with `self.input.`."]
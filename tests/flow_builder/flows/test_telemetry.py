@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import patch
+
+from ibm_watsonx_orchestrate.flow_builder.flows.telemetry import FlowRunRecorder, SpanStatus, summarize_timelines
+from ibm_watsonx_orchestrate.flow_builder.types import FlowContext, FlowEvent, FlowEventType, TaskEventType
+
+
+def _event(kind, name=None, error=None) -> FlowEvent:
+    return FlowEvent(kind=kind, context=FlowContext(name=name, task_id=name), error=error)
+
+
+def _record(events) -> FlowRunRecorder:
+    '''Records (timestamp, event) pairs, launching at t=0.'''
+    recorder = FlowRunRecorder()
+    with patch("ibm_watsonx_orchestrate.flow_builder.flows.telemetry.time.time", return_value=0.0):
+        recorder.on_launch("test_flow")
+    recorder.on_started("instance")
+    for timestamp, event in events:
+        with patch("ibm_watsonx_orchestrate.flow_builder.flows.telemetry.time.time", return_value=timestamp):
+            recorder.record(event)
+    return recorder
+
+
+class TestFlowRunRecorder:
+    def test_builds_node_spans(self):
+        recorder = _record([
+            (1.0, _event(FlowEventType.ON_FLOW_START)),
+            (2.0, _event(TaskEventType.ON_TASK_WAIT, "ask_user")),
+            (5.0, _event(TaskEventType.ON_TASK_START, "ask_user")),
+            (6.0, _event(TaskEventType.ON_TASK_END, "ask_user")),
+            (6.5, _event(TaskEventType.ON_TASK_START, "tool")),
+            (7.0, _event(TaskEventType.ON_TASK_ERROR, "tool", error={"message": "boom"})),
+            (8.0, _event(FlowEventType.ON_FLOW_ERROR)),
+        ])
+        timeline = recorder.timeline
+
+        assert timeline.queue_latency == 1.0
+        assert timeline.wall_time == 8.0
+        assert timeline.status == SpanStatus.FAILED
+        assert len(timeline.events) == 7
+
+        ask_user, tool = timeline.spans
+        assert (ask_user.queue_latency, ask_user.duration, ask_user.status) == (3.0, 1.0, SpanStatus.COMPLETED)
+        assert (tool.queue_latency, tool.duration, tool.status) == (0.0, 0.5, SpanStatus.FAILED)
+        assert tool.error == {"message": "boom"}
+
+    def test_repeated_node_gets_a_span_per_execution(self):
+        recorder = _record([
+            (1.0, _event(TaskEventType.ON_TASK_START, "step")),
+            (2.0, _event(TaskEventType.ON_TASK_END, "step")),
+            (3.0, _event(TaskEventType.ON_TASK_START, "step")),
+            (5.0, _event(TaskEventType.ON_TASK_END, "step")),
+        ])
+
+        assert [span.duration for span in recorder.timeline.spans] == [1.0, 2.0]
+
+    def test_exports(self):
+        timeline = _record([
+            (1.0, _event(FlowEventType.ON_FLOW_START)),
+            (1.5, _event(TaskEventType.ON_TASK_START, "step")),
+            (2.0, _event(TaskEventType.ON_TASK_END, "step")),
+            (3.0, _event(FlowEventType.ON_FLOW_END)),
+        ]).timeline
+
+        timeline_json = timeline.to_json()
+        assert timeline_json["wall_time"] == 3.0
+        assert timeline_json["spans"][0]["duration"] == 0.5
+
+        root, step = timeline.to_otel_spans()
+        assert root["parent_span_id"] is None
+        assert step["parent_span_id"] == root["span_id"]
+        assert step["trace_id"] == root["trace_id"] == timeline.trace_id
+        assert (step["start_time_unix_nano"], step["end_time_unix_nano"]) == (1_500_000_000, 2_000_000_000)
+        assert root["status"] == {"code": "OK"}
+
+
+def test_summarize_timelines():
+    timelines = [
+        _record([(0.0, _event(TaskEventType.ON_TASK_START, "step")), (duration, _event(TaskEventType.ON_TASK_END, "step"))]).timeline
+        for duration in (1.0, 2.0, 3.0, 4.0)
+    ]
+
+    summary, = summarize_timelines([timelines[0].to_json(), *timelines[1:]])
+
+    assert (summary.name, summary.count, summary.failed) == ("step", 4, 0)
+    assert (summary.mean, summary.p50, summary.p95, summary.max) == (2.5, 2.0, 4.0, 4.0)
@@ -0,0 +1,126 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from pydantic import BaseModel, Field
+
+from ibm_watsonx_orchestrate.flow_builder.flows import FlowFactory, START, END
+from ibm_watsonx_orchestrate.flow_builder.types import DocClassifierClass
+from ibm_watsonx_orchestrate.flow_builder.utils import import_flow_model, compute_flow_model_hash, FLOW_CONTENT_HASH_KEY
+
+
+class DocClasses(BaseModel):
+    buyer: DocClassifierClass = Field(default=DocClassifierClass(class_name="Buyer"))
+    seller: DocClassifierClass = Field(default=DocClassifierClass(class_name="Seller"))
+
+
+def _compile_doc_classifier_flow():
+    flow = FlowFactory.create_flow(name="doc_classifier_flow")
+    node = flow.docclassifier(name="classify", classes=DocClasses())
+    flow.sequence(START, node, END)
+    with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.instantiate_client", return_value=MagicMock()):
+        return flow.compile().flow.to_json()
+
+
+def _model(description: str = "A flow") -> dict:
+    return {
+        "spec": {"kind": "flow", "name": "test_flow", "description": description},
+        "nodes": {},
+        "edges": [],
+        "schemas": {},
+        "metadata": {"source_kind": "adk/python", "compiled_on": "2025-01-01T00:00:00+00:00"},
+    }
+
+
+@pytest.fixture
+def mock_clients():
+    tool_client = MagicMock()
+    tool_client.get_draft_by_name.return_value = [{"id": "tool-id"}]
+    tempus_client = MagicMock()
+
+    def instantiate_client(client):
+        return tempus_client if client.__name__ == "TempusClient" else tool_client
+
+    with patch("ibm_watsonx_orchestrate.flow_builder.utils.is_local_dev", return_value=True), \
+         patch("ibm_watsonx_orchestrate.flow_builder.utils.instantiate_client", side_effect=instantiate_client):
+        yield tool_client, tempus_client
+
+
+class TestComputeFlowModelHash:
+    def test_ignores_compile_time(self):
+        model = _model()
+        recompiled = _model()
+        recompiled["metadata"]["compiled_on"] = "2025-06-01T00:00:00+00:00"
+
+        assert compute_flow_model_hash(model) == compute_flow_model_hash(recompiled)
+
+    def test_changes_with_content(self):
+        assert compute_flow_model_hash(_model()) != compute_flow_model_hash(_model("Another flow"))
+
+    def test_ignores_key_order(self):
+        model = _model()
+        reordered = json.loads(json.dumps(model, sort_keys=True))
+        reordered["spec"] = dict(reversed(list(reordered["spec"].items())))
+
+        assert compute_flow_model_hash(model) == compute_flow_model_hash(reordered)
+
+    def test_doc_classifier_flow_hash_is_stable_across_compiles(self):
+        first = _compile_doc_classifier_flow()
+        second = _compile_doc_classifier_flow()
+
+        assert json.dumps(first) != json.dumps(second)  # class ids are regenerated on every compile
+        assert first["metadata"][FLOW_CONTENT_HASH_KEY] == second["metadata"][FLOW_CONTENT_HASH_KEY]
+        assert compute_flow_model_hash(first) == compute_flow_model_hash(second)
+
+
+class TestImportFlowModel:
+    @pytest.mark.asyncio
+    async def test_unchanged_flow_is_not_redeployed(self, mock_clients):
+        tool_client, tempus_client = mock_clients
+        deployed = _model()
+        deployed["metadata"][FLOW_CONTENT_HASH_KEY] = compute_flow_model_hash(deployed)
+        tempus_client.get_flow_model.return_value = {"data": deployed}
+
+        assert await import_flow_model(_model()) == "tool-id"
+
+        tempus_client.get_flow_model.assert_called_once_with("tool-id")
+        tool_client.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changed_flow_is_updated(self, mock_clients):
+        tool_client, tempus_client = mock_clients
+        deployed = _model()
+        deployed["metadata"][FLOW_CONTENT_HASH_KEY] = compute_flow_model_hash(deployed)
+        tempus_client.get_flow_model.return_value = {"data": deployed}
+        model = _model("Another flow")
+
+        await import_flow_model(model)
+
+        tool_client.update.assert_called_once()
+        assert model["metadata"][FLOW_CONTENT_HASH_KEY] == compute_flow_model_hash(model)
+
+    @pytest.mark.asyncio
+    async def test_stale_stored_hash_is_recomputed(self, mock_clients):
+        tool_client, tempus_client = mock_clients
+        deployed = _model()
+        deployed["metadata"][FLOW_CONTENT_HASH_KEY] = compute_flow_model_hash(deployed)
+        tempus_client.get_flow_model.return_value = {"data": deployed}
+        # edited after compiling, but still carrying the hash of the deployed flow
+        model = _model("Edited flow")
+        model["metadata"][FLOW_CONTENT_HASH_KEY] = deployed["metadata"][FLOW_CONTENT_HASH_KEY]
+
+        await import_flow_model(model)
+
+        tool_client.update.assert_called_once()
+        assert model["metadata"][FLOW_CONTENT_HASH_KEY] == compute_flow_model_hash(model)
+
+    @pytest.mark.asyncio
+    async def test_force_redeploys(self, mock_clients):
+        tool_client, tempus_client = mock_clients
+        deployed = _model()
+        deployed["metadata"][FLOW_CONTENT_HASH_KEY] = compute_flow_model_hash(deployed)
+        tempus_client.get_flow_model.return_value = {"data": deployed}
+
+        await import_flow_model(_model(), force=True)
+
+        tempus_client.get_flow_model.assert_not_called()
+        tool_client.update.assert_called_once()